@@ -1,5 +1,6 @@
 """Defines collections of data products."""
 import logging
+import os
 import warnings
 
 import matplotlib
@@ -123,6 +124,140 @@ class LightCurveCollection(Collection):
         # Need `join_type='inner'` until AstroPy supports masked Quantities
         return vstack(lcs, join_type='inner', metadata_conflicts='silent')
 
+    def flatten(self, n_jobs=1, return_trend=False, mask=None, **kwargs):
+        """Removes the low frequency trend of all light curves in the collection.
+
+        This method is equivalent to calling
+        `LightCurve.flatten() <lightkurve.lightcurve.LightCurve.flatten>`
+        on every light curve, but the light curves can be processed in
+        parallel.  In that case, the time and flux values of all the light
+        curves are copied into a single block of shared memory from which the
+        worker processes read the data, and into which they write the trends,
+        such that no `LightCurve` objects need to be sent between processes.
+
+        Parameters
+        ----------
+        n_jobs : int
+            Number of worker processes to use.  If 1 (default), the light
+            curves are processed one after the other in the current process.
+            If `None` or -1, one process per CPU core is used.
+        return_trend : bool
+            If `True`, the method will return a tuple of two collections
+            (flattened_lcs, trend_lcs) where trend_lcs contains the removed
+            trends.
+        mask : list of boolean arrays, optional
+            One mask for every light curve, as accepted by the ``mask``
+            parameter of `LightCurve.flatten`.
+        **kwargs : dict
+            Other keyword arguments passed to `LightCurve.flatten`,
+            e.g. ``window_length``.
+
+        Returns
+        -------
+        flatten_lcs : `LightCurveCollection`
+            Collection of flattened light curves.
+        If ``return_trend`` is set to ``True``, this method will also return:
+        trend_lcs : `LightCurveCollection`
+            Collection of the trends that were removed.
+        """
+        from .lightcurve import _flatten_trend, _flatten_trend_shared
+
+        lcs = list(self)
+        if mask is None:
+            mask = [None] * len(lcs)
+        elif len(mask) != len(lcs):
+            raise ValueError("`mask` must contain one mask per light curve "
+                             "({} masks were given for {} light curves)."
+                             "".format(len(mask), len(lcs)))
+        if n_jobs is None or n_jobs < 0:
+            n_jobs = os.cpu_count()
+        times = [np.asarray(lc.time.value, dtype=float) for lc in lcs]
+        fluxes = [np.asarray(lc.flux.value) for lc in lcs]
+
+        if n_jobs == 1 or len(lcs) < 2:
+            trends = [_flatten_trend(time, flux, mask=m, **kwargs)
+                      for time, flux, m in zip(times, fluxes, mask)]
+        else:
+            from multiprocessing import shared_memory
+            import multiprocessing
+            # Lay out the time, flux, and trend arrays of every light curve
+            # in one block, keeping every array aligned to 8 bytes
+            offsets, nbytes = [], 0
+            for flux in fluxes:
+                time_offset = nbytes
+                flux_offset = time_offset + 8 * len(flux)
+                trend_offset = flux_offset + 8 * int(np.ceil(flux.nbytes / 8))
+                nbytes = trend_offset + 8 * len(flux)
+                offsets.append((time_offset, flux_offset, trend_offset))
+            shm = shared_memory.SharedMemory(create=True, size=max(nbytes, 1))
+            try:
+                tasks = []
+                for time, flux, m, (time_offset, flux_offset, trend_offset) \
+                        in zip(times, fluxes, mask, offsets):
+                    np.ndarray(len(time), dtype=float, buffer=shm.buf,
+                               offset=time_offset)[:] = time
+                    np.ndarray(len(flux), dtype=flux.dtype, buffer=shm.buf,
+                               offset=flux_offset)[:] = flux
+                    tasks.append((shm.name, time_offset, flux_offset, trend_offset,
+                                  flux.dtype.str, len(flux), m, kwargs))
+                pool = multiprocessing.Pool(processes=min(n_jobs, len(lcs)))
+                try:
+                    pool.map(_flatten_trend_shared, tasks)
+                finally:
+                    pool.close()
+                    pool.join()
+                trends = [np.array(np.ndarray(len(flux), dtype=float, buffer=shm.buf,
+                                              offset=trend_offset))
+                          for flux, (_, _, trend_offset) in zip(fluxes, offsets)]
+            finally:
+                shm.close()
+                shm.unlink()
+
+        results = [lc._flatten_result(trend, return_trend=return_trend)
+                   for lc, trend in zip(lcs, trends)]
+        if return_trend:
+            return (LightCurveCollection([r[0] for r in results]),
+                    LightCurveCollection([r[1] for r in results]))
+        return LightCurveCollection(results)
+
+    def estimate_cdpp(self, transit_duration=13, savgol_window=101,
+                      savgol_polyorder=2, sigma=5.):
+        """Estimates the CDPP noise metric of all light curves in the collection.
+
+        This method is equivalent to calling
+        `LightCurve.estimate_cdpp() <lightkurve.lightcurve.LightCurve.estimate_cdpp>`
+        on every light curve, but operates directly on the time and flux
+        arrays, such that no intermediate `LightCurve` objects are created.
+
+        Parameters
+        ----------
+        transit_duration : int or list of int, optional
+            The transit duration(s) in units of number of cadences.
+        savgol_window : int, optional
+            Width of Savitsky-Golay filter in cadences (odd number).
+        savgol_polyorder : int, optional
+            Polynomial order of the Savitsky-Golay filter.
+        sigma : float, optional
+            The number of standard deviations to use for clipping outliers.
+
+        Returns
+        -------
+        cdpp : `~astropy.units.Quantity`
+            CDPP noise metric in ppm of every light curve.  If a list of
+            transit durations is passed, the array has the shape
+            (number of light curves, number of durations).
+        """
+        from astropy import units as u
+        from .lightcurve import _estimate_cdpp
+
+        cdpp = [_estimate_cdpp(np.asarray(lc.time.value, dtype=float),
+                               np.asarray(lc.flux.value),
+                               transit_duration=transit_duration,
+                               savgol_window=savgol_window,
+                               savgol_polyorder=savgol_polyorder, sigma=sigma)
+                for lc in self]
+        return u.Quantity(cdpp, u.cds.ppm)
+
     def plot(self, ax=None, offset=0., **kwargs) -> matplotlib.axes.Axes:
         """Plots all light curves in the collection on a single plot.
 
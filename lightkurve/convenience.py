@@ -2,14 +2,17 @@ from __future__ import division, print_function
 
 import numpy as np
 
-from .lightcurve import LightCurve
+from astropy import units as u
+
+from .lightcurve import _estimate_cdpp
 
 
 __all__ = ['estimate_cdpp']
 
 
 def estimate_cdpp(flux, **kwargs):
-    """A convenience function which wraps LightCurve.estimate_cdpp().
+    """A convenience function which computes LightCurve.estimate_cdpp()
+    directly from an array of flux values.
 
     For details on the algorithm used to compute the Combined Differential
     Photometric Precision (CDPP) noise metric, please see the docstring of
@@ -24,7 +27,9 @@ def estimate_cdpp(flux, **kwargs):
 
     Returns
     -------
-    cdpp : float
+    cdpp : float or array of float
         Savitzky-Golay CDPP noise metric in units parts-per-million (ppm).
     """
-    return LightCurve(time=np.arange(len(flux)), flux=flux).estimate_cdpp(**kwargs)
+    flux = np.asarray(u.Quantity(flux).value, dtype=float)
+    return u.Quantity(_estimate_cdpp(np.arange(len(flux), dtype=float), flux, **kwargs),
+                      u.cds.ppm)
@@ -319,7 +319,7 @@ def make_tpf_figure_elements(tpf, tpf_source, pedestal=None, fiducial_frame=None
     fig, stretch_slider : bokeh.plotting.figure.Figure, RangeSlider
     """
     if pedestal is None:
-        pedestal = -np.nanmin(tpf.flux.value) + 1
+        pedestal = -tpf.summary.minimum.value + 1
     if scale == 'linear':
         pedestal = 0
 
@@ -343,7 +343,7 @@ def make_tpf_figure_elements(tpf, tpf_source, pedestal=None, fiducial_frame=None
     fig.xaxis.axis_label = 'Pixel Column Number'
 
 
-    vlo, lo, hi, vhi = np.nanpercentile(tpf.flux.value + pedestal, [0.2, 1, 95, 99.8])
+    vlo, lo, hi, vhi = tpf.summary.percentile([0.2, 1, 95, 99.8]).value + pedestal
     if vmin is not None:
         vlo, lo = vmin, vmin
     if vmax is not None:
@@ -584,7 +584,7 @@ def show_interact_widget(tpf, notebook_url='localhost:8888',
                                                             ylim_func=ylim_func)
 
         # Create the TPF figure and its stretch slider
-        pedestal = -np.nanmin(tpf.flux.value) + 1
+        pedestal = -tpf.summary.minimum.value + 1
         if scale == 'linear':
             pedestal = 0
         fig_tpf, stretch_slider = make_tpf_figure_elements(tpf, tpf_source,
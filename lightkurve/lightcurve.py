@@ -19,19 +19,20 @@ from astropy.io import fits
 from astropy.time import Time, TimeDelta
 from astropy import units as u
 from astropy.units import Quantity
-from astropy.timeseries import TimeSeries, aggregate_downsample
+from astropy.timeseries import TimeSeries, BinnedTimeSeries
 from astropy.table import vstack
 from astropy.utils.decorators import deprecated, deprecated_renamed_argument
-from astropy.utils.exceptions import AstropyUserWarning
 
 from . import PACKAGEDIR, MPLSTYLE
-from .utils import (running_mean, bkjd_to_astropy_time, btjd_to_astropy_time,
+from .utils import (running_mean, running_median, running_biweight,
+    bkjd_to_astropy_time, btjd_to_astropy_time,
     validate_method, _query_solar_system_objects
 )
 from .utils import LightkurveWarning, LightkurveDeprecationWarning
 
 
-__all__ = ['LightCurve', 'KeplerLightCurve', 'TessLightCurve', 'FoldedLightCurve']
+__all__ = ['LightCurve', 'KeplerLightCurve', 'TessLightCurve', 'FoldedLightCurve',
+           'ArrayLightCurve']
 
 log = logging.getLogger(__name__)
 
@@ -489,26 +490,36 @@ class LightCurve(TimeSeries):
         # Need `join_type='inner'` until AstroPy supports masked Quantities
         return vstack((self, *others), join_type='inner', metadata_conflicts='silent')
 
-    def flatten(self, window_length=101, polyorder=2, return_trend=False,
-                break_tolerance=5, niters=3, sigma=3, mask=None, **kwargs):
-        """Removes the low frequency trend using scipy's Savitzky-Golay filter.
+    def flatten(self, window_length=None, polyorder=2, return_trend=False,
+                break_tolerance=5, niters=3, sigma=3, mask=None, method='savgol',
+                **kwargs):
+        """Removes the low frequency trend using a smoothing filter.
 
-        This method wraps `scipy.signal.savgol_filter`.
+        By default, this method uses scipy's Savitzky-Golay filter
+        (`scipy.signal.savgol_filter`).  Alternatively, the trend can be
+        estimated using the median or the biweight location of the flux
+        in a sliding time window (``method='median'`` or ``'biweight'``).
+        These robust filters are less sensitive to outliers and short
+        events such as transits, provided that the window is several times
+        longer than the events.
 
         Parameters
         ----------
-        window_length : int
-            The length of the filter window (i.e. the number of coefficients).
-            ``window_length`` must be a positive odd integer.
+        window_length : int, float, or `~astropy.units.Quantity`
+            If ``method='savgol'``, the length of the filter window (i.e. the
+            number of coefficients), which must be a positive odd integer.
+            Defaults to 101.  Otherwise, the duration of the sliding time
+            window, in days unless a `~astropy.units.Quantity` is passed.
+            Defaults to 0.5 days.
         polyorder : int
             The order of the polynomial used to fit the samples. ``polyorder``
-            must be less than window_length.
+            must be less than window_length.  Only used if ``method='savgol'``.
         return_trend : bool
             If `True`, the method will return a tuple of two elements
             (flattened_lc, trend_lc) where trend_lc is the removed trend.
         break_tolerance : int
             If there are large gaps in time, flatten will split the flux into
-            several sub-lightcurves and apply `savgol_filter` to each
+            several sub-lightcurves and apply the filter to each
             individually. A gap is defined as a period in time larger than
             `break_tolerance` times the median gap.  To disable this feature,
             set `break_tolerance` to None.
@@ -522,8 +533,13 @@ class LightCurve(TimeSeries):
             mask is True will not be used to flatten the data. An interpolated
             result will be provided for these points. Use this mask to remove
             data you want to preserve, e.g. transits.
+        method : str
+            Filter used to estimate the trend: 'savgol' (default), 'median',
+            or 'biweight'.
         **kwargs : dict
-            Dictionary of arguments to be passed to `scipy.signal.savgol_filter`.
+            Dictionary of arguments to be passed to `scipy.signal.savgol_filter`,
+            or to `~lightkurve.utils.running_biweight` (e.g. ``c``) if
+            ``method='biweight'``.
 
         Returns
         -------
@@ -533,54 +549,19 @@ class LightCurve(TimeSeries):
         trend_lc : `LightCurve`
             New light curve object containing the trend that was removed.
         """
-        if mask is None:
-            mask = np.ones(len(self.time), dtype=bool)
-        else:
-            # Deep copy ensures we don't change the original.
-            mask = deepcopy(~mask)
-        # No NaNs
-        mask &= np.isfinite(self.flux)
-        # No outliers
-        mask &= np.nan_to_num(np.abs(self.flux - np.nanmedian(self.flux))) <= (np.nanstd(self.flux) * sigma)
-        for iter in np.arange(0, niters):
-            if break_tolerance is None:
-                break_tolerance = np.nan
-            if polyorder >= window_length:
-                polyorder = window_length - 1
-                log.warning("polyorder must be smaller than window_length, "
-                            "using polyorder={}.".format(polyorder))
-            # Split the lightcurve into segments by finding large gaps in time
-            dt = self.time.value[mask][1:] - self.time.value[mask][0:-1]
-            with warnings.catch_warnings():  # Ignore warnings due to NaNs
-                warnings.simplefilter("ignore", RuntimeWarning)
-                cut = np.where(dt > break_tolerance * np.nanmedian(dt))[0] + 1
-            low = np.append([0], cut)
-            high = np.append(cut, len(self.time[mask]))
-            # Then, apply the savgol_filter to each segment separately
-            trend_signal = Quantity(np.zeros(len(self.time[mask])), unit=self.flux.unit)
-            for l, h in zip(low, high):
-                # Reduce `window_length` and `polyorder` for short segments;
-                # this prevents `savgol_filter` from raising an exception
-                # If the segment is too short, just take the median
-                if np.any([window_length > (h - l), (h - l) < break_tolerance]):
-                    trend_signal[l:h] = np.nanmedian(self.flux[mask][l:h])
-                else:
-                    # Scipy outputs a warning here that is not useful, will be fixed in version 1.2
-                    with warnings.catch_warnings():
-                        warnings.simplefilter('ignore', FutureWarning)
-                        trsig = signal.savgol_filter(x=self.flux.value[mask][l:h],
-                                                                 window_length=window_length,
-                                                                 polyorder=polyorder,
-                                                                 **kwargs)
-                        trend_signal[l:h] = Quantity(trsig, trend_signal.unit)
-            # Ignore outliers; note we add `1e-14` below to avoid detecting
-            # outliers which are merely caused by numerical noise.
-            mask1 = np.nan_to_num(np.abs(self.flux[mask] - trend_signal)) <\
-                    (np.nanstd(self.flux[mask] - trend_signal) * sigma + Quantity(1e-14, self.flux.unit))
-            f = interp1d(self.time.value[mask][mask1], trend_signal[mask1], fill_value='extrapolate')
-            trend_signal = Quantity(f(self.time.value), self.flux.unit)
-            mask[mask] &= mask1
-
+        # The trend is computed on plain arrays; units are only added back
+        # to the results by `_flatten_result`
+        trend_signal = _flatten_trend(self.time.value, self.flux.value, mask=mask,
+                                      window_length=window_length,
+                                      polyorder=polyorder,
+                                      break_tolerance=break_tolerance,
+                                      niters=niters, sigma=sigma, method=method,
+                                      **kwargs)
+        return self._flatten_result(trend_signal, return_trend=return_trend)
+
+    def _flatten_result(self, trend_signal, return_trend=False):
+        """Returns the output of `flatten` given the trend as a plain array."""
+        trend_signal = Quantity(trend_signal, self.flux.unit)
         flatten_lc = self.copy()
         with warnings.catch_warnings():
             # ignore invalid division warnings
@@ -659,36 +640,121 @@ class LightCurve(TimeSeries):
                               'however the light curve time uses BTJD '
                               '(i.e. JD - 2457000).', LightkurveWarning)
 
-        ts = super().fold(period=period, epoch_time=epoch_time,
-                          epoch_phase=epoch_phase, wrap_phase=wrap_phase,
-                          normalize_phase=normalize_phase)
-
-        # The folded time would pass the `TimeSeries` validation check if
-        # `normalize_phase=True`, so creating a `FoldedLightCurve` object
-        # requires the following three-step workaround:
-        # 1. Give the folded light curve a valid time column again
-        with ts._delay_required_column_checks():
-            folded_time = ts.time.copy()
-            ts.remove_column('time')
-            ts.add_column(self.time, name='time', index=0)
-        # 2. Create the folded object
-        lc = FoldedLightCurve(data=ts)
-        # 3. Restore the folded time
+        # The phases are computed as in AstroPy's `TimeSeries.fold()` (see
+        # `_fold_phase`), but the folded light curve is created directly, i.e.
+        # with one copy of the data sorted by phase rather than several copies
+        # of the table.
+        period_sec = period.to_value(u.s)
+        if normalize_phase:
+            epoch_phase_sec = Quantity(epoch_phase, u.one).value * period_sec
+        elif epoch_phase == 0:
+            epoch_phase_sec = 0.
+        else:
+            epoch_phase_sec = Quantity(epoch_phase).to_value(u.s)
+        if wrap_phase is None:
+            wrap_phase_sec = None
+        elif normalize_phase:
+            wrap_phase_sec = Quantity(wrap_phase, u.one).value
+            if wrap_phase_sec < 0 or wrap_phase_sec > 1:
+                raise ValueError('wrap_phase should be between 0 and 1')
+            wrap_phase_sec *= period_sec
+        else:
+            wrap_phase_sec = Quantity(wrap_phase).to_value(u.s)
+            if wrap_phase_sec < 0 or wrap_phase_sec > period_sec:
+                raise ValueError('wrap_phase should be between 0 and the period')
+        reference_time = self.time[0] if epoch_time is None else epoch_time
+        relative_time_sec = _fold_phase((self.time - reference_time).sec, period_sec,
+                                        epoch_phase=epoch_phase_sec,
+                                        wrap_phase=wrap_phase_sec)
+        order = np.argsort(relative_time_sec, kind='stable')
+        folded_time = TimeDelta(relative_time_sec[order] * u.s)
+        if normalize_phase:
+            folded_time = (folded_time / period).decompose()
+
+        # Sorting the columns individually avoids the overhead of slicing the table
+        data = {name: col[order] for name, col in self.columns.items()}
+        lc = FoldedLightCurve(data=data, meta=deepcopy(self.meta), copy=False)
+        # The folded time would not pass the `TimeSeries` validation check if
+        # `normalize_phase=True`, so it is only added after creating the object
         with lc._delay_required_column_checks():
+            time_original = lc['time']
             lc.remove_column('time')
             lc.add_column(folded_time, name='time', index=0)
 
         # Add extra column and meta data specific to FoldedLightCurve
-        lc.add_column(self.time.copy(), name="time_original", index=len(self._required_columns))
+        lc.add_column(time_original, name="time_original", index=len(self._required_columns))
         lc.meta['period'] = period
         lc.meta['epoch_time'] = epoch_time
         lc.meta['epoch_phase'] = epoch_phase
         lc.meta['wrap_phase'] = wrap_phase
         lc.meta['normalize_phase'] = normalize_phase
-        lc.sort('time')
 
         return lc
 
+    def fold_many(self, periods, epoch_times=None, n_bins=None):
+        """Returns the phases of the data points for many periods at once.
+
+        Unlike `fold`, this method does not create a `FoldedLightCurve` for
+        every period, which makes it suitable for folding a light curve on
+        many candidate periods, e.g. to vet the results of a period search.
+        The phases are normalized and wrapped such that they range from
+        -0.5 to 0.5, with ``epoch_time`` at phase 0, i.e. they are identical
+        to the phases obtained using
+        ``fold(period, epoch_time, normalize_phase=True)``, except that they
+        are not sorted.
+
+        Parameters
+        ----------
+        periods : array-like of float or `~astropy.units.Quantity`
+            The periods to use for folding.  If floats are passed we'll
+            assume they are in units of days.
+        epoch_times : `~astropy.time.Time` or array-like, optional
+            The reference epoch of every period, or a single epoch to use for
+            all periods.  Defaults to the first time in the time series.
+        n_bins : int, optional
+            If given, the flux is averaged in ``n_bins`` bins of equal width
+            in phase, rather than returning the phase of every data point.
+
+        Returns
+        -------
+        phase : `numpy.ndarray`
+            Array of shape (n_periods, n_cadences) containing the phase of
+            every data point for every period.
+        If ``n_bins`` is given, this method will instead return:
+        phase : `numpy.ndarray`
+            Array of shape (n_bins,) containing the phase at the center of
+            each phase bin.
+        binned_flux : `~astropy.units.Quantity`
+            Array of shape (n_periods, n_bins) containing the mean flux
+            in every phase bin, or NaN if a bin contains no data.
+        """
+        periods = np.atleast_1d(Quantity(periods, u.day).value)
+        if epoch_times is None:
+            epoch_offsets = np.zeros(1)
+        else:
+            if not isinstance(epoch_times, Time):
+                epoch_times = Time(epoch_times, format=self.time.format,
+                                   scale=self.time.scale)
+            epoch_offsets = np.atleast_1d((epoch_times - self.time[0]).to_value(u.day))
+            if len(epoch_offsets) not in [1, len(periods)]:
+                raise ValueError("`epoch_times` must contain a single epoch or one "
+                                 "epoch per period ({} epochs were given for {} "
+                                 "periods).".format(len(epoch_offsets), len(periods)))
+        time_offsets = (self.time - self.time[0]).to_value(u.day)
+        phase = _fold_phase(time_offsets, periods[:, np.newaxis],
+                            epoch=epoch_offsets[:, np.newaxis])
+        phase /= periods[:, np.newaxis]
+        if n_bins is None:
+            return phase
+
+        bin_indices = np.minimum(((phase + 0.5) * n_bins).astype(int), n_bins - 1)
+        bin_indices += n_bins * np.arange(len(periods))[:, np.newaxis]
+        binner = _Binner(bin_indices.ravel(), len(periods) * n_bins)
+        flux = np.broadcast_to(self.flux.value, phase.shape).ravel()
+        binned_flux = binner.mean(flux).reshape(len(periods), n_bins)
+        bin_centers = (np.arange(n_bins) + 0.5) / n_bins - 0.5
+        return bin_centers, Quantity(binned_flux, self.flux.unit)
+
     def normalize(self, unit='unscaled'):
         """Returns a normalized version of the light curve.
 
@@ -809,15 +875,26 @@ class LightCurve(TimeSeries):
     def fill_gaps(self, method: str = 'gaussian_noise'):
         """Fill in gaps in time.
 
-        By default, the gaps will be filled with random white Gaussian noise
-        distributed according to
+        The light curve is resampled onto a regular time grid, on which the
+        cadences that are missing or have a NaN flux are filled in.
+        By default, the missing flux values are filled with random white
+        Gaussian noise distributed according to
         :math:`\mathcal{N} (\mu=\overline{\mathrm{flux}}, \sigma=\mathrm{CDPP})`.
-        No other methods are supported at this time.
+        Alternatively, they can be filled deterministically by interpolating
+        between the neighbouring cadences.
+
+        The grid is defined by the ``cadenceno`` column if the light curve
+        has one, and by the median time step otherwise.  The missing values
+        of ``flux_err`` are linearly interpolated, the ``quality`` of the new
+        cadences is set to 65536, and all other columns are carried over with
+        NaN (or masked) values in the new cadences.
 
         Parameters
         ----------
-        method : string {'gaussian_noise'}
+        method : string {'gaussian_noise', 'linear', 'nearest'}
             Method to use for gap filling. Fills with Gaussian noise by default.
+            'linear' and 'nearest' use linear and nearest-neighbour
+            interpolation of the flux, respectively.
 
         Returns
         -------
@@ -825,73 +902,75 @@ class LightCurve(TimeSeries):
             A new light curve object in which all NaN values and gaps in time
             have been filled.
         """
-        lc = self.copy().remove_nans()
-        #nlc = lc.copy()
-        newdata = {}
-
-        # Find missing time points
-        # Most precise method, taking into account time variation due to orbit
-        if hasattr(lc, 'cadenceno'):
-            dt = lc.time.value - np.median(np.diff(lc.time.value)) * lc.cadenceno
-            ncad = np.arange(lc.cadenceno[0], lc.cadenceno[-1] + 1, 1)
-            in_original = np.in1d(ncad, lc.cadenceno)
-            ncad = ncad[~in_original]
-            ndt = np.interp(ncad, lc.cadenceno, dt)
-
-            ncad = np.append(ncad, lc.cadenceno)
-            ndt = np.append(ndt, dt)
-            ncad, ndt = ncad[np.argsort(ncad)], ndt[np.argsort(ncad)]
-            ntime = ndt + np.median(np.diff(lc.time.value)) * ncad
-            newdata['cadenceno'] = ncad
-        else:
-            # Less precise method
-            dt = np.nanmedian(lc.time.value[1::] - lc.time.value[:-1:])
-            ntime = [lc.time.value[0]]
-            for t in lc.time.value[1::]:
-                prevtime = ntime[-1]
-                while (t - prevtime) > 1.2*dt:
-                    ntime.append(prevtime + dt)
-                    prevtime = ntime[-1]
-                ntime.append(t)
-            ntime = np.asarray(ntime, float)
-            in_original = np.in1d(ntime, lc.time.value)
-
-        # Fill in time points
-        newdata['time'] = Time(ntime, format=lc.time.format, scale=lc.time.scale)
-        f = np.zeros(len(ntime))
-        f[in_original] = np.copy(lc.flux)
-        fe = np.zeros(len(ntime))
-        fe[in_original] = np.copy(lc.flux_err)
-
-        fe[~in_original] = np.interp(ntime[~in_original], lc.time.value, lc.flux_err)
-        if method == 'gaussian_noise':
-            try:
-                std = lc.estimate_cdpp()*1e-6
-            except:
-                std = lc.flux.std()
-            f[~in_original] = np.random.normal(lc.flux.mean(), std.value, (~in_original).sum())
+        method = validate_method(method, ['gaussian_noise', 'linear', 'nearest'])
+        # Avoid slicing the whole table, which is slow due to its time index
+        finite = np.flatnonzero(~np.isnan(self.flux))
+        time = self.time.value[finite]
+
+        # Find the position of every cadence on a regular grid.
+        # The cadence numbers are the most precise method, because they
+        # account for time variations due to the orbit of the spacecraft.
+        dt = np.nanmedian(np.diff(time))
+        if hasattr(self, 'cadenceno'):
+            slots = np.asarray(self.cadenceno[finite], dtype=int)
+            offset = time - dt * slots
         else:
-            raise NotImplementedError("No such method as {}".format(method))
+            # Round every time step rather than the time since the first
+            # cadence, so that small errors in `dt` do not accumulate
+            slots = np.append(0, np.cumsum(np.round(np.diff(time) / dt))).astype(int)
+            offset = time - dt * slots
+        slots_missing = np.setdiff1d(np.arange(slots[0], slots[-1] + 1), slots)
+        time_missing = np.interp(slots_missing, slots, offset) + dt * slots_missing
+
+        # Interleave the original and missing cadences
+        n_new = len(slots) + len(slots_missing)
+        in_original = np.zeros(n_new, dtype=bool)
+        in_original[np.arange(len(slots)) + np.searchsorted(slots_missing, slots)] = True
+        ntime = np.empty(n_new)
+        ntime[in_original] = time
+        ntime[~in_original] = time_missing
+        # Index of the original cadence used as a placeholder for every new cadence
+        source = finite[np.maximum(np.cumsum(in_original) - 1, 0)]
 
-        newdata['flux'] = f
-        newdata['flux_err'] = fe
-
-        if hasattr(lc, 'quality'):
-            quality = np.zeros(len(ntime), dtype=lc.quality.dtype)
-            quality[in_original] = np.copy(lc.quality)
-            quality[~in_original] += 65536
-            newdata['quality'] = quality
-        """
-        # TODO: add support for other columns
-        for column in lc.columns:
-            if column in ("time", "flux", "flux_err", "quality"):
+        newdata = {}
+        newdata['time'] = Time(ntime, format=self.time.format, scale=self.time.scale)
+        for column in self.columns:
+            if column == 'time':
                 continue
-            old_values = lc[column]
-            new_values = np.empty(len(ntime), dtype=old_values.dtype)
-            new_values[~in_original] = np.nan
-            new_values[in_original] = np.copy(old_values)
-            newdata[column] = new_values
-        """
+            values = self[column][source]
+            if column == 'flux':
+                flux = np.asarray(self.flux.value[finite], dtype=float)
+                if method == 'gaussian_noise':
+                    lc = self.remove_nans()
+                    try:
+                        std = lc.estimate_cdpp()*1e-6
+                    except (ValueError, IndexError):
+                        std = lc.flux.std()
+                    filled = np.random.normal(lc.flux.mean().value, std.value,
+                                              (~in_original).sum())
+                elif method == 'linear':
+                    filled = np.interp(time_missing, time, flux)
+                else:
+                    nearest = np.clip(np.searchsorted(time, time_missing), 1, len(time) - 1)
+                    nearest -= (time_missing - time[nearest - 1]) < (time[nearest] - time_missing)
+                    filled = flux[nearest]
+                values[~in_original] = filled * self.flux.unit
+            elif column == 'flux_err':
+                flux_err = np.asarray(self.flux_err.value[finite], dtype=float)
+                values[~in_original] = (np.interp(time_missing, time, flux_err)
+                                        * self.flux_err.unit)
+            elif column == 'quality':
+                values[~in_original] = 65536
+            elif column == 'cadenceno':
+                values[~in_original] = slots_missing
+            elif isinstance(values, Time):
+                values[~in_original] = np.ma.masked
+            elif np.issubdtype(values.dtype, np.floating):
+                values[~in_original] = np.nan
+            else:
+                values = np.ma.masked_array(values, mask=~in_original)
+            newdata[column] = values
+
         return LightCurve(data=newdata, meta=self.meta)
 
     def remove_outliers(self, sigma=5., sigma_lower=None, sigma_upper=None,
@@ -993,7 +1072,7 @@ class LightCurve(TimeSeries):
                                  warning_type=LightkurveDeprecationWarning,
                                  alternative='time_bin_size')
     def bin(self, time_bin_size=None, time_bin_start=None, n_bins=None,
-            aggregate_func=None, binsize=None):
+            aggregate_func=None, cadence_bin_size=None, binsize=None):
         """Bins a lightcurve in equally-spaced bins in time.
 
         If the original light curve contains flux uncertainties (``flux_err``),
@@ -1001,6 +1080,11 @@ class LightCurve(TimeSeries):
         If no uncertainties are included, the binned curve will return the
         standard deviation of the data.
 
+        The data points are assigned to the bins once, after which every
+        column is combined using vectorized operations.  The default mean
+        and the median (``aggregate_func=np.nanmedian``) are computed for
+        all bins at once; other functions are called once per bin.
+
         Parameters
         ----------
         time_bin_size : `~astropy.units.Quantity`, float
@@ -1014,6 +1098,12 @@ class LightCurve(TimeSeries):
         aggregate_func : callable, optional
             The function to use for combining points in the same bin. Defaults
             to np.nanmean.
+        cadence_bin_size : int, optional
+            The number of consecutive cadences to combine into each bin, as an
+            alternative to ``time_bin_size``.  The last bin may contain fewer
+            cadences.  Each bin spans from the start of the exposure of its
+            first cadence to the end of the exposure of its last cadence,
+            assuming the exposures last for the median time between cadences.
         binsize : int
             DEPRECATED.
 
@@ -1026,44 +1116,74 @@ class LightCurve(TimeSeries):
         if time_bin_size is None and binsize is not None:
             time_bin_size = (self.time[binsize] - self.time[0]).to(u.day)
 
-        if time_bin_size is None:
-            time_bin_size = 0.5*u.day
-        if not isinstance(time_bin_size, Quantity):
-            time_bin_size *= u.day
-        if time_bin_start is None:
-            time_bin_start = self.time[0]
-        if not isinstance(time_bin_start, Time):
-            time_bin_start = Time(time_bin_start, format=self.time.format,
-                                  scale=self.time.scale)
-
-        # Call AstroPy's aggregate_downsample
-        with warnings.catch_warnings():
-            # ignore uninteresting empty slice warnings
-            warnings.simplefilter("ignore", (RuntimeWarning, AstropyUserWarning))
-            ts = aggregate_downsample(self,
-                                      time_bin_size=time_bin_size,
-                                      n_bins=n_bins,
-                                      time_bin_start=time_bin_start,
-                                      aggregate_func=aggregate_func)
-
-            # If `flux_err` is populated, assume the errors combine as the root-mean-square
-            if np.any(np.isfinite(self.flux_err)):
-                rmse_func = lambda x: np.sqrt(np.nansum(x**2))/len(np.atleast_1d(x)) \
-                                    if np.any(np.isfinite(x)) else np.nan
-                ts_err = aggregate_downsample(self,
-                                              time_bin_size=time_bin_size,
-                                              n_bins=n_bins,
-                                              time_bin_start=time_bin_start,
-                                              aggregate_func=rmse_func)
-                ts['flux_err'] = ts_err['flux_err']
-            # If `flux_err` is unavailable, populate `flux_err` as nanstd(flux)
+        if cadence_bin_size is not None:
+            if time_bin_size is not None or time_bin_start is not None or n_bins is not None:
+                raise ValueError("`cadence_bin_size` cannot be combined with "
+                                 "`time_bin_size`, `time_bin_start`, or `n_bins`.")
+            if cadence_bin_size < 1:
+                raise ValueError("`cadence_bin_size` must be a positive integer.")
+            cadence_bin_size = int(cadence_bin_size)
+            bin_indices = np.arange(len(self)) // cadence_bin_size
+            first = np.arange(0, len(self), cadence_bin_size)
+            last = np.minimum(first + cadence_bin_size, len(self)) - 1
+            if len(self) > 1:
+                cadence = np.nanmedian(np.diff(self.time.value)) * u.day
             else:
-                ts_err = aggregate_downsample(self,
-                                              time_bin_size=time_bin_size,
-                                              n_bins=n_bins,
-                                              time_bin_start=time_bin_start,
-                                              aggregate_func=np.nanstd)
-                ts['flux_err'] = ts_err['flux']
+                cadence = 0 * u.day
+            ts = BinnedTimeSeries(time_bin_start=self.time[first] - cadence / 2,
+                                  time_bin_size=(self.time[last] - self.time[first]).to(u.day)
+                                                + cadence)
+        else:
+            if time_bin_size is None:
+                time_bin_size = 0.5*u.day
+            if not isinstance(time_bin_size, Quantity):
+                time_bin_size *= u.day
+            if time_bin_start is None:
+                time_bin_start = self.time[0]
+            if not isinstance(time_bin_start, Time):
+                time_bin_start = Time(time_bin_start, format=self.time.format,
+                                      scale=self.time.scale)
+            if n_bins is None:
+                # An end point on a bin edge closes the last bin (see `_time_bin_indices`)
+                duration = (self.time[-1] - time_bin_start).to_value(u.s)
+                n_bins = int(np.ceil(duration / time_bin_size.to_value(u.s) - 1e-6))
+            ts = BinnedTimeSeries(time_bin_start=time_bin_start,
+                                  time_bin_size=time_bin_size, n_bins=n_bins)
+            # Assign the data points to the bins using their time offsets from
+            # the start, which is much faster than comparing `Time` objects.
+            offset = (self.time - time_bin_start).to_value(u.day)
+            bin_indices = _time_bin_indices(offset, time_bin_size.to_value(u.day),
+                                            n_bins)
+
+        binner = _Binner(bin_indices, len(ts))
+        if aggregate_func is None or aggregate_func is np.nanmean:
+            statistic = 'mean'
+        elif aggregate_func is np.nanmedian:
+            statistic = 'median'
+        else:
+            statistic = aggregate_func
+        for colname in self.colnames:
+            if colname == 'time':
+                continue
+            col = self[colname]
+            if isinstance(col, Quantity):
+                ts[colname] = Quantity(binner.aggregate(col.value, statistic),
+                                       col.unit, copy=False)
+            elif isinstance(col, np.ndarray):
+                # Empty bins are masked, as in `aggregate_downsample`
+                data = np.ma.zeros(len(ts), dtype=col.dtype)
+                data.mask = ~binner.nonempty
+                data[binner.nonempty] = binner.aggregate(col, statistic)[binner.nonempty]
+                ts[colname] = data
+
+        # If `flux_err` is populated, assume the errors combine as the root-mean-square
+        if np.any(np.isfinite(self.flux_err)):
+            ts['flux_err'] = Quantity(binner.rmse(self.flux_err.value),
+                                      self.flux_err.unit, copy=False)
+        # If `flux_err` is unavailable, populate `flux_err` as nanstd(flux)
+        else:
+            ts['flux_err'] = Quantity(binner.std(self.flux.value),
+                                      self.flux.unit, copy=False)
 
         # Prepare a LightCurve object by ensuring there is a time column
         ts._required_columns = []
@@ -1105,11 +1225,12 @@ class LightCurve(TimeSeries):
 
         Parameters
         ----------
-        transit_duration : int, optional
+        transit_duration : int or list of int, optional
             The transit duration in units of number of cadences. This is the
             length of the window used to compute the running mean. The default
             is 13, which corresponds to a 6.5 hour transit in data sampled at
-            30-min cadence.
+            30-min cadence.  If a list is passed, the light curve is detrended
+            only once and the CDPP is returned for every duration.
         savgol_window : int, optional
             Width of Savitsky-Golay filter in cadences (odd number).
             Default value 101 (2.0 days in Kepler Long Cadence mode).
@@ -1122,8 +1243,9 @@ class LightCurve(TimeSeries):
 
         Returns
         -------
-        cdpp : float
-            Savitzky-Golay CDPP noise metric in units parts-per-million (ppm).
+        cdpp : float or array of float
+            Savitzky-Golay CDPP noise metric in units parts-per-million (ppm),
+            for every value of ``transit_duration`` if a list was passed.
 
         Notes
         -----
@@ -1131,18 +1253,11 @@ class LightCurve(TimeSeries):
         Jeff van Cleve but lacks the normalization factor used there:
         svn+ssh://murzim/repo/so/trunk/Develop/jvc/common/compute_SG_noise.m
         """
-        if not isinstance(transit_duration, int):
-            raise ValueError("transit_duration must be an integer in units "
-                             "number of cadences, got {}.".format(transit_duration))
-
-        detrended_lc = self.flatten(window_length=savgol_window,
-                                    polyorder=savgol_polyorder)
-        cleaned_lc = detrended_lc.remove_outliers(sigma=sigma)
-        with warnings.catch_warnings():  # ignore "already normalized" message
-            warnings.filterwarnings("ignore", message=".*already.*")
-            normalized_lc = cleaned_lc.normalize("ppm")
-        mean = running_mean(data=normalized_lc.flux, window_size=transit_duration)
-        return np.std(mean)
+        cdpp = _estimate_cdpp(self.time.value, self.flux.value,
+                              transit_duration=transit_duration,
+                              savgol_window=savgol_window,
+                              savgol_polyorder=savgol_polyorder, sigma=sigma)
+        return Quantity(cdpp, u.cds.ppm)
 
     def query_solar_system_objects(self, cadence_mask='outliers', radius=None,
                                    sigma=3, location=None, cache=True, return_mask=False):
@@ -1861,25 +1976,16 @@ class LightCurve(TimeSeries):
 
     @deprecated_renamed_argument('t0', 'epoch_time', '2.0',
                                  warning_type=LightkurveDeprecationWarning)
-    def plot_river(self, period, epoch_time=None, ax=None, bin_points=1,
-                   minimum_phase=-0.5, maximum_phase=0.5, method='mean',
-                   **kwargs) -> matplotlib.axes.Axes:
-        """Plot the light curve as a river plot.
-
-        A river plot uses colors to represent the light curve values in
-        chronological order, relative to the period of an interesting signal.
-        Each row in the plot represents a full period cycle, and each column
-        represents a fixed phase.  This type of plot is often used to visualize
-        Transit Timing Variations (TTVs) in the light curves of exoplanets, but
-        it can be used to visualize periodic signals of any origin.
+    def to_river_array(self, period, epoch_time=None, bin_points=1,
+                       minimum_phase=-0.5, maximum_phase=0.5, method='mean'):
+        """Returns the values displayed in a river plot as a 2D array.
 
-        All extra keywords supplied are passed on to Matplotlib's
-        `~matplotlib.pyplot.pcolormesh` function.
+        See `plot_river` for a description of river plots.  The data points
+        are assigned to their (cycle, phase bin) cell once, after which the
+        values of all cells are computed at once.
 
         Parameters
         ----------
-        ax : `~matplotlib.axes.Axes`
-            The matplotlib axes object.
         period: float
             Period at which to fold the light curve
         epoch_time : float
@@ -1892,18 +1998,20 @@ class LightCurve(TimeSeries):
             The maximum phase to plot.
         method : str
             The river method. Choose from `'mean'` or `'median'` or `'sigma'`.
-            If `'mean'` or `'median'`, the plot will display the average value in each bin.
-            If `'sigma'`, the plot will display the average in the bin divided by
+            If `'mean'` or `'median'`, the array contains the average value in each bin.
+            If `'sigma'`, the array contains the average in the bin divided by
             the error in each bin, in order to show the data in terms of standard
             deviation.
-        kwargs : dict
-            Dictionary of arguments to be passed on to Matplotlib's
-            `~matplotlib.pyplot.pcolormesh` function.
 
         Returns
         -------
-        ax : `~matplotlib.axes.Axes`
-            The matplotlib axes object.
+        phase_edges : `numpy.ndarray`
+            Array of shape (n_bins + 1,) containing the edges of the phase bins.
+        cycles : `numpy.ndarray`
+            Array of shape (n_cycles,) containing the cycle numbers.
+        river : `numpy.ndarray`
+            Array of shape (n_cycles, n_bins) containing the value of every
+            phase bin in every cycle, or NaN for bins without finite flux values.
         """
         if hasattr(self, 'time_original'):  # folded light curve
             time = self.time_original
@@ -1922,22 +2030,9 @@ class LightCurve(TimeSeries):
             epoch_time = Time(epoch_time, format=time.format, scale=time.scale)
 
         method = validate_method(method, supported_methods=['mean', 'median', 'sigma'])
-        if (bin_points == 1) and (method in ['mean', 'median']):
-            bin_func = lambda y, e: (y[0], e[0])
-        elif (bin_points == 1) and (method in ['sigma']):
-            bin_func = lambda y, e: ((y[0] - 1)/e[0], np.nan)
-        elif method == 'mean':
-            bin_func = lambda y, e: (np.nanmean(y), np.nansum(e**2)**0.5/len(e))
-        elif method == 'median':
-            bin_func = lambda y, e: (np.nanmedian(y), np.nansum(e**2)**0.5/len(e))
-        elif method == 'sigma':
-            bin_func = lambda y, e: ((np.nanmean(y) - 1)/(np.nansum(e**2)**0.5/len(e)), np.nan)
-
         s = np.argsort(time.value)
-        x, y, e = time.value[s], self.flux[s], self.flux_err[s]
-        med = np.nanmedian(self.flux)
-        e /= med
-        y /= med
+        med = np.nanmedian(self.flux.value)
+        x, y, e = time.value[s], self.flux.value[s] / med, self.flux_err.value[s] / med
 
         # Here `ph` is the phase of each time point x
         # cyc is the number of cycles that have occured at each time point x
@@ -1948,37 +2043,95 @@ class LightCurve(TimeSeries):
             warnings.warn('`bin_points` is too high to plot a phase curve, resetting to {}'.format(bin_points),
                           LightkurveWarning)
             n = 2
-        ph = x/period.value % 1
-        cyc = np.asarray((x - x % period.value)/period.value, int)
-        cyc -= np.min(cyc)
-
         phase = (epoch_time.value % period.value) / period.value
         ph = ((x - (phase * period.value)) / period.value) % 1
         cyc = np.asarray((x - ((x - phase * period.value) % period.value))/period.value, int)
         cyc -= np.min(cyc)
         ph[ph > 0.5] -= 1
 
-        ar = np.empty((n, np.max(cyc) + 1))
-        ar[:] = np.nan
         bs = np.linspace(minimum_phase, maximum_phase, n)
         cycs = np.arange(0, np.max(cyc) + 1)
 
-        ph_masks = [(ph > bs[jdx]) & (ph <= bs[jdx+1]) for jdx in range(n-1)]
-        qual_mask = np.isfinite(y)
-        for cyc1 in np.unique(cyc):
-            cyc_mask = cyc == cyc1
-            if not np.any(cyc_mask):
-                continue
-            for jdx, ph_mask in enumerate(ph_masks):
-                if not np.any(cyc_mask & ph_mask & qual_mask):
-                    ar[jdx, cyc1] = np.nan
-                else:
-                    ar[jdx, cyc1] = bin_func(y[cyc_mask & ph_mask],
-                                             e[cyc_mask & ph_mask])[0]
+        # Assign every data point to its cell; points with phases outside of
+        # (bs[0], bs[-1]] are ignored
+        jdx = np.searchsorted(bs, ph, side='left') - 1
+        jdx[(ph <= bs[0]) | (ph > bs[-1])] = -1
+        cells = np.where(jdx >= 0, cyc * (n - 1) + jdx, -1)
+        binner = _Binner(cells, len(cycs) * (n - 1))
+        if bin_points == 1:
+            ar = binner.first(y)
+            if method == 'sigma':
+                ar = (ar - 1) / binner.first(e)
+        elif method == 'median':
+            ar = binner.median(y)
+        else:
+            ar = binner.mean(y)
+            if method == 'sigma':
+                ar = (ar - 1) / binner.rmse(e)
+        # Cells without finite flux values are empty
+        ar[binner.count_finite(y) == 0] = np.nan
 
         # If the method is average we need to denormalize the plot
         if method in ['mean', 'median']:
-            ar *= np.nanmedian(self.flux.value)
+            ar *= med
+
+        return bs, cycs, ar.reshape(len(cycs), n - 1)
+
+    @deprecated_renamed_argument('t0', 'epoch_time', '2.0',
+                                 warning_type=LightkurveDeprecationWarning)
+    def plot_river(self, period, epoch_time=None, ax=None, bin_points=1,
+                   minimum_phase=-0.5, maximum_phase=0.5, method='mean',
+                   **kwargs) -> matplotlib.axes.Axes:
+        """Plot the light curve as a river plot.
+
+        A river plot uses colors to represent the light curve values in
+        chronological order, relative to the period of an interesting signal.
+        Each row in the plot represents a full period cycle, and each column
+        represents a fixed phase.  This type of plot is often used to visualize
+        Transit Timing Variations (TTVs) in the light curves of exoplanets, but
+        it can be used to visualize periodic signals of any origin.
+
+        All extra keywords supplied are passed on to Matplotlib's
+        `~matplotlib.pyplot.pcolormesh` function.
+
+        Parameters
+        ----------
+        ax : `~matplotlib.axes.Axes`
+            The matplotlib axes object.
+        period: float
+            Period at which to fold the light curve
+        epoch_time : float
+            Phase mid point for plotting. Defaults to the first time value.
+        bin_points : int
+            How many points should be in each bin.
+        minimum_phase : float
+            The minimum phase to plot.
+        maximum_phase : float
+            The maximum phase to plot.
+        method : str
+            The river method. Choose from `'mean'` or `'median'` or `'sigma'`.
+            If `'mean'` or `'median'`, the plot will display the average value in each bin.
+            If `'sigma'`, the plot will display the average in the bin divided by
+            the error in each bin, in order to show the data in terms of standard
+            deviation.
+        kwargs : dict
+            Dictionary of arguments to be passed on to Matplotlib's
+            `~matplotlib.pyplot.pcolormesh` function.
+
+        Returns
+        -------
+        ax : `~matplotlib.axes.Axes`
+            The matplotlib axes object.
+        """
+        # `FoldedLightCurve.to_river_array` would pass its own period
+        bs, cycs, river = LightCurve.to_river_array(
+            self, period=period, epoch_time=epoch_time, bin_points=bin_points,
+            minimum_phase=minimum_phase, maximum_phase=maximum_phase, method=method)
+        method = validate_method(method, supported_methods=['mean', 'median', 'sigma'])
+        # `pcolormesh` is given one column per phase bin edge, i.e. the river
+        # is padded with an empty phase bin
+        ar = np.full((len(bs), len(cycs)), np.nan)
+        ar[:-1] = river.T
 
         d = np.max([np.abs(np.nanmedian(ar) - np.nanpercentile(ar, 5)),
                     np.abs(np.nanmedian(ar) - np.nanpercentile(ar, 95))])
@@ -1991,7 +2144,7 @@ class LightCurve(TimeSeries):
 
         with plt.style.context(MPLSTYLE):
             if ax is None:
-                _, ax = plt.subplots(figsize=(12, cyc.max()*0.1))
+                _, ax = plt.subplots(figsize=(12, cycs.max()*0.1))
 
             im = ax.pcolormesh(bs, cycs, ar.T, vmin=vmin, vmax=vmax, cmap=cmap, **kwargs)
             cbar = plt.colorbar(im, ax=ax)
@@ -2014,10 +2167,10 @@ class LightCurve(TimeSeries):
 
             ax.set_xlabel("Phase")
             ax.set_ylabel("Cycle")
-            ax.set_ylim(cyc.max(), 0)
+            ax.set_ylim(cycs.max(), 0)
             ax.set_title(self.meta.get("label"))
-            a = cyc.max() * 0.1 / 12.
-            b = (cyc.max() - cyc.min()) / (bs.max() - bs.min())
+            a = cycs.max() * 0.1 / 12.
+            b = (cycs.max() - cycs.min()) / (bs.max() - bs.min())
             ax.set_aspect(a/b)
         return ax
 
@@ -2212,6 +2365,25 @@ class FoldedLightCurve(LightCurve):
         ax = super(FoldedLightCurve, self).plot_river(period=self.period, epoch_time=self.epoch_time, **kwargs)
         return ax
 
+    def to_river_array(self, **kwargs):
+        """Returns the values displayed in a river plot of the folded light curve.
+
+        See `~LightCurve.to_river_array` for details on the accepted arguments.
+
+        Parameters
+        ----------
+        kwargs : dict
+            Dictionary of arguments to be passed to `~LightCurve.to_river_array`.
+
+        Returns
+        -------
+        phase_edges, cycles, river : `numpy.ndarray`
+            See `~LightCurve.to_river_array`.
+        """
+        return super(FoldedLightCurve, self).to_river_array(period=self.period,
+                                                            epoch_time=self.epoch_time,
+                                                            **kwargs)
+
 
 class KeplerLightCurve(LightCurve):
     """Subclass of :class:`LightCurve <lightkurve.lightcurve.LightCurve>`
@@ -2418,8 +2590,574 @@ class TessLightCurve(LightCurve):
             return hdu
 
 
+class ArrayLightCurve(object):
+    """Lightweight light curve backed by plain NumPy arrays.
+
+    Creating, slicing, and copying a `LightCurve` involves the machinery of
+    AstroPy's `~astropy.timeseries.TimeSeries`, `~astropy.time.Time`, and
+    `~astropy.units.Quantity` classes, which dominates the run time of
+    pipelines that process many light curves.  `ArrayLightCurve` only holds
+    the ``time``, ``flux``, and ``flux_err`` values as `numpy.ndarray`
+    objects, and offers the most common light curve operations on top of
+    them.  It can be converted into a full `LightCurve` using
+    `to_lightcurve` once the AstroPy functionality is needed.
+
+    Like NumPy arrays, indexing an `ArrayLightCurve` with a slice returns
+    a view, i.e. the new light curve shares its data with the original;
+    use `copy` to obtain independent data.
+
+    Parameters
+    ----------
+    time : `~astropy.time.Time` or array-like
+        Time values.  Plain values are interpreted using ``time_format``
+        and ``time_scale``, and must be expressed in days.
+    flux : `~astropy.units.Quantity` or array-like
+        Flux values for every time point.
+    flux_err : `~astropy.units.Quantity` or array-like, optional
+        Uncertainty on each flux data point.  Defaults to NaN.
+    flux_unit : `~astropy.units.Unit` or str, optional
+        Unit of ``flux`` and ``flux_err``, unless ``flux`` is a Quantity.
+    time_format : str, optional
+        Format of the time values, e.g. 'jd' (default), 'btjd', or 'bkjd'.
+    time_scale : str, optional
+        Scale of the time values.  Defaults to 'tdb'.
+    meta : dict, optional
+        Meta data, which is passed on to the `LightCurve` objects created
+        by `to_lightcurve`.
+
+    Examples
+    --------
+    >>> import lightkurve as lk
+    >>> lc = lk.ArrayLightCurve(time=[1, 2, 3, 4], flux=[0.98, 1.02, 1.03, 0.97])
+    >>> lc.bin(time_bin_size=2, time_bin_start=0.5).flux
+    array([1., 1.])
+    >>> lc.to_lightcurve().flux
+    <Quantity [0.98, 1.02, 1.03, 0.97]>
+    """
+    __slots__ = ('time', 'flux', 'flux_err', 'flux_unit',
+                 'time_format', 'time_scale', 'meta')
+
+    # Time formats of which the values are expressed in days
+    _day_formats = ('jd', 'mjd', 'bkjd', 'btjd')
+
+    def __init__(self, time=None, flux=None, flux_err=None, flux_unit=None,
+                 time_format='jd', time_scale='tdb', meta=None):
+        if isinstance(time, Time):
+            time_scale = time.scale
+            if time.format in self._day_formats:
+                time_format = time.format
+                time = time.value
+            else:
+                time_format = 'jd'
+                time = time.jd
+        if isinstance(flux, Quantity):
+            flux_unit = flux.unit
+            flux = flux.value
+        flux = np.asarray(flux)
+        if time is None:
+            time = np.arange(len(flux))
+        if flux_err is None:
+            flux_err = np.full(len(flux), np.nan)
+        elif isinstance(flux_err, Quantity):
+            flux_err = flux_err.to_value(flux_unit)
+        self.time = np.asarray(time, dtype=float)
+        self.flux = flux
+        self.flux_err = np.asarray(flux_err)
+        self.flux_unit = u.Unit(flux_unit) if flux_unit is not None else u.dimensionless_unscaled
+        self.time_format = time_format
+        self.time_scale = time_scale
+        self.meta = {} if meta is None else meta
+
+    def _new(self, time, flux, flux_err, flux_unit=None, meta=None):
+        """Returns a new light curve which shares the attributes of this one."""
+        new = object.__new__(self.__class__)
+        new.time = time
+        new.flux = flux
+        new.flux_err = flux_err
+        new.flux_unit = self.flux_unit if flux_unit is None else flux_unit
+        new.time_format = self.time_format
+        new.time_scale = self.time_scale
+        new.meta = dict(self.meta) if meta is None else meta
+        return new
+
+    def __len__(self):
+        return len(self.time)
+
+    def __getitem__(self, key):
+        """Returns the light curve of the selected cadences.
+
+        Slices yield views of the data, while index arrays and boolean masks
+        yield copies.  An integer selects a light curve of one cadence.
+        """
+        if isinstance(key, (int, np.integer)):
+            # Ensure we always index with a range, such that the values remain arrays
+            key = slice(key, None) if key == -1 else slice(key, key + 1)
+            if len(self.time[key]) == 0:
+                raise IndexError("index out of range for a light curve "
+                                 "of length {}".format(len(self)))
+        return self._new(self.time[key], self.flux[key], self.flux_err[key])
+
+    def __repr__(self):
+        return "{}(length={}, time_format='{}', flux_unit='{}')".format(
+            self.__class__.__name__, len(self), self.time_format, self.flux_unit)
+
+    @classmethod
+    def from_lightcurve(cls, lc):
+        """Creates an `ArrayLightCurve` from the required columns of a `LightCurve`."""
+        return cls(time=lc.time, flux=lc.flux, flux_err=lc.flux_err,
+                   meta=dict(lc.meta))
+
+    def to_lightcurve(self, lc_class=None):
+        """Converts the light curve into a full `LightCurve` object.
+
+        Parameters
+        ----------
+        lc_class : class, optional
+            Subclass of `LightCurve` to instantiate.  Defaults to `LightCurve`.
+
+        Returns
+        -------
+        lc : `LightCurve`
+            A new light curve object containing a copy of the data.
+        """
+        if self.time_format is None:
+            raise ValueError("A folded `ArrayLightCurve` cannot be converted; "
+                             "use `LightCurve.fold` to obtain a `FoldedLightCurve`.")
+        if lc_class is None:
+            lc_class = LightCurve
+        return lc_class(time=Time(self.time, format=self.time_format,
+                                  scale=self.time_scale),
+                        flux=Quantity(self.flux, self.flux_unit),
+                        flux_err=Quantity(self.flux_err, self.flux_unit),
+                        meta=deepcopy(self.meta))
+
+    def copy(self):
+        """Returns a copy of the light curve."""
+        return self._new(self.time.copy(), self.flux.copy(), self.flux_err.copy(),
+                         meta=deepcopy(self.meta))
+
+    def remove_nans(self):
+        """Removes cadences where the flux is NaN.  See `LightCurve.remove_nans`."""
+        return self[~np.isnan(self.flux)]
+
+    def remove_outliers(self, sigma=5., sigma_lower=None, sigma_upper=None,
+                        return_mask=False, **kwargs):
+        """Removes outlier data points using sigma-clipping.
+
+        See `LightCurve.remove_outliers` for details.
+        """
+        with warnings.catch_warnings():  # Ignore warnings due to NaNs or Infs
+            warnings.simplefilter("ignore")
+            outlier_mask = np.ma.getmaskarray(sigma_clip(data=self.flux, sigma=sigma,
+                                                         sigma_lower=sigma_lower,
+                                                         sigma_upper=sigma_upper,
+                                                         **kwargs))
+        if return_mask:
+            return self[~outlier_mask], outlier_mask
+        return self[~outlier_mask]
+
+    def normalize(self, unit='unscaled'):
+        """Divides the flux and its uncertainty by the median flux.
+
+        See `LightCurve.normalize` for details.
+        """
+        unit = validate_method(unit, ['unscaled', 'percent', 'ppt', 'ppm'])
+        if unit == 'ppt':
+            new_unit = u.def_unit(['ppt', 'parts per thousand'], u.Unit(1e-3))
+        else:
+            new_unit = {'unscaled': u.dimensionless_unscaled,
+                        'percent': u.percent, 'ppm': u.cds.ppm}[unit]
+        scale = u.dimensionless_unscaled.to(new_unit) / np.nanmedian(self.flux)
+        meta = dict(self.meta)
+        meta['normalized'] = True
+        return self._new(self.time.copy(), self.flux * scale, self.flux_err * scale,
+                         flux_unit=new_unit, meta=meta)
+
+    def flatten(self, window_length=None, polyorder=2, return_trend=False,
+                break_tolerance=5, niters=3, sigma=3, mask=None, method='savgol',
+                **kwargs):
+        """Removes the low frequency trend using a smoothing filter.
+
+        See `LightCurve.flatten` for details.
+        """
+        trend = _flatten_trend(self.time, self.flux, mask=mask,
+                               window_length=window_length, polyorder=polyorder,
+                               break_tolerance=break_tolerance, niters=niters,
+                               sigma=sigma, method=method, **kwargs)
+        with warnings.catch_warnings():
+            # ignore invalid division warnings
+            warnings.simplefilter("ignore", RuntimeWarning)
+            flatten_lc = self._new(self.time.copy(), self.flux / trend,
+                                   self.flux_err / trend)
+        if return_trend:
+            return flatten_lc, self._new(self.time.copy(), trend, self.flux_err.copy())
+        return flatten_lc
+
+    def fold(self, period, epoch_time=None, epoch_phase=0, wrap_phase=None,
+             normalize_phase=False):
+        """Folds the light curve on a period and epoch.
+
+        See `LightCurve.fold` for details.  ``period``, ``epoch_phase``, and
+        ``wrap_phase`` are expressed in days unless a `~astropy.units.Quantity`
+        is passed, or in units of the period if ``normalize_phase=True``.
+        ``epoch_time`` defaults to the first time.
+
+        Returns
+        -------
+        folded_lightcurve : `ArrayLightCurve`
+            A new light curve sorted by phase, in which ``time`` holds the
+            phase values and ``time_format`` is `None`.  It can be binned
+            in phase using `bin`, but it cannot be passed to `to_lightcurve`.
+        """
+        period = Quantity(period, u.day).value
+        if epoch_time is None:
+            epoch_time = self.time[0]
+        elif isinstance(epoch_time, Time):
+            epoch_time = getattr(epoch_time, self.time_format)
+        if normalize_phase:
+            epoch_phase = Quantity(epoch_phase, u.one).value * period
+            if wrap_phase is not None:
+                wrap_phase = Quantity(wrap_phase, u.one).value * period
+        else:
+            epoch_phase = Quantity(epoch_phase, u.day).value
+            if wrap_phase is not None:
+                wrap_phase = Quantity(wrap_phase, u.day).value
+        if wrap_phase is not None and not 0 <= wrap_phase <= period:
+            raise ValueError('wrap_phase should be between 0 and the period')
+
+        phase = _fold_phase(self.time, period, epoch=epoch_time,
+                            epoch_phase=epoch_phase, wrap_phase=wrap_phase)
+        if normalize_phase:
+            phase /= period
+        order = np.argsort(phase, kind='stable')
+        meta = dict(self.meta)
+        meta.update(period=period, epoch_time=epoch_time,
+                    normalize_phase=normalize_phase)
+        folded = self._new(phase[order], self.flux[order], self.flux_err[order],
+                           meta=meta)
+        folded.time_format = None
+        return folded
+
+    def bin(self, time_bin_size=0.5, time_bin_start=None, n_bins=None,
+            aggregate_func=None):
+        """Bins the light curve in equally-spaced bins in time.
+
+        See `LightCurve.bin` for details.  ``time_bin_size`` is expressed
+        in days unless a `~astropy.units.Quantity` is passed, and
+        ``time_bin_start`` defaults to the first time.  Empty bins are
+        included with NaN values.
+        """
+        time_bin_size = Quantity(time_bin_size, u.day).value
+        if time_bin_start is None:
+            time_bin_start = self.time[0]
+        elif isinstance(time_bin_start, Time):
+            time_bin_start = getattr(time_bin_start, self.time_format)
+        if n_bins is None:
+            n_bins = int(np.ceil((self.time[-1] - time_bin_start) / time_bin_size - 1e-6))
+        edges = time_bin_start + np.arange(n_bins) * time_bin_size
+        bin_indices = _time_bin_indices(self.time - time_bin_start, time_bin_size,
+                                        n_bins)
+
+        binner = _Binner(bin_indices, n_bins)
+        if aggregate_func is None or aggregate_func is np.nanmean:
+            statistic = 'mean'
+        elif aggregate_func is np.nanmedian:
+            statistic = 'median'
+        else:
+            statistic = aggregate_func
+        if np.any(np.isfinite(self.flux_err)):
+            flux_err = binner.rmse(self.flux_err)
+        else:
+            flux_err = binner.std(self.flux)
+        return self._new(edges + time_bin_size / 2., binner.aggregate(self.flux, statistic),
+                         flux_err)
+
+    def estimate_cdpp(self, transit_duration=13, savgol_window=101,
+                      savgol_polyorder=2, sigma=5.):
+        """Estimate the CDPP noise metric using the Savitzky-Golay (SG) method.
+
+        See `LightCurve.estimate_cdpp` for details.
+        """
+        cdpp = _estimate_cdpp(self.time, self.flux, transit_duration=transit_duration,
+                              savgol_window=savgol_window,
+                              savgol_polyorder=savgol_polyorder, sigma=sigma)
+        return Quantity(cdpp, u.cds.ppm)
+
+
 # Helper functions
 
+def _flatten_trend(time, flux, mask=None, window_length=None, polyorder=2,
+                   break_tolerance=5, niters=3, sigma=3, method='savgol', **kwargs):
+    """Returns the trend of a light curve.
+
+    This is the core of `LightCurve.flatten`, which operates on plain
+    `numpy.ndarray` objects to avoid the overhead of `Quantity` and
+    `~astropy.time.Time` objects.  The parameters are identical to those of
+    `LightCurve.flatten`, i.e. ``mask`` flags the data points which should
+    *not* be used to fit the trend.  The trend is evaluated at all values of
+    ``time``, interpolating over the masked data points.
+    """
+    method = validate_method(method, ['savgol', 'median', 'biweight'])
+    if method == 'savgol':
+        if window_length is None:
+            window_length = 101
+    else:
+        if window_length is None:
+            window_length = 0.5
+        window_length = Quantity(window_length, u.day).value
+        running_filter = running_median if method == 'median' else running_biweight
+    if mask is None:
+        mask = np.ones(len(time), dtype=bool)
+    else:
+        # Deep copy ensures we don't change the original.
+        mask = deepcopy(~mask)
+    # No NaNs
+    mask &= np.isfinite(flux)
+    # No outliers
+    mask &= np.nan_to_num(np.abs(flux - np.nanmedian(flux))) <= (np.nanstd(flux) * sigma)
+    if break_tolerance is None:
+        break_tolerance = np.nan
+    if method == 'savgol' and polyorder >= window_length:
+        polyorder = window_length - 1
+        log.warning("polyorder must be smaller than window_length, "
+                    "using polyorder={}.".format(polyorder))
+    for iter in np.arange(0, niters):
+        masked_time = time[mask]
+        masked_flux = flux[mask]
+        # Split the lightcurve into segments by finding large gaps in time
+        dt = masked_time[1:] - masked_time[0:-1]
+        with warnings.catch_warnings():  # Ignore warnings due to NaNs
+            warnings.simplefilter("ignore", RuntimeWarning)
+            cut = np.where(dt > break_tolerance * np.nanmedian(dt))[0] + 1
+        low = np.append([0], cut)
+        high = np.append(cut, len(masked_time))
+        # Then, apply the filter to each segment separately
+        trend_signal = np.zeros(len(masked_time))
+        for l, h in zip(low, high):
+            if method != 'savgol':
+                # The time windows of the running filters adapt to the segment
+                trend_signal[l:h] = running_filter(masked_time[l:h], masked_flux[l:h],
+                                                   window_length, **kwargs)
+                continue
+            # Reduce `window_length` and `polyorder` for short segments;
+            # this prevents `savgol_filter` from raising an exception
+            # If the segment is too short, just take the median
+            if np.any([window_length > (h - l), (h - l) < break_tolerance]):
+                trend_signal[l:h] = np.nanmedian(masked_flux[l:h])
+            else:
+                # Scipy outputs a warning here that is not useful, will be fixed in version 1.2
+                with warnings.catch_warnings():
+                    warnings.simplefilter('ignore', FutureWarning)
+                    trend_signal[l:h] = signal.savgol_filter(x=masked_flux[l:h],
+                                                             window_length=window_length,
+                                                             polyorder=polyorder,
+                                                             **kwargs)
+        # Ignore outliers; note we add `1e-14` below to avoid detecting
+        # outliers which are merely caused by numerical noise.
+        residuals = masked_flux - trend_signal
+        mask1 = np.nan_to_num(np.abs(residuals)) < (np.nanstd(residuals) * sigma + 1e-14)
+        f = interp1d(masked_time[mask1], trend_signal[mask1], fill_value='extrapolate')
+        trend_signal = f(time)
+        mask[mask] &= mask1
+    return trend_signal
+
+
+def _estimate_cdpp(time, flux, transit_duration=13, savgol_window=101,
+                   savgol_polyorder=2, sigma=5.):
+    """Returns the CDPP of a light curve in ppm.
+
+    This is the core of `LightCurve.estimate_cdpp`, which operates on plain
+    `numpy.ndarray` objects.  The light curve is detrended, cleaned, and
+    normalized only once, after which the running means of all the values of
+    ``transit_duration`` are computed from a single cumulative sum
+    (see `~lightkurve.utils.running_mean`).  Returns
+    a float if ``transit_duration`` is an integer, and an array otherwise.
+    """
+    durations = np.atleast_1d(transit_duration)
+    for duration in durations.ravel():
+        if not isinstance(duration, (int, np.integer)):
+            raise ValueError("transit_duration must be an integer in units "
+                             "number of cadences, got {}.".format(duration))
+
+    trend = _flatten_trend(time, flux, window_length=savgol_window,
+                           polyorder=savgol_polyorder)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        detrended = flux / trend
+        outlier_mask = sigma_clip(data=detrended, sigma=sigma).mask
+    cleaned = detrended[~outlier_mask]
+    normalized = cleaned / np.nanmedian(cleaned) * 1e6
+
+    means = running_mean(normalized, durations.ravel())
+    cdpp = np.array([np.std(mean) for mean in means]).reshape(durations.shape)
+    if np.ndim(transit_duration) == 0:
+        return cdpp[0]
+    return cdpp
+
+
+def _time_bin_indices(offset, time_bin_size, n_bins):
+    """Returns the bin of every data point, or -1 for points outside the bins.
+
+    ``offset`` is the time of the data points relative to the start of the
+    first bin, in the unit of ``time_bin_size``.  The bin edges lie at
+    multiples of ``time_bin_size``; points within a millionth of a bin from
+    an edge are considered to lie on the edge, such that rounding errors in
+    the time stamps do not decide their bin.  Points on an edge belong to the
+    next bin, except that the end of the last bin is included in the last
+    bin, as in AstroPy's `aggregate_downsample`.
+    """
+    position = np.asarray(offset, dtype=float) / time_bin_size
+    nearest_edge = np.round(position)
+    on_edge = np.abs(position - nearest_edge) < 1e-6
+    position = np.where(on_edge, nearest_edge, np.floor(position))
+    position[on_edge & (nearest_edge == n_bins)] = n_bins - 1
+    bin_indices = np.full(len(position), -1)
+    inside = (position >= 0) & (position < n_bins)
+    bin_indices[inside] = position[inside]
+    return bin_indices
+
+
+def _fold_phase(time, period, epoch=0., epoch_phase=0., wrap_phase=None):
+    """Returns the time relative to the nearest epoch, wrapped by one period
+    above ``wrap_phase``.
+
+    This is the phase computation of AstroPy's `TimeSeries.fold()`, i.e.
+    ``epoch`` is at relative time ``epoch_phase``, and the relative times lie
+    between ``wrap_phase - period`` and ``wrap_phase`` (which defaults to
+    ``period / 2``).  All arguments are floats or arrays in the same unit of
+    time, which are broadcast against each other; it is shared by
+    `LightCurve.fold`, `LightCurve.fold_many`, and `ArrayLightCurve.fold`.
+    """
+    if wrap_phase is None:
+        wrap_phase = 0.5 * period
+    shift = period - wrap_phase
+    relative_time = time - epoch + (epoch_phase + shift)
+    np.remainder(relative_time, period, out=relative_time)
+    relative_time -= shift
+    return relative_time
+
+
+def _flatten_trend_shared(args):
+    """Computes the trend of a light curve stored in shared memory.
+
+    This is the worker function of `LightCurveCollection.flatten`; ``args``
+    contains the name of the shared memory block, the byte offsets of the
+    time, flux, and trend arrays within the block, the dtype of the flux
+    values, the number of data points, the user mask, and the keyword
+    arguments of `_flatten_trend`.
+    """
+    from multiprocessing import shared_memory
+    name, time_offset, flux_offset, trend_offset, flux_dtype, size, mask, kwargs = args
+    shm = shared_memory.SharedMemory(name=name)
+    time = np.ndarray(size, dtype=float, buffer=shm.buf, offset=time_offset)
+    flux = np.ndarray(size, dtype=flux_dtype, buffer=shm.buf, offset=flux_offset)
+    trend = np.ndarray(size, dtype=float, buffer=shm.buf, offset=trend_offset)
+    trend[:] = _flatten_trend(time, flux, mask=mask, **kwargs)
+    # The views must be released before the block can be closed
+    del time, flux, trend
+    shm.close()
+
+
+class _Binner(object):
+    """Combines the values of the data points which fall in the same bin.
+
+    This is the engine of `LightCurve.bin`.  The bins of the data points
+    are given once, after which the values of any number of columns can be
+    combined using `numpy.bincount`, i.e. without looping over the bins.
+    Empty bins yield NaN values.
+
+    Parameters
+    ----------
+    bin_indices : array of int
+        Index of the bin of every data point, or -1 for data points
+        which do not fall in any bin.
+    n_bins : int
+        The number of bins.
+    """
+    def __init__(self, bin_indices, n_bins):
+        self.keep = bin_indices >= 0
+        self.indices = bin_indices[self.keep]
+        self.n_bins = n_bins
+        self.counts = np.bincount(self.indices, minlength=n_bins)
+        self.nonempty = self.counts > 0
+
+    def _sum(self, values):
+        return np.bincount(self.indices, weights=values, minlength=self.n_bins)
+
+    def _finite(self, values):
+        """Returns the values in the bins with NaNs set to zero, and the NaN mask."""
+        values = np.asarray(values, dtype=float)[self.keep]
+        finite = np.isfinite(values)
+        return np.where(finite, values, 0.), finite
+
+    def aggregate(self, values, statistic='mean'):
+        """Combines the values using 'mean', 'median', or a function."""
+        if statistic == 'mean':
+            return self.mean(values)
+        elif statistic == 'median':
+            return self.median(values)
+        return self.apply(values, statistic)
+
+    def count_finite(self, values):
+        """Returns the number of finite values in each bin."""
+        return self._sum(np.isfinite(np.asarray(values, dtype=float)[self.keep]))
+
+    def first(self, values):
+        """Returns the first value in each bin."""
+        values = np.asarray(values, dtype=float)[self.keep]
+        start = np.cumsum(self.counts) - self.counts
+        result = np.full(self.n_bins, np.nan)
+        result[self.nonempty] = values[np.argsort(self.indices, kind='stable')][start[self.nonempty]]
+        return result
+
+    def mean(self, values):
+        """Returns the mean of the finite values in each bin."""
+        values, finite = self._finite(values)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return self._sum(values) / self._sum(finite)
+
+    def median(self, values):
+        """Returns the median of the finite values in each bin."""
+        values = np.asarray(values, dtype=float)[self.keep]
+        # Sort by bin, then by value, such that NaNs are at the end of each bin
+        sorted_values = values[np.lexsort((values, self.indices))]
+        n_finite = self._sum(np.isfinite(values)).astype(int)
+        start = np.cumsum(self.counts) - self.counts
+        result = np.full(self.n_bins, np.nan)
+        ok = n_finite > 0
+        result[ok] = 0.5 * (sorted_values[start[ok] + (n_finite[ok] - 1) // 2]
+                            + sorted_values[start[ok] + n_finite[ok] // 2])
+        return result
+
+    def apply(self, values, func):
+        """Returns the result of calling ``func`` on the values of each bin."""
+        values = np.asarray(values)[self.keep]
+        sorted_values = values[np.argsort(self.indices, kind='stable')]
+        end = np.cumsum(self.counts)
+        result = np.full(self.n_bins, np.nan)
+        for idx in np.flatnonzero(self.nonempty):
+            result[idx] = func(sorted_values[end[idx] - self.counts[idx]:end[idx]])
+        return result
+
+    def rmse(self, errors):
+        """Returns the root-sum-square of the errors divided by the number
+        of data points in each bin."""
+        errors, finite = self._finite(errors)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            result = np.sqrt(self._sum(errors ** 2)) / self.counts
+        result[self._sum(finite) == 0] = np.nan
+        return result
+
+    def std(self, values):
+        """Returns the standard deviation of the finite values in each bin."""
+        values, finite = self._finite(values)
+        n_finite = self._sum(finite)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = self._sum(values) / n_finite
+            residuals = np.where(finite, values - mean[self.indices], 0.)
+            return np.sqrt(self._sum(residuals ** 2) / n_finite)
+
+
 def _boolean_mask_to_bitmask(aperture_mask):
     """Takes in an aperture_mask and returns a Kepler-style bitmask
 
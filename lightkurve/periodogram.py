@@ -1143,3 +1143,104 @@ class BoxLeastSquaresPeriodogram(Periodogram):
 
     def smooth(self, **kwargs):
         raise NotImplementedError('`smooth` is not implemented for `BoxLeastSquaresPeriodogram`. ')
+
+
+def _batch_amplitude(time, flux, minimum_frequency=None, maximum_frequency=None,
+                     nyquist_factor=1, oversample_factor=5., ls_method=None,
+                     chunksize=2**22):
+    """Computes amplitude spectra for many flux series on one frequency grid.
+
+    This is equivalent to calling
+    ``LombScarglePeriodogram.from_lightcurve(lc, normalization='amplitude')``
+    for every column of ``flux``, except that a single frequency grid (in
+    units of 1/day), derived from ``time``, is shared by all series, and
+    that all series are evaluated at once.  NaN values in ``flux`` are
+    ignored, i.e. each series may have its own gaps.
+
+    The floating-mean Lomb-Scargle power of each series is computed from
+    its weighted sums of :math:`\cos \omega t`, :math:`\sin \omega t`,
+    and their products, as in AstroPy's ``'slow'`` method but without the
+    time shift :math:`\tau`, which would differ between series with
+    different gaps.  This way all the sums are matrix products of the
+    (frequency, time) trigonometric terms with the (time, series) weights,
+    which are evaluated for ``chunksize // n_cadences`` frequencies at a time.
+
+    Parameters
+    ----------
+    time : array-like
+        Time values in days, of shape (n_cadences,).
+    flux : array-like
+        Flux values of shape (n_cadences, n_series).
+    minimum_frequency, maximum_frequency, nyquist_factor, oversample_factor
+        Define the frequency grid, as in
+        `LombScarglePeriodogram.from_lightcurve`.
+    ls_method : str, optional
+        Ignored; accepted for compatibility with the keyword arguments of
+        `LombScarglePeriodogram.from_lightcurve`.  The power is always
+        computed exactly.
+    chunksize : int, optional
+        Maximum number of elements of the (frequency, time) arrays.
+
+    Returns
+    -------
+    frequency : `~astropy.units.Quantity`
+        Frequency grid of shape (n_frequencies,).
+    power : `~numpy.ndarray`
+        Amplitude spectra of shape (n_frequencies, n_series).  Series
+        with fewer than two finite values yield NaNs.
+    """
+    time = np.asarray(time, dtype=float)
+    flux = np.asarray(flux, dtype=float)
+    if flux.ndim == 1:
+        flux = flux[:, np.newaxis]
+    mask = np.isfinite(flux)
+
+    # The frequency grid is defined as in `from_lightcurve`,
+    # using all the cadences for which at least one series has data
+    grid_time = time[mask.any(axis=1)]
+    if oversample_factor is None:
+        oversample_factor = 5.
+    fs = (1. / (grid_time[-1] - grid_time[0])) / oversample_factor
+    if minimum_frequency is None:
+        minimum_frequency = fs
+    if maximum_frequency is None:
+        nyquist = 0.5 * (1. / (np.median(np.diff(grid_time))))
+        maximum_frequency = nyquist * nyquist_factor
+    minimum_frequency = u.Quantity(minimum_frequency, 1/u.day).value
+    maximum_frequency = u.Quantity(maximum_frequency, 1/u.day).value
+    frequency = np.arange(minimum_frequency, maximum_frequency, fs)
+
+    # Uniform weights which sum to one for every series; missing data points
+    # have zero weight.  The power does not depend on the time origin.
+    n_good = mask.sum(axis=0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        w = mask / n_good
+    w[:, n_good == 0] = 0.
+    wy = w * np.where(mask, flux, 0.)
+    weights = np.hstack([w, wy])
+    Y = wy.sum(axis=0)
+    n_series = flux.shape[1]
+    omega = 2 * np.pi * frequency
+    t = time - grid_time[0]
+
+    power = np.empty((len(frequency), n_series))
+    step = max(1, chunksize // max(len(t), 1))
+    for start in range(0, len(frequency), step):
+        omega_t = omega[start:start + step, np.newaxis] * t
+        cos_omega_t, sin_omega_t = np.cos(omega_t), np.sin(omega_t)
+        C, YC = np.split(cos_omega_t.dot(weights), 2, axis=1)
+        S, YS = np.split(sin_omega_t.dot(weights), 2, axis=1)
+        CC = (cos_omega_t * cos_omega_t).dot(w)
+        CS = (cos_omega_t * sin_omega_t).dot(w) - C * S
+        # The weights sum to one, hence sum(w sin^2) = 1 - sum(w cos^2)
+        SS = 1. - CC - S * S
+        CC -= C * C
+        YC -= Y * C
+        YS -= Y * S
+        with np.errstate(invalid='ignore', divide='ignore'):
+            p = (SS * YC * YC + CC * YS * YS - 2 * CS * YC * YS) / (CC * SS - CS * CS)
+        # The 'psd' normalization of `LombScargle` multiplies the power by
+        # N / 2, and the amplitude normalization by 4 / N.
+        power[start:start + step] = np.sqrt(2 * np.clip(p, 0, None))
+    power[:, n_good < 2] = np.nan
+    return u.Quantity(frequency, 1/u.day), power
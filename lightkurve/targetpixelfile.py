@@ -2,6 +2,7 @@
 
 from __future__ import division
 import datetime
+import glob
 import os
 import warnings
 import logging
@@ -16,6 +17,7 @@ from astropy.wcs import WCS
 from astropy.utils.exceptions import AstropyWarning
 from astropy.coordinates import SkyCoord
 from astropy.stats.funcs import median_absolute_deviation as MAD
+from astropy.stats import sigma_clip
 from astropy.utils.decorators import deprecated
 from astropy.time import Time
 from astropy.units import Quantity
@@ -41,24 +43,398 @@ from .io import detect_filetype
 
 
 
-__all__ = ['KeplerTargetPixelFile', 'TessTargetPixelFile']
+__all__ = ['KeplerTargetPixelFile', 'TessTargetPixelFile', 'create_ffi_cube']
 
 
 log = logging.getLogger(__name__)
 
 
+def _select_data(hdulist, cadences=None, columns=None):
+    """Returns a copy of ``hdulist`` restricted to a subset of the data.
+
+    This is a helper function for the ``cadences`` and ``columns``
+    parameters of the `TargetPixelFile` constructor.
+
+    Parameters
+    ----------
+    hdulist : `~astropy.io.fits.HDUList`
+        Target Pixel File.
+    cadences : int, slice, array-like, or None
+        Rows of the data table to retain.  If a slice is passed, the
+        returned table will be a view into ``hdulist``, i.e. no data is read
+        from a memory-mapped file until it is accessed.
+    columns : list of str, or None
+        Names of the image columns to retain (e.g. ``['FLUX', 'FLUX_ERR']``).
+        The ``FLUX`` column and all one-dimensional columns (``TIME``,
+        ``QUALITY``, etc.) are always retained.  The remaining image columns
+        are replaced by empty (zero-width) columns, which preserves the column
+        numbering that the WCS keywords refer to.
+
+    Returns
+    -------
+    hdulist : `~astropy.io.fits.HDUList`
+        Shallow copy of ``hdulist`` with a new data table extension.
+    """
+    data = hdulist[1].data
+    if cadences is not None:
+        if isinstance(cadences, (int, np.integer)):
+            # Ensure we get a `FITS_rec` rather than a `FITS_record`
+            cadences = [cadences]
+        data = data[cadences]
+
+    with warnings.catch_warnings():
+        # Ignore warnings about empty fields
+        warnings.simplefilter('ignore', UserWarning)
+        if columns is None:
+            table = BinTableHDU(data=data, header=hdulist[1].header)
+        else:
+            columns = ['FLUX'] + [col.upper() for col in columns]
+            cols = []
+            for col in hdulist[1].columns:
+                if col.format.repeat > 1 and col.name not in columns:
+                    cols.append(fits.Column(name=col.name, unit=col.unit,
+                                            format='0' + col.format.format))
+                else:
+                    cols.append(fits.Column(name=col.name, format=col.format,
+                                            unit=col.unit, dim=col.dim,
+                                            disp=col.disp, null=col.null,
+                                            array=data[col.name]))
+            table = BinTableHDU.from_columns(cols, header=hdulist[1].header)
+
+    # `HDUList.copy()` returns a shallow copy, i.e. the other extensions
+    # are not duplicated.
+    copy = hdulist.copy()
+    copy[1] = table
+    return copy
+
+
+def _open_image(img, extension):
+    """Returns the image HDU of an image passed to `from_fits_images`.
+
+    Returns a tuple ``(hdu, hdulist)``, where ``hdulist`` is the file that
+    was opened to obtain ``hdu`` (which the caller should close), or `None`
+    if ``img`` was already an HDU or HDUList object.
+    """
+    if isinstance(img, fits.ImageHDU):
+        return img, None
+    elif isinstance(img, fits.HDUList):
+        return img[extension], None
+    hdulist = fits.open(img)
+    return hdulist[extension], hdulist
+
+
+def _read_cutout_frame(args):
+    """Returns the cutouts and the header of a single `from_fits_images` frame.
+
+    Each image of the frame is opened once, and the cutouts of all
+    requested regions are taken from it.  This function is defined at the
+    module level such that it can be distributed across processes by
+    Python's `multiprocessing` module.
+
+    Returns
+    -------
+    cutouts : list
+        For each region, a list containing a cutout of each image.
+    header : `~astropy.io.fits.Header`
+        Header of the flux image.
+    pos_corr : `~numpy.ndarray`
+        Array of shape (n_regions, 2) containing the column and row shift of
+        each position compared to the reference WCS.
+    """
+    images, extension, radec, pixel_ref, regions = args
+    cutouts = [[] for _ in regions]
+    header = None
+    for img in images:
+        if img is None:
+            for region_cutouts in cutouts:
+                region_cutouts.append(None)
+            continue
+        hdu, hdulist = _open_image(img, extension)
+        if header is None:  # Use the header of the flux image for each frame
+            header = hdu.header.copy()
+        if hdulist is None or isinstance(hdu, fits.CompImageHDU) or len(regions) > 1:
+            # Many cutouts are taken from the (memory-mapped) image at once
+            image = hdu.data
+        else:
+            # `section` reads only the pixels of a single cutout from the file
+            image = hdu.section
+        for region_cutouts, (slices_original, slices_cutout, shape) in zip(cutouts, regions):
+            data = image[slices_original]
+            if data.shape != shape:
+                # The cutout extends beyond the image edge; pad with NaNs
+                # in the same way as `Cutout2D(mode='partial')`.
+                padded = np.full(shape, np.nan, dtype=data.dtype)
+                padded[slices_cutout] = data
+                data = padded
+            region_cutouts.append(np.array(data))
+        if hdulist is not None:
+            hdulist.close()
+
+    # Get positional shift of the image compared to the reference WCS
+    pos_corr = WCS(header).all_world2pix(radec, 0) - pixel_ref
+    return cutouts, header, pos_corr
+
+
+def _get_primary_keywords(header, hdu0_keywords):
+    """Returns the keywords of the primary extension of a cutout TPF.
+
+    The basic mission keywords are carried over from the image ``header``
+    on top of the user-provided ``hdu0_keywords``.
+    """
+    basic_keywords = ['MISSION', 'TELESCOP', 'INSTRUME', 'QUARTER',
+                      'CAMPAIGN', 'CHANNEL', 'MODULE', 'OUTPUT',
+                      'CAMERA', 'CCD', 'SECTOR']
+    carry_keywords = {}
+
+    # Get some basic keywords
+    for kw in basic_keywords:
+        if kw in header:
+            if not isinstance(header[kw], Undefined):
+                carry_keywords[kw] = header[kw]
+    if ('MISSION' not in carry_keywords) and ('TELESCOP' in carry_keywords):
+        carry_keywords['MISSION'] = carry_keywords['TELESCOP']
+
+    allkeys = hdu0_keywords.copy()
+    allkeys.update(carry_keywords)
+    return allkeys
+
+
+def _get_cutout_ext_info(wcs, size, column, row, keywords):
+    """Returns the data table keywords of a cutout TPF.
+
+    Parameters
+    ----------
+    wcs : `~astropy.wcs.WCS`
+        WCS of the cutout.
+    size : (int, int)
+        Dimensions of the cutout.
+    column, row : float, float
+        Pixel position of the target in the image the cutout was taken from.
+    keywords : dict or `~astropy.io.fits.Header`
+        Keywords of the image, which must include ``CRVAL1P`` and ``CRVAL2P``.
+    """
+    ext_info = {}
+    ext_info['TFORM4'] = '{}J'.format(size[0] * size[1])
+    ext_info['TDIM4'] = '({},{})'.format(size[0], size[1])
+    ext_info.update(wcs.to_header())
+
+    # TPF contains multiple data columns that require WCS
+    for m in [4, 5, 6, 7, 8, 9]:
+        if m > 4:
+            ext_info["TFORM{}".format(m)] = '{}E'.format(size[0] * size[1])
+            ext_info['TDIM{}'.format(m)] = '({},{})'.format(size[0], size[1])
+        # Compute the distance from the star to the TPF lower left corner
+        # That is approximately half the TPF size, with an adjustment factor if the star's pixel
+        #    position gets rounded up or not.
+        # The first int is there so that even sizes always round to one less than half of their value
+
+        half_tpfsize_col = int((size[0] - 1) / 2.) + (int(round(column)) - int(column)) * ((size[0] + 1) % 2)
+        half_tpfsize_row = int((size[1] - 1) / 2.) + (int(round(row)) - int(row)) * ((size[1] + 1) % 2)
+
+        ext_info['1CRV{}P'.format(m)] = int(round(column)) - half_tpfsize_col + keywords['CRVAL1P'] - 1
+        ext_info['2CRV{}P'.format(m)] = int(round(row)) - half_tpfsize_row + keywords['CRVAL2P'] - 1
+    return ext_info
+
+
+def _nanpercentile_rows(values, q):
+    """Returns the ``q``-th percentile of every row of a 2D array, ignoring NaNs.
+
+    This is equivalent to ``np.nanpercentile(values, q, axis=1)``, but it
+    selects the required order statistics using `np.partition` rather than
+    sorting the rows, and it processes all the rows which contain the same
+    number of NaNs in a single vectorized call.
+    """
+    values = np.asarray(values)
+    result = np.full(values.shape[0], np.nan)
+    n_good = values.shape[1] - np.isnan(values).sum(axis=1)
+    for n in np.unique(n_good[n_good > 0]):
+        rows = n_good == n
+        # Linear interpolation between the two closest ranks, as in numpy
+        pos = (n - 1) * q / 100.
+        lo = int(pos)
+        hi = min(lo + 1, n - 1)
+        # `np.partition` sorts NaNs to the end of each row
+        part = np.partition(values if rows.all() else values[rows], [lo, hi], axis=1)
+        result[rows] = part[:, lo] + (part[:, hi] - part[:, lo]) * (pos - lo)
+    return result
+
+
+def _sigma_clipped_mean_rows(values, sigma=3., maxiters=5):
+    """Returns the sigma-clipped mean of every row of a 2D array, ignoring NaNs.
+
+    Values which deviate from the median of their row by more than ``sigma``
+    times the standard deviation are iteratively rejected, as in
+    `astropy.stats.sigma_clipped_stats`.
+    """
+    values = np.array(values, dtype=float)
+    # Only the rows which had values rejected in the previous iteration
+    # need to be clipped again
+    active = np.arange(values.shape[0])
+    for _ in range(maxiters):
+        subset = values[active]
+        center = _nanpercentile_rows(subset, 50)[:, np.newaxis]
+        std = np.nanstd(subset, axis=1)[:, np.newaxis]
+        with np.errstate(invalid='ignore'):
+            clipped = np.abs(subset - center) > sigma * std
+        changed = clipped.any(axis=1)
+        if not changed.any():
+            break
+        subset[clipped] = np.nan
+        values[active] = subset
+        active = active[changed]
+    return np.nanmean(values, axis=1)
+
+
+def _biweight_location_rows(values, c=6.):
+    """Returns the biweight location of every row of a 2D array, ignoring NaNs.
+
+    This is equivalent to ``astropy.stats.biweight_location(values, c=c,
+    axis=1, ignore_nan=True)``, except that the medians are computed using
+    `_nanpercentile_rows`.
+    """
+    values = np.asarray(values, dtype=float)
+    M = _nanpercentile_rows(values, 50)
+    d = values - M[:, np.newaxis]
+    mad = _nanpercentile_rows(np.abs(d), 50)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        u = d / (c * mad[:, np.newaxis])
+        mask = np.abs(u) >= 1
+        u = (1 - u ** 2) ** 2
+        u[mask] = 0
+        value = M + np.nansum(d * u, axis=1) / np.nansum(u, axis=1)
+    # If mad == 0, i.e. the data are (mostly) constant, return the median
+    return np.where(mad == 0, M, value)
+
+
+def _nansum_dot(values, weights):
+    """Returns ``np.nansum`` of the values selected by every column of ``weights``.
+
+    ``values`` has shape (n_rows, n_pixels) and ``weights`` contains zeros
+    and ones with shape (n_pixels, n_masks).  Non-finite values are zeroed
+    before the matrix product, such that an infinite value outside a mask
+    does not turn its result into NaN, and infinite values within a mask
+    are propagated as ``np.nansum`` would.  Also returns the zeroed values.
+    """
+    values = np.asarray(values, dtype=float)
+    finite_values = np.where(np.isfinite(values), values, 0.)
+    result = finite_values.dot(weights)
+    posinf = (values == np.inf).dot(weights) > 0
+    neginf = (values == -np.inf).dot(weights) > 0
+    result[posinf] = np.inf
+    result[neginf] = -np.inf
+    result[posinf & neginf] = np.nan
+    return result, finite_values
+
+
+class TargetPixelFileSummary(object):
+    """Summary statistics of the pixel data of a `TargetPixelFile`.
+
+    The statistics are computed lazily over the good-quality cadences
+    (i.e. those selected by ``tpf.quality_mask``) when they are first
+    accessed, and are cached thereafter.  You should obtain this object via
+    the `TargetPixelFile.summary` property, which ensures that all methods
+    which need e.g. the median image of a pixel file share one computation.
+    The summary is discarded together with the other cached data when the
+    quality mask or the data of the pixel file are changed
+    (see `TargetPixelFile.clear_cache`).
+
+    Parameters
+    ----------
+    tpf : `TargetPixelFile` object
+        The pixel file to summarize.
+    """
+    def __init__(self, tpf):
+        self._tpf = tpf
+        self._cache = {}
+
+    def _get_cached(self, key, func):
+        """Returns ``func()``, caching the result under ``key``."""
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+        with warnings.catch_warnings():
+            # Ignore warnings due to pixels which are NaN in all cadences
+            warnings.simplefilter('ignore', RuntimeWarning)
+            value = func()
+        if isinstance(value, np.ndarray):
+            value.flags.writeable = False
+        self._cache[key] = value
+        return value
+
+    @property
+    def median_image(self) -> Quantity:
+        """Median flux of every pixel across the cadences, ignoring NaNs."""
+        return self._get_cached('median_image',
+                                lambda: np.nanmedian(self._tpf.flux, axis=0))
+
+    @property
+    def mad_image(self) -> Quantity:
+        """Median absolute deviation of the flux of every pixel across the
+        cadences, ignoring NaNs."""
+        return self._get_cached('mad_image',
+                                lambda: np.nanmedian(np.abs(self._tpf.flux - self.median_image),
+                                                     axis=0))
+
+    @property
+    def mean_image(self) -> Quantity:
+        """Mean flux of every pixel across the cadences, ignoring NaNs."""
+        return self._get_cached('mean_image',
+                                lambda: np.nanmean(self._tpf.flux, axis=0))
+
+    @property
+    def minimum(self) -> Quantity:
+        """Minimum flux value of all pixels and cadences, ignoring NaNs."""
+        return self._get_cached('minimum', lambda: np.nanmin(self._tpf.flux))
+
+    def percentile_image(self, q) -> Quantity:
+        """Returns the ``q``-th percentile(s) of the flux of every pixel
+        across the cadences, ignoring NaNs.
+
+        Parameters
+        ----------
+        q : float or array-like of floats
+            Percentile(s) to compute, in the range [0, 100].
+
+        Returns
+        -------
+        image : `~astropy.units.Quantity`
+            Image of shape (n_rows, n_cols), or (len(q), n_rows, n_cols)
+            if ``q`` is a sequence.
+        """
+        key = ('percentile_image', np.ndim(q)) + tuple(np.ravel(q).tolist())
+        return self._get_cached(key,
+                                lambda: np.nanpercentile(self._tpf.flux, q, axis=0))
+
+    def percentile(self, q) -> Quantity:
+        """Returns the ``q``-th percentile(s) of the flux values of all pixels
+        and cadences, ignoring NaNs.
+
+        Parameters
+        ----------
+        q : float or array-like of floats
+            Percentile(s) to compute, in the range [0, 100].
+        """
+        key = ('percentile', np.ndim(q)) + tuple(np.ravel(q).tolist())
+        return self._get_cached(key, lambda: np.nanpercentile(self._tpf.flux, q))
+
+
 class TargetPixelFile(object):
     """Abstract class representing FITS files which contain time series imaging data.
 
     You should probably not be using this abstract class directly;
     see `KeplerTargetPixelFile` and `TessTargetPixelFile` instead.
     """
-    def __init__(self, path, quality_bitmask='default', targetid=None, **kwargs):
+    def __init__(self, path, quality_bitmask='default', targetid=None,
+                 cadences=None, columns=None, **kwargs):
         self.path = path
         if isinstance(path, fits.HDUList):
-            self.hdu = path
+            hdu = path
         else:
-            self.hdu = fits.open(self.path, **kwargs)
+            hdu = fits.open(self.path, **kwargs)
+        if cadences is not None or columns is not None:
+            hdu = _select_data(hdu, cadences=cadences, columns=columns)
+        self.hdu = hdu
         self.quality_bitmask = quality_bitmask
         self.targetid = targetid
 
@@ -70,59 +446,137 @@ class TargetPixelFile(object):
     def __getitem__(self, key):
         """Implements indexing and slicing.
 
-        Note: the implementation below cannot be be simplified using
-            `copy[1].data = copy[1].data[self.quality_mask][key]`
-        due to the complicated behavior of AstroPy's `FITS_rec`.
+        Indexing with an integer, or with a slice which selects consecutive
+        rows of the data table (i.e. which does not skip bad-quality
+        cadences), returns a view, i.e. the new object shares its data with
+        this object and no data is copied until it is accessed.  Other keys
+        (e.g. boolean masks) yield a copy.
         """
         # Step 1: determine the indexes of the data to return.
         # We start by determining the indexes of the good-quality cadences.
         quality_idx = np.where(self.quality_mask)[0]
         # Then we apply the index or slice to the good-quality indexes.
-        if isinstance(key, int):
+        if isinstance(key, (int, np.integer)):
             # Ensure we always have a range; this is necessary to ensure
             # that we always ge a  `FITS_rec` instead of a `FITS_record` below.
             if key == -1:
-                selected_idx = quality_idx[key:]
+                key = slice(key, None)
             else:
-                selected_idx = quality_idx[key:key+1]
-        else:
-            selected_idx = quality_idx[key]
-
-        # Step 2: use the indexes to create a new copy of the data.
-        with warnings.catch_warnings():
-            # Ignore warnings about empty fields
-            warnings.simplefilter('ignore', UserWarning)
-            # AstroPy added `HDUList.copy()` in v3.1, allowing us to avoid manually
-            # copying the HDUs, which brought along unexpected memory leaks.
-            copy = self.hdu.copy()
-            copy[1] = BinTableHDU(data=self.hdu[1].data[selected_idx], header=self.hdu[1].header)
-        return self.__class__(copy, quality_bitmask=self.quality_bitmask, targetid=self.targetid)
+                key = slice(key, key+1)
+        selected_idx = quality_idx[key]
+
+        # Step 2: use the indexes to create a view or a copy of the data.
+        if (isinstance(key, slice) and len(selected_idx) > 0
+                and selected_idx[-1] - selected_idx[0] + 1 == len(selected_idx)):
+            # The selected cadences form a contiguous range of rows without
+            # bad-quality rows, so we can take a (zero-copy) slice of the
+            # data table which contains exactly the selected rows.
+            span = slice(selected_idx[0], selected_idx[-1] + 1)
+            tpf = self.__class__(_select_data(self._hdu, cadences=span),
+                                 quality_bitmask=self.quality_bitmask,
+                                 targetid=self.targetid)
+            # The view can only be used if `quality_bitmask` reproduces the
+            # selection, i.e. if `self.quality_mask` was not modified by hand.
+            if np.array_equal(tpf.quality_mask, self.quality_mask[span]):
+                tpf._pending_columns = {column: values[span] for column, values
+                                        in self._pending_columns.items()}
+                # Ensure in-place arithmetic does not modify the shared data
+                tpf._shares_data = self._shares_data = True
+                self._owned_columns = set()
+                return tpf
+        hdu = _select_data(self._hdu, cadences=selected_idx)
+        # The selected rows were copied, so the modified columns can be
+        # written into the new data table
+        for column, values in self._pending_columns.items():
+            hdu[1].data[column] = values[selected_idx]
+        return self.__class__(hdu, quality_bitmask=self.quality_bitmask, targetid=self.targetid)
 
     def __len__(self):
         return len(self.time)
 
-    def __add__(self, other):
+    def iter_chunks(self, n_cadences):
+        """Iterates over consecutive chunks of cadences.
+
+        Each chunk is a view of (at most) ``n_cadences`` good-quality cadences
+        of this object (see `__getitem__`), hence the data of a chunk is only
+        read from a memory-mapped file when it is accessed.  This enables
+        long observations to be processed with a fixed amount of memory.
+
+        Parameters
+        ----------
+        n_cadences : int
+            Number of cadences in each chunk.
+
+        Yields
+        ------
+        tpf : `TargetPixelFile`
+            New object containing the cadences of the chunk.
+        """
+        if n_cadences < 1:
+            raise ValueError("`n_cadences` must be a positive integer.")
+        for start in range(0, len(self), n_cadences):
+            yield self[start:start + n_cadences]
+
+    def _concatenate_chunks(self, func, chunksize, n_workers=None):
+        """Applies ``func(tpf)`` to chunks of ``chunksize`` cadences and
+        concatenates the results, which must be arrays (or tuples of arrays)
+        with one element per cadence.
+
+        If ``n_workers`` is larger than one, the chunks are processed
+        concurrently by a pool of ``n_workers`` threads.  Reading a FITS table
+        is not thread-safe (e.g. scaled columns are converted on access), so
+        the columns of every chunk are read into private arrays by the calling
+        thread first, ``n_workers`` chunks at a time.
+        """
+        if n_workers is not None and n_workers > 1:
+            from concurrent.futures import ThreadPoolExecutor
+            from itertools import islice
+            chunks = self.iter_chunks(chunksize)
+            results = []
+            with ThreadPoolExecutor(max_workers=n_workers) as executor:
+                while True:
+                    batch = [chunk._read_columns()
+                             for chunk in islice(chunks, n_workers)]
+                    if not batch:
+                        break
+                    results.extend(executor.map(func, batch))
+        else:
+            results = [func(chunk) for chunk in self.iter_chunks(chunksize)]
+        if isinstance(results[0], tuple):
+            return tuple(np.concatenate(result) for result in zip(*results))
+        return np.concatenate(results)
+
+    def _arithmetic(self, operation, other, columns=('FLUX',), inplace=False):
+        """Applies ``operation(column, other)`` to the good-quality cadences
+        of the given data ``columns``; this is a helper for the operators.
+
+        Unless ``inplace=True``, a new object is returned which shares the data
+        table with this object, and which only holds a copy of the modified
+        columns (i.e. the data table is copied on write).
+        """
         if isinstance(other, Quantity):
             other = other.value
-        hdu = deepcopy(self.hdu)
-        hdu[1].data['FLUX'][self.quality_mask] += other
-        return type(self)(hdu, quality_bitmask=self.quality_bitmask)
+        if inplace:
+            tpf = self
+        else:
+            tpf = type(self)(self._hdu, quality_bitmask=self.quality_bitmask)
+            tpf._pending_columns = dict(self._pending_columns)
+            tpf._shares_data = self._shares_data = True
+            self._owned_columns = set()
+        for column in columns:
+            values = tpf._get_writable_column(column)
+            values[self.quality_mask] = operation(values[self.quality_mask], other)
+        tpf.clear_cache()
+        return tpf
+
+    def __add__(self, other):
+        return self._arithmetic(np.add, other)
 
     def __mul__(self, other):
-        if isinstance(other, Quantity):
-            other = other.value
-        hdu = deepcopy(self.hdu)
-        hdu[1].data['FLUX'][self.quality_mask] *= other
-        hdu[1].data['FLUX_ERR'][self.quality_mask] *= other
-        return type(self)(hdu, quality_bitmask=self.quality_bitmask)
+        return self._arithmetic(np.multiply, other, columns=('FLUX', 'FLUX_ERR'))
 
     def __rtruediv__(self, other):
-        if isinstance(other, Quantity):
-            other = other.value
-        hdu = deepcopy(self.hdu)
-        hdu[1].data['FLUX'][self.quality_mask] /= other
-        hdu[1].data['FLUX_ERR'][self.quality_mask] /= other
-        return type(self)(hdu, quality_bitmask=self.quality_bitmask)
+        return self._arithmetic(np.true_divide, other, columns=('FLUX', 'FLUX_ERR'))
 
     def __radd__(self, other):
         return self.__add__(other)
@@ -145,6 +599,19 @@ class TargetPixelFile(object):
     def __rdiv__(self, other):
         return self.__rtruediv__(other)
 
+    def __iadd__(self, other):
+        return self._arithmetic(np.add, other, inplace=True)
+
+    def __isub__(self, other):
+        return self.__iadd__(-1 * other)
+
+    def __imul__(self, other):
+        return self._arithmetic(np.multiply, other, columns=('FLUX', 'FLUX_ERR'),
+                                inplace=True)
+
+    def __itruediv__(self, other):
+        return self.__imul__(1. / other)
+
     @property
     @deprecated("2.0", alternative="time", warning_type=LightkurveDeprecationWarning)
     def astropy_time(self):
@@ -153,7 +620,32 @@ class TargetPixelFile(object):
 
     @property
     def hdu(self):
-        return self._hdu
+        """The `~astropy.io.fits.HDUList` of the Target Pixel File.
+
+        If the data were modified by the arithmetic operators without being
+        copied into a new data table (see `_arithmetic`), every access
+        returns a new `~astropy.io.fits.HDUList` which includes the
+        modifications, i.e. modifying its data in place does not affect
+        this object.
+        """
+        if not self._pending_columns:
+            return self._hdu
+        # Build a new data table from the unmodified columns and the
+        # modified ones, leaving the state of this object untouched
+        cols = []
+        for col in self._hdu[1].columns:
+            if col.name in self._pending_columns:
+                col = fits.Column(name=col.name, format=col.format, unit=col.unit,
+                                  dim=col.dim, disp=col.disp, null=col.null,
+                                  array=self._pending_columns[col.name])
+            cols.append(col)
+        with warnings.catch_warnings():
+            # Ignore warnings about empty fields
+            warnings.simplefilter('ignore', UserWarning)
+            table = BinTableHDU.from_columns(cols, header=self._hdu[1].header)
+        hdu = self._hdu.copy()
+        hdu[1] = table
+        return hdu
 
     @hdu.setter
     def hdu(self, value, keys=('FLUX', 'QUALITY')):
@@ -167,6 +659,123 @@ class TargetPixelFile(object):
                 raise ValueError("File {} does not have a {} column, "
                                  "is this a target pixel file?".format(self.path, key))
         self._hdu = value
+        # Columns modified by arithmetic operators, which are copied on write
+        # rather than modifying a data table shared with another object.
+        self._pending_columns = {}
+        self._owned_columns = set()
+        self._shares_data = False
+        self.clear_cache()
+
+    @property
+    def quality_bitmask(self):
+        """The bitmask used to ignore bad-quality cadences."""
+        return self._quality_bitmask
+
+    @quality_bitmask.setter
+    def quality_bitmask(self, value):
+        self._quality_bitmask = value
+        self.clear_cache()
+
+    @property
+    def quality_mask(self):
+        """Boolean array flagging the good-quality cadences.
+
+        The array is read-only, because the cached data arrays would not
+        reflect in-place modifications; assign a new mask instead.
+        """
+        return self._quality_mask
+
+    @quality_mask.setter
+    def quality_mask(self, value):
+        # Keep a read-only copy, such that the cache cannot go stale
+        value = np.array(value)
+        value.flags.writeable = False
+        self._quality_mask = value
+        self.clear_cache()
+
+    def clear_cache(self):
+        """Discards the cached quality-masked data arrays.
+
+        The `flux`, `flux_err`, `time`, etc. properties cache the arrays they
+        return, so that the FITS table is only sliced once, and the `summary`
+        property caches the summary images derived from them.  The cache is
+        cleared automatically when `hdu`, `quality_bitmask`, or `quality_mask`
+        are re-assigned.  You only need to call this method yourself after
+        modifying the data in `hdu` in place.
+        """
+        self._cache = {}
+
+    @property
+    def cache_nbytes(self):
+        """Number of bytes held by the cache of quality-masked data arrays."""
+        # Cached `Quantity` objects share memory with the cached columns,
+        # so we count every underlying buffer only once.
+        owners = {}
+        values = list(self._cache.values())
+        if 'summary' in self._cache:
+            values += list(self._cache['summary']._cache.values())
+        for value in values:
+            arrays = [value.jd1, value.jd2] if isinstance(value, Time) else [value]
+            for arr in arrays:
+                if not isinstance(arr, np.ndarray):
+                    continue
+                while isinstance(arr.base, np.ndarray):
+                    arr = arr.base
+                owners[id(arr)] = arr.nbytes
+        return sum(owners.values())
+
+    def _get_cached(self, key, func):
+        """Returns ``func()``, caching the result under ``key``.
+
+        Cached arrays are made read-only to ensure they are not modified
+        in place by accident.
+        """
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+        value = func()
+        if isinstance(value, np.ndarray):
+            value.flags.writeable = False
+        self._cache[key] = value
+        return value
+
+    def _get_column(self, column):
+        """Returns a column of the data table, including any modifications
+        made by the arithmetic operators."""
+        try:
+            return self._pending_columns[column]
+        except KeyError:
+            return self._hdu[1].data[column]
+
+    def _get_writable_column(self, column):
+        """Returns a column of the data table which may be modified in place,
+        copying the column first if it is shared with another object."""
+        if column in self._owned_columns:
+            return self._pending_columns[column]
+        if self._shares_data or column in self._pending_columns:
+            self._pending_columns[column] = np.array(self._get_column(column))
+            self._owned_columns.add(column)
+            return self._pending_columns[column]
+        return self._hdu[1].data[column]
+
+    def _read_columns(self):
+        """Reads all loaded columns of the data table into arrays owned by
+        this object, such that the table is no longer accessed; returns self."""
+        for column in self._hdu[1].columns:
+            if column.format.repeat > 0 and column.name not in self._owned_columns:
+                self._pending_columns[column.name] = np.array(self._get_column(column.name))
+                self._owned_columns.add(column.name)
+        return self
+
+    def _get_masked_column(self, column):
+        """Returns the good-quality cadences of a column of the data table."""
+        if self._hdu[1].columns[column].format.repeat == 0:
+            raise ValueError("The {} column was not loaded; include it in the "
+                             "`columns` parameter when opening the file."
+                             "".format(column))
+        return self._get_cached(column,
+                                lambda: self._get_column(column)[self.quality_mask])
 
     def get_keyword(self, keyword, hdu=0, default=None):
         """Returns a header keyword value.
@@ -174,14 +783,14 @@ class TargetPixelFile(object):
         If the keyword is Undefined or does not exist,
         then return ``default`` instead.
         """
-        return self.hdu[hdu].header.get(keyword, default)
+        return self._hdu[hdu].header.get(keyword, default)
 
     @property
     @deprecated("2.0", alternative="get_header()",
                 warning_type=LightkurveDeprecationWarning)
     def header(self):
         """DEPRECATED. Please use ``get_header()`` instead."""
-        return self.hdu[0].header
+        return self._hdu[0].header
 
     def get_header(self, ext=0):
         """Returns the metadata embedded in the file.
@@ -206,7 +815,7 @@ class TargetPixelFile(object):
         header : `~astropy.io.fits.header.Header`
             Header object containing metadata keywords.
         """
-        return self.hdu[ext].header
+        return self._hdu[ext].header
 
     @property
     def ra(self):
@@ -231,12 +840,12 @@ class TargetPixelFile(object):
     @property
     def pos_corr1(self):
         """Returns the column position correction."""
-        return self.hdu[1].data['POS_CORR1'][self.quality_mask]
+        return self._get_masked_column('POS_CORR1')
 
     @property
     def pos_corr2(self):
         """Returns the row position correction."""
-        return self.hdu[1].data['POS_CORR2'][self.quality_mask]
+        return self._get_masked_column('POS_CORR2')
 
     @property
     def pipeline_mask(self):
@@ -245,9 +854,9 @@ class TargetPixelFile(object):
         # bit number 2 in the aperture mask extension, e.g. see Section 6 of
         # the TESS Data Products documentation (EXP-TESS-ARC-ICD-TM-0014.pdf).
         try:
-            return self.hdu[2].data & 2 > 0
+            return self._hdu[2].data & 2 > 0
         except TypeError:  # Early versions of TESScut returned floats in HDU 2
-            return np.ones(self.hdu[2].data.shape, dtype=bool)
+            return np.ones(self._hdu[2].data.shape, dtype=bool)
 
     @property
     def shape(self):
@@ -257,12 +866,16 @@ class TargetPixelFile(object):
     @property
     def time(self) -> Time:
         """Returns the time for all good-quality cadences."""
-        time_values = self.hdu[1].data['TIME'][self.quality_mask]
+        return self._get_cached('time', self._create_time)
+
+    def _create_time(self):
+        """Returns a `Time` object for all good-quality cadences."""
+        time_values = self._get_column('TIME')[self.quality_mask]
         # Some data products have missing time values;
         # we need to set these to zero or `Time` cannot be instantiated.
         time_values[~np.isfinite(time_values)] = 0
 
-        bjdrefi = self.hdu[1].header.get('BJDREFI')
+        bjdrefi = self._hdu[1].header.get('BJDREFI')
         if bjdrefi == 2454833:
             time_format = 'bkjd'
         elif bjdrefi == 2457000:
@@ -271,13 +884,13 @@ class TargetPixelFile(object):
             time_format = 'jd'
 
         return Time(time_values,
-                    scale=self.hdu[1].header.get('TIMESYS', 'tdb').lower(),
+                    scale=self._hdu[1].header.get('TIMESYS', 'tdb').lower(),
                     format=time_format)
 
     @property
     def cadenceno(self):
         """Return the cadence number for all good-quality cadences."""
-        cadenceno = self.hdu[1].data['CADENCENO'][self.quality_mask]
+        cadenceno = self._get_masked_column('CADENCENO')
         # The TESScut service returns an array of zeros as CADENCENO.
         # If this is the case, return frame numbers from 0 instead.
         if cadenceno[0] == 0:
@@ -289,40 +902,45 @@ class TargetPixelFile(object):
         """Returns a boolean mask flagging cadences whose time is `nan`."""
         return self.time.value == 0
 
+    def _get_masked_quantity(self, column, unit):
+        """Returns the good-quality cadences of a column as a `Quantity`
+        which shares its memory with the cached column."""
+        return self._get_cached(
+                    (column, unit),
+                    lambda: Quantity(self._get_masked_column(column),
+                                     unit=unit, copy=False))
+
     @property
     def flux(self) -> Quantity:
         """Returns the flux for all good-quality cadences."""
-        if self.get_header(1)['TUNIT5'] == 'e-/s':
+        if self._hdu[1].header['TUNIT5'] == 'e-/s':
             unit = 'electron/s'
         else:
             unit = 'dimensionless'
-        return Quantity(self.hdu[1].data['FLUX'][self.quality_mask], unit=unit)
+        return self._get_masked_quantity('FLUX', unit=unit)
 
     @property
     def flux_err(self) -> Quantity:
         """Returns the flux uncertainty for all good-quality cadences."""
-        if self.get_header(1)['TUNIT6'] == 'e-/s':
+        if self._hdu[1].header['TUNIT6'] == 'e-/s':
             unit = 'electron/s'
         else:
             unit = 'dimensionless'
-        return Quantity(self.hdu[1].data['FLUX_ERR'][self.quality_mask], unit=unit)
+        return self._get_masked_quantity('FLUX_ERR', unit=unit)
 
     @property
     def flux_bkg(self) -> Quantity:
         """Returns the background flux for all good-quality cadences."""
-        return Quantity(self.hdu[1].data['FLUX_BKG'][self.quality_mask],
-                        unit='electron/s')
+        return self._get_masked_quantity('FLUX_BKG', unit='electron/s')
 
     @property
     def flux_bkg_err(self) -> Quantity:
-        return Quantity(self.hdu[1].data['FLUX_BKG_ERR'][self.quality_mask],
-                        unit='electron/s')
-
+        return self._get_masked_quantity('FLUX_BKG_ERR', unit='electron/s')
 
     @property
     def quality(self):
         """Returns the quality flag integer of every good cadence."""
-        return self.hdu[1].data['QUALITY'][self.quality_mask]
+        return self._get_masked_column('QUALITY')
 
     @property
     def wcs(self) -> WCS:
@@ -334,11 +952,24 @@ class TargetPixelFile(object):
         w : `astropy.wcs.WCS` object
             WCS solution
         """
-        if 'MAST' in self.hdu[0].header['ORIGIN']:  # Is it a TessCut TPF?
+        return self._get_cached('wcs', self._create_wcs)
+
+    @property
+    def summary(self) -> TargetPixelFileSummary:
+        """Lazily-computed summary images of the flux data (e.g. the median
+        image), shared by all methods which need them.
+
+        See `TargetPixelFileSummary` for details.
+        """
+        return self._get_cached('summary', lambda: TargetPixelFileSummary(self))
+
+    def _create_wcs(self):
+        """Returns a new `WCS` object parsed from the header keywords."""
+        if 'MAST' in self._hdu[0].header['ORIGIN']:  # Is it a TessCut TPF?
             # TPF's generated using the TESSCut service in early 2019 only appear
             # to contain a valid WCS in the second extension (the aperture
             # extension), so we treat such files as a special case.
-            return WCS(self.hdu[2])
+            return WCS(self._hdu[2])
         else:
             # For standard (Ames-pipeline-produced) TPF files, we use the WCS
             # keywords provided in the first extension (the data table extension).
@@ -361,8 +992,8 @@ class TargetPixelFile(object):
                             'NAXIS2': 'NAXIS2'}
             mywcs = {}
             for oldkey, newkey in wcs_keywords.items():
-                if (self.hdu[1].header[oldkey] != Undefined):
-                   mywcs[newkey] = self.hdu[1].header[oldkey]
+                if (self._hdu[1].header[oldkey] != Undefined):
+                   mywcs[newkey] = self._hdu[1].header[oldkey]
             return WCS(mywcs)
 
     def get_coordinates(self, cadence='all'):
@@ -372,9 +1003,12 @@ class TargetPixelFile(object):
         cadence is 'all' returns one RA, Dec value for each pixel in every cadence.
         Uses the WCS solution and the POS_CORR data from TPF header.
 
+        Only the requested cadences are passed through the WCS solution,
+        i.e. requesting a single cadence is much faster than requesting all.
+
         Parameters
         ----------
-        cadence : 'all' or int
+        cadence : 'all', int, slice, or array-like
             Which cadences to return the RA Dec coordinates for.
 
         Returns
@@ -386,8 +1020,8 @@ class TargetPixelFile(object):
         """
         w = self.wcs
         X, Y = np.meshgrid(np.arange(self.shape[2]), np.arange(self.shape[1]))
-        pos_corr1_pix = np.copy(self.hdu[1].data['POS_CORR1'])
-        pos_corr2_pix = np.copy(self.hdu[1].data['POS_CORR2'])
+        pos_corr1_pix = np.copy(self._get_column('POS_CORR1'))
+        pos_corr2_pix = np.copy(self._get_column('POS_CORR2'))
 
         # We zero POS_CORR* when the values are NaN or make no sense (>50px)
         with warnings.catch_warnings():  # Comparing NaNs to numbers is OK here
@@ -398,20 +1032,20 @@ class TargetPixelFile(object):
                           np.abs(pos_corr2_pix - np.nanmedian(pos_corr2_pix)) > 50], axis=0)
         pos_corr1_pix[bad], pos_corr2_pix[bad] = 0, 0
 
+        # Select the requested good-quality cadences
+        pos_corr1_pix = pos_corr1_pix[self.quality_mask]
+        pos_corr2_pix = pos_corr2_pix[self.quality_mask]
+        if not (isinstance(cadence, str) and cadence == 'all'):
+            pos_corr1_pix = pos_corr1_pix[cadence]
+            pos_corr2_pix = pos_corr2_pix[cadence]
+
         # Add in POSCORRs
-        X = (np.atleast_3d(X).transpose([2, 0, 1]) +
-             np.atleast_3d(pos_corr1_pix).transpose([1, 2, 0]))
-        Y = (np.atleast_3d(Y).transpose([2, 0, 1]) +
-             np.atleast_3d(pos_corr2_pix).transpose([1, 2, 0]))
+        X = X + np.asarray(pos_corr1_pix)[..., np.newaxis, np.newaxis]
+        Y = Y + np.asarray(pos_corr2_pix)[..., np.newaxis, np.newaxis]
 
         # Pass through WCS
         ra, dec = w.wcs_pix2world(X.ravel(), Y.ravel(), 1)
-        ra = ra.reshape((pos_corr1_pix.shape[0], self.shape[1], self.shape[2]))
-        dec = dec.reshape((pos_corr2_pix.shape[0], self.shape[1], self.shape[2]))
-        ra, dec = ra[self.quality_mask], dec[self.quality_mask]
-        if cadence != 'all':
-            return ra[cadence], dec[cadence]
-        return ra, dec
+        return ra.reshape(X.shape), dec.reshape(Y.shape)
 
     def show_properties(self):
         """Prints a description of all non-callable attributes.
@@ -602,9 +1236,7 @@ class TargetPixelFile(object):
         if reference_pixel == 'center':
             reference_pixel = (self.shape[2] / 2, self.shape[1] / 2)
         # Calculate the median image
-        with warnings.catch_warnings():
-            warnings.simplefilter('ignore')
-            median_image = np.nanmedian(self.flux, axis=0)
+        median_image = self.summary.median_image
         vals = median_image[np.isfinite(median_image)].flatten()
         # Calculate the theshold value in flux units
         mad_cut = (1.4826 * MAD(vals) * threshold) + np.nanmedian(median_image)
@@ -626,7 +1258,9 @@ class TargetPixelFile(object):
             closest_label = labels[closest_arg[0], closest_arg[1]]
             return labels == closest_label
 
-    def estimate_background(self, aperture_mask='background'):
+    def estimate_background(self, aperture_mask='background', chunksize=None,
+                            method='median', percentile=50., sigma=3.,
+                            n_workers=None):
         """Returns an estimate of the median background level in the FLUX column.
 
         In the case of official Kepler and TESS Target Pixel Files, the
@@ -644,6 +1278,17 @@ class TargetPixelFile(object):
 
         This method estimates the per-pixel background flux over time by
         computing the median pixel value across the `aperture mask`.
+        Alternative statistics can be selected using the `method` parameter:
+
+            * "median": the median pixel value (default).
+            * "percentile": the `percentile`-th percentile of the pixel values,
+              obtained using a partial sort.  With ``percentile=50`` this
+              yields the median at a fraction of the cost for long cubes.
+            * "sigma_clip": the mean pixel value after iteratively rejecting
+              values which deviate from the median by more than `sigma`
+              standard deviations.
+            * "biweight": the biweight location of the pixel values, which is
+              a robust estimate of the central value.
 
         Parameters
         ----------
@@ -654,18 +1299,52 @@ class TargetPixelFile(object):
             median flux will be used. Alternatively, users can pass a boolean
             array describing the aperture mask such that `True` means that the
             pixel will be used.
+        chunksize : int, optional
+            If given, the pixel data will be processed in chunks of
+            ``chunksize`` cadences (see `iter_chunks`), which limits the
+            amount of memory used.
+        method : 'median', 'percentile', 'sigma_clip', or 'biweight'
+            Statistic used to combine the background pixels of each cadence.
+        percentile : float
+            Percentile to compute if ``method='percentile'``. Default: 50.
+        sigma : float
+            Clipping threshold, in units of standard deviations,
+            if ``method='sigma_clip'``. Default: 3.
+        n_workers : int, optional
+            If larger than one, the cadences are split in chunks (of
+            ``chunksize`` cadences, or in ``n_workers`` equal chunks if
+            ``chunksize`` is not given) which are processed concurrently
+            by ``n_workers`` threads.
 
         Returns
         -------
         lc : `LightCurve` object
-            Median background flux in units electron/second/pixel.
+            Background flux in units electron/second/pixel.
         """
+        method = validate_method(method, ['median', 'percentile', 'sigma_clip', 'biweight'])
         mask = self._parse_aperture_mask(aperture_mask)
-        # For each cadence, compute the median pixel flux across the background
-        simple_bkg = np.nanmedian(self.flux[:, mask], axis=1) / u.pixel
-        return LightCurve(time=self.time, flux=simple_bkg)
-
-    def estimate_centroids(self, aperture_mask='default', method='moments'):
+        if n_workers is not None and n_workers > 1 and chunksize is None:
+            chunksize = int(np.ceil(len(self) / n_workers))
+        if chunksize is not None and len(self) > chunksize:
+            simple_bkg = self._concatenate_chunks(
+                            lambda tpf: tpf.estimate_background(mask, method=method,
+                                                                percentile=percentile,
+                                                                sigma=sigma).flux,
+                            chunksize, n_workers=n_workers)
+            return LightCurve(time=self.time, flux=simple_bkg)
+        # For each cadence, combine the pixel fluxes across the background
+        flux = self.flux[:, mask]
+        if method == 'median':
+            simple_bkg = np.nanmedian(flux, axis=1)
+        elif method == 'percentile':
+            simple_bkg = _nanpercentile_rows(flux.value, percentile) * flux.unit
+        elif method == 'sigma_clip':
+            simple_bkg = _sigma_clipped_mean_rows(flux.value, sigma=sigma) * flux.unit
+        elif method == 'biweight':
+            simple_bkg = _biweight_location_rows(flux.value) * flux.unit
+        return LightCurve(time=self.time, flux=simple_bkg / u.pixel)
+
+    def estimate_centroids(self, aperture_mask='default', method='moments', chunksize=None):
         """Returns the flux center of an object inside ``aperture_mask``.
 
         Telescopes tend to smear out the light from a point-like star over
@@ -703,6 +1382,10 @@ class TargetPixelFile(object):
             computes the centroid based on the sample moments of the data.
             'quadratic' fits a 2D polynomial to the data and returns the
             coordinate of the peak of that polynomial.
+        chunksize : int, optional
+            If given, the pixel data will be processed in chunks of
+            ``chunksize`` cadences (see `iter_chunks`), which limits the
+            amount of memory used.
 
         Returns
         -------
@@ -711,6 +1394,11 @@ class TargetPixelFile(object):
             for each cadence, or NaN for cadences where the estimation failed.
         """
         method = validate_method(method, ['moments', 'quadratic'])
+        if chunksize is not None and len(self) > chunksize:
+            aperture_mask = self._parse_aperture_mask(aperture_mask)
+            return self._concatenate_chunks(
+                        lambda tpf: tpf.estimate_centroids(aperture_mask, method=method),
+                        chunksize)
         if method == 'moments':
             return self._estimate_centroids_via_moments(aperture_mask=aperture_mask)
         elif method == 'quadratic':
@@ -735,11 +1423,8 @@ class TargetPixelFile(object):
         """Estimate centroids by fitting a 2D quadratic to the brightest pixels;
         this is a helper method for `estimate_centroids()`."""
         aperture_mask = self._parse_aperture_mask(aperture_mask)
-        col_centr, row_centr = [], []
-        for idx in range(len(self.time)):
-            col, row = centroid_quadratic(self.flux[idx], mask=aperture_mask)
-            col_centr.append(col)
-            row_centr.append(row)
+        # Fit the quadratic to all cadences at once
+        col_centr, row_centr = centroid_quadratic(self.flux, mask=aperture_mask)
         # Finally, we add .5 to the result bellow because the convention is that
         # pixels are centered at .5, 1.5, 2.5, ...
         col_centr = np.asfarray(col_centr) + self.column + .5
@@ -748,7 +1433,7 @@ class TargetPixelFile(object):
         row_centr = Quantity(row_centr, unit='pixel')
         return col_centr, row_centr
 
-    def _aperture_photometry(self, aperture_mask, centroid_method='moments'):
+    def _aperture_photometry(self, aperture_mask, centroid_method='moments', chunksize=None):
         """Helper method for ``extract_aperture photometry``.
 
         Returns
@@ -760,6 +1445,15 @@ class TargetPixelFile(object):
         if apmask.sum() == 0:
             log.warning('Warning: aperture mask contains zero pixels.')
 
+        if chunksize is not None and len(self) > chunksize:
+            return self._concatenate_chunks(
+                        lambda tpf: tpf._aperture_photometry_arrays(apmask, centroid_method),
+                        chunksize)
+        return self._aperture_photometry_arrays(apmask, centroid_method)
+
+    def _aperture_photometry_arrays(self, apmask, centroid_method):
+        """Performs aperture photometry on all cadences at once;
+        this is a helper method for ``_aperture_photometry``."""
         # Estimate centroids
         centroid_col, centroid_row = self.estimate_centroids(apmask, method=centroid_method)
 
@@ -778,12 +1472,143 @@ class TargetPixelFile(object):
             is_allnan = ~np.any(np.isfinite(self.flux_err[:, apmask]), axis=1)
             flux_err[is_allnan] = np.nan
 
-        if self.get_header(1)['TUNIT5'] == 'e-/s':
+        if self._hdu[1].header['TUNIT5'] == 'e-/s':
             flux = Quantity(flux, unit='electron/s')
             flux_err = Quantity(flux_err, unit='electron/s')
 
         return flux, flux_err, centroid_col, centroid_row
 
+    def extract_aperture_photometry_batch(self, masks, return_array=False):
+        """Performs aperture photometry for many aperture masks at once.
+
+        This method is equivalent to calling
+        ``extract_aperture_photometry(aperture_mask=mask)`` for every mask
+        in ``masks``, but it is much faster when many masks are evaluated,
+        because the fluxes, errors, and centroids (using the 'moments'
+        method) are computed for all masks using a single matrix product
+        over the pixel data.
+
+        Parameters
+        ----------
+        masks : array-like
+            Boolean array of shape (n_masks, n_rows, n_cols) describing the
+            aperture masks, such that `True` means that the pixel will be used.
+        return_array : bool
+            If `True`, return 2D arrays instead of light curve objects.
+
+        Returns
+        -------
+        lcs : `~lightkurve.collections.LightCurveCollection`
+            Collection containing one light curve for each mask.
+            Returned if ``return_array=False`` (default).
+        flux, flux_err, centroid_col, centroid_row : `~astropy.units.Quantity`
+            Arrays of shape (n_cadences, n_masks).
+            Returned if ``return_array=True``.
+        """
+        masks = np.asarray(masks)
+        if masks.ndim == 2:
+            masks = masks[np.newaxis]
+        if masks.shape[1:] != self.shape[1:]:
+            raise ValueError("`masks` has shape {}, but the flux data has "
+                             "shape {}".format(masks.shape, self.shape))
+        masks = masks.astype(bool)
+        n_masks = masks.shape[0]
+        n_pixels = self.shape[1] * self.shape[2]
+
+        flux_pix = self.flux.value.reshape(len(self), n_pixels)
+        flux_err_pix = self.flux_err.value.reshape(len(self), n_pixels)
+        weights = masks.reshape(n_masks, n_pixels).T.astype(float)
+
+        # We emulate ``np.nansum``, but if *all* pixels in the aperture are
+        # NaN, we propagate a NaN.
+        flux, flux_finite = _nansum_dot(flux_pix, weights)
+        is_allnan = np.isfinite(flux_pix).dot(weights) == 0
+        with warnings.catch_warnings():
+            # Ignore warnings due to negative errors or empty apertures
+            warnings.simplefilter("ignore", RuntimeWarning)
+            variance, _ = _nansum_dot(np.asarray(flux_err_pix, dtype=float)**2, weights)
+            flux_err = variance**0.5
+            flux_err[np.isfinite(flux_err_pix).dot(weights) == 0] = np.nan
+
+            # Compute the centroids using the 2D image moments
+            yy, xx = np.indices(self.shape[1:]) + 0.5
+            xx = (self.column + xx).reshape(n_pixels, 1)
+            yy = (self.row + yy).reshape(n_pixels, 1)
+            centroid_col = flux_finite.dot(weights * xx) / flux
+            centroid_row = flux_finite.dot(weights * yy) / flux
+            # As in `estimate_centroids`, infinite fluxes yield NaN centroids
+            centroid_col[np.isinf(flux)] = np.nan
+            centroid_row[np.isinf(flux)] = np.nan
+        flux[is_allnan] = np.nan
+        centroid_col = Quantity(centroid_col, unit='pixel')
+        centroid_row = Quantity(centroid_row, unit='pixel')
+        flux = Quantity(flux, unit=self.flux.unit)
+        flux_err = Quantity(flux_err, unit=self.flux_err.unit)
+
+        if return_array:
+            return flux, flux_err, centroid_col, centroid_row
+
+        from .collections import LightCurveCollection
+        return LightCurveCollection([
+                    self._create_aperture_lightcurve(flux[:, idx],
+                                                     flux_err[:, idx],
+                                                     centroid_col[:, idx],
+                                                     centroid_row[:, idx],
+                                                     masks[idx])
+                    for idx in range(n_masks)])
+
+    def to_pixel_lightcurves(self, return_array=False):
+        """Returns the light curve of every individual pixel.
+
+        This is equivalent to calling ``to_lightcurve(aperture_mask=mask)``
+        with a single-pixel ``mask`` for every pixel in the image, but the
+        pixel time series are obtained by reshaping the flux cube into a
+        (time, pixel) matrix rather than by performing aperture photometry
+        once per pixel.  Pixels are ordered as in ``tpf.flux[0].ravel()``,
+        i.e. the light curve at index ``k`` corresponds to the pixel at
+        ``np.unravel_index(k, tpf.shape[1:])``.
+
+        Parameters
+        ----------
+        return_array : bool
+            If `True`, return 2D arrays instead of light curve objects.
+
+        Returns
+        -------
+        lcs : `~lightkurve.collections.LightCurveCollection`
+            Collection containing one light curve for each pixel.
+            Returned if ``return_array=False`` (default).
+        flux, flux_err : `~astropy.units.Quantity`
+            Arrays of shape (n_cadences, n_rows * n_cols).
+            Returned if ``return_array=True``.
+        """
+        n_pixels = self.shape[1] * self.shape[2]
+        flux = self.flux.reshape(len(self), n_pixels)
+        flux_err = self.flux_err.reshape(len(self), n_pixels)
+        if return_array:
+            return flux, flux_err
+
+        # The moment-based centroid of a single pixel is the pixel center,
+        # unless the pixel carries no flux
+        yy, xx = np.indices(self.shape[1:]) + 0.5
+        xx = (self.column + xx).ravel()
+        yy = (self.row + yy).ravel()
+        has_flux = np.isfinite(flux.value) & (flux.value != 0)
+        centroid_col = Quantity(np.where(has_flux, xx, np.nan), unit='pixel')
+        centroid_row = Quantity(np.where(has_flux, yy, np.nan), unit='pixel')
+
+        from .collections import LightCurveCollection
+        lcs = []
+        for idx in range(n_pixels):
+            mask = np.zeros(self.shape[1:], dtype=bool)
+            mask[np.unravel_index(idx, self.shape[1:])] = True
+            lcs.append(self._create_aperture_lightcurve(flux[:, idx],
+                                                        flux_err[:, idx],
+                                                        centroid_col[:, idx],
+                                                        centroid_row[:, idx],
+                                                        mask))
+        return LightCurveCollection(lcs)
+
     def query_solar_system_objects(self, cadence_mask='outliers', radius=None,
                                         sigma=3, cache=True, return_mask=False):
         """Returns a list of asteroids or comets which affected the target pixel files.
@@ -950,7 +1775,7 @@ class TargetPixelFile(object):
                 else:
                     data_to_plot = self.flux[frame]
             else:
-                data_to_plot = self.hdu[1].data[column][self.quality_mask][frame]
+                data_to_plot = self._get_column(column)[self.quality_mask][frame]
         except KeyError:
             raise ValueError("column must be one of the following: ('FLUX','FLUX_ERR',"
                              "'FLUX_BKG','FLUX_BKG_ERR','COSMIC_RAYS','RAW_CNTS')")
@@ -1154,6 +1979,8 @@ class TargetPixelFile(object):
             cut out.
         """
         imshape = self.flux.shape[1:]
+        # Retrieve the HDUList once, since it may be rebuilt on every access
+        hdulist = self.hdu
 
         # Parse the user input (``center``) into an (x, y) coordinate
         if center is None:
@@ -1180,7 +2007,7 @@ class TargetPixelFile(object):
                                dtype=int)
 
         # Make a copy of the data extension
-        hdu = self.hdu[0].copy()
+        hdu = hdulist[0].copy()
 
         # Find the new object coordinates
         r, d = self.get_coordinates(cadence=len(self.flux)//2)
@@ -1204,15 +2031,15 @@ class TargetPixelFile(object):
         hdus = [hdu]
 
         # Copy the header
-        hdr = deepcopy(self.hdu[1].header)
+        hdr = deepcopy(hdulist[1].header)
 
         # Trim any columns that have the shape of the image, to be the new shape
         data_columns = []
         with warnings.catch_warnings():
             warnings.simplefilter('ignore')
-            for idx, datacol in enumerate(self.hdu[1].columns):
+            for idx, datacol in enumerate(hdulist[1].columns):
                 # If the column is 3D
-                if (len(self.hdu[1].data[datacol.name].shape) == 3):
+                if (len(hdulist[1].data[datacol.name].shape) == 3):
                     # Make a copy, trim it and change the format
                     datacol = deepcopy(datacol)
                     datacol.array = datacol.array[:, row_edges[0]:row_edges[1], col_edges[0]:col_edges[1]]
@@ -1243,7 +2070,7 @@ class TargetPixelFile(object):
         hdus.append(btbl)
 
         # Correct the aperture mask
-        hdu = self.hdu[2].copy()
+        hdu = hdulist[2].copy()
         ar = hdu.data
         ar = ar[row_edges[0]:row_edges[1], col_edges[0]:col_edges[1]]
         hdu.header['NAXIS1'] = ar.shape[0]
@@ -1261,7 +2088,8 @@ class TargetPixelFile(object):
     @staticmethod
     def from_fits_images(images_flux, position, images_raw_cnts=None, images_flux_err=None,
                          images_flux_bkg=None, images_flux_bkg_err=None, images_cosmic_rays=None,
-                         size=(11, 11), extension=1, target_id="unnamed-target", hdu0_keywords=None, **kwargs):
+                         size=(11, 11), extension=1, target_id="unnamed-target", hdu0_keywords=None,
+                         parallel=False, output_fn=None, **kwargs):
         """Creates a new Target Pixel File from a set of images.
 
         This method is intended to make it easy to cut out targets from
@@ -1299,6 +2127,14 @@ class TargetPixelFile(object):
             Unique identifier of the target to be recorded in the TPF.
         hdu0_keywords : dict
             Additional keywords to add to the first header file.
+        parallel : bool
+            If `True`, the images will be read in parallel using Python's
+            `multiprocessing` module.  Only the pixels inside the cutout are
+            read from image files on disk.
+        output_fn : str, optional
+            If given, the cutouts will be written directly into a new pixel
+            file of this name rather than being held in memory
+            (see `TargetPixelFileFactory`).
         **kwargs : dict
             Extra arguments to be passed to the `TargetPixelFile` constructor.
 
@@ -1307,44 +2143,192 @@ class TargetPixelFile(object):
         tpf : TargetPixelFile
             A new Target Pixel File assembled from the images.
         """
-        len_images = len(images_flux)
+        if not isinstance(position, SkyCoord):
+            raise ValueError('Position must be an astropy.coordinates.SkyCoord.')
+        return TargetPixelFile._from_fits_images(
+                    [images_flux, images_raw_cnts, images_flux_err, images_flux_bkg,
+                     images_flux_bkg_err, images_cosmic_rays],
+                    positions=[position], size=size, extension=extension,
+                    target_ids=[target_id], hdu0_keywords=hdu0_keywords,
+                    parallel=parallel, output_fns=[output_fn], **kwargs)[0]
 
-        if len_images == 0:
-            raise ValueError('One or more images must be passed.')
+    @staticmethod
+    def from_fits_images_bulk(images_flux, positions, images_raw_cnts=None, images_flux_err=None,
+                              images_flux_bkg=None, images_flux_bkg_err=None, images_cosmic_rays=None,
+                              size=(11, 11), extension=1, target_ids=None, hdu0_keywords=None,
+                              parallel=False, output_fns=None, **kwargs):
+        """Creates Target Pixel Files for many targets from a set of images.
+
+        This method is equivalent to calling `from_fits_images` once for
+        each position, except that every image is opened only once and all
+        the cutouts are taken from it.  This makes it much faster to cut out
+        a large number of targets from the same set of FFI images.
+
+        Parameters
+        ----------
+        images_flux : list of str, or list of fits.ImageHDU objects
+            Sorted list of FITS filename paths or ImageHDU objects to get
+            the flux data from.
+        positions : astropy.SkyCoord or list of astropy.SkyCoord
+            Positions around which to cut out pixels.
+        images_raw_cnts : list of str, or list of fits.ImageHDU objects
+            Sorted list of FITS filename paths or ImageHDU objects to get
+            the raw counts data from.
+        images_flux_err : list of str, or list of fits.ImageHDU objects
+            Sorted list of FITS filename paths or ImageHDU objects to get
+            the flux error data from.
+        images_flux_bkg : list of str, or list of fits.ImageHDU objects
+            Sorted list of FITS filename paths or ImageHDU objects to get
+            the background data from.
+        images_flux_bkg_err : list of str, or list of fits.ImageHDU objects
+            Sorted list of FITS filename paths or ImageHDU objects to get
+            the background error data from.
+        images_cosmic_rays : list of str, or list of fits.ImageHDU objects
+            Sorted list of FITS filename paths or ImageHDU objects to get
+            the cosmic rays data from.
+        size : (int, int)
+            Dimensions (cols, rows) to cut out around each position.
+        extension : int or str
+            If `images` is a list of filenames, provide the extension number
+            or name to use. This should be the same for all flux inputs
+            provided. Default: 1.
+        target_ids : list of int or str
+            Unique identifiers of the targets to be recorded in the TPFs.
+            Must have the same length as `positions`.
+        hdu0_keywords : dict
+            Additional keywords to add to the first header file.
+        parallel : bool
+            If `True`, the images will be read in parallel using Python's
+            `multiprocessing` module.
+        output_fns : list of str, optional
+            If given, the cutouts will be written directly into new pixel
+            files of these names rather than being held in memory
+            (see `TargetPixelFileFactory`).  Must have the same length
+            as `positions`.
+        **kwargs : dict
+            Extra arguments to be passed to the `TargetPixelFile` constructor.
+
+        Returns
+        -------
+        tpfs : TargetPixelFileCollection
+            New Target Pixel Files assembled from the images, in the same
+            order as `positions`.
+        """
+        from .collections import TargetPixelFileCollection
+
+        if isinstance(positions, SkyCoord):
+            positions = [positions] if positions.isscalar else list(positions)
+        for position in positions:
+            if not isinstance(position, SkyCoord):
+                raise ValueError('Positions must be astropy.coordinates.SkyCoord objects.')
+        if target_ids is None:
+            target_ids = ["unnamed-target"] * len(positions)
+        if len(target_ids) != len(positions):
+            raise ValueError('`target_ids` must have the same length as `positions`.')
+        if output_fns is not None and len(output_fns) != len(positions):
+            raise ValueError('`output_fns` must have the same length as `positions`.')
+        tpfs = TargetPixelFile._from_fits_images(
+                    [images_flux, images_raw_cnts, images_flux_err, images_flux_bkg,
+                     images_flux_bkg_err, images_cosmic_rays],
+                    positions=positions, size=size, extension=extension,
+                    target_ids=target_ids, hdu0_keywords=hdu0_keywords,
+                    parallel=parallel, output_fns=output_fns, **kwargs)
+        return TargetPixelFileCollection(tpfs)
+
+    @staticmethod
+    def from_cube(cube_path, position, size=(11, 11), target_id="unnamed-target",
+                  hdu0_keywords=None, **kwargs):
+        """Creates a new Target Pixel File from an FFI cube file.
+
+        This method yields the same result as `from_fits_images`, but only
+        the pixels inside the cutout are read from the cube file, which is
+        much faster than opening each of the images it was created from.
+
+        Parameters
+        ----------
+        cube_path : str
+            Path to a cube file created using `create_ffi_cube`.
+        position : astropy.SkyCoord
+            Position around which to cut out pixels.
+        size : (int, int)
+            Dimensions (cols, rows) to cut out around `position`.
+        target_id : int or str
+            Unique identifier of the target to be recorded in the TPF.
+        hdu0_keywords : dict
+            Additional keywords to add to the first header file.
+        **kwargs : dict
+            Extra arguments to be passed to the `TargetPixelFile` constructor.
+
+        Returns
+        -------
+        tpf : TargetPixelFile
+            A new Target Pixel File assembled from the cube.
+        """
         if not isinstance(position, SkyCoord):
             raise ValueError('Position must be an astropy.coordinates.SkyCoord.')
         if hdu0_keywords is None:
             hdu0_keywords = {}
 
-        basic_keywords = ['MISSION', 'TELESCOP', 'INSTRUME', 'QUARTER',
-                          'CAMPAIGN', 'CHANNEL', 'MODULE', 'OUTPUT',
-                          'CAMERA', 'CCD', 'SECTOR']
-        carry_keywords = {}
-
-        # Define a helper function to accept images in a flexible way
-        def _open_image(img, extension):
-            if isinstance(img, fits.ImageHDU):
-                hdu = img
-            elif isinstance(img, fits.HDUList):
-                hdu = img[extension]
-            else:
-                hdu = fits.open(img)[extension]
-            return hdu
-        
-        # Define a helper function to cutout images if not None
-        def _cutout_image(hdu, position, wcs_ref, size):
-            if hdu is None:
-                cutout_data = None
-                cutout_wcs = None
-            elif position is None:
-                cutout_data = hdu.data
-                cutout_wcs = hdu.wcs
-            else:
-                cutout = Cutout2D(hdu.data, position, wcs=wcs_ref,
-                                  size=size, mode='partial')
-                cutout_data = cutout.data
-                cutout_wcs = cutout.wcs
-            return cutout_data, cutout_wcs
+        with fits.open(cube_path) as hdulist:
+            ref_header = hdulist[0].header
+            n_rows, n_cols, n_cadences = hdulist['FLUX'].shape
+            wcs_ref = WCS(ref_header)
+            radec = np.asarray([[position.ra.deg, position.dec.deg]])
+            column, row = wcs_ref.all_world2pix(radec, 0)[0]
+            cutout = Cutout2D(np.broadcast_to(np.float32(0), (n_rows, n_cols)), position,
+                              wcs=wcs_ref, size=size, mode='partial')
+
+            # Time is the fastest axis of the cube, hence the cutout occupies
+            # `cutout.shape[0]` contiguous blocks of bytes in the file.
+            data = {}
+            for extname in ['FLUX', 'FLUX_ERR']:
+                if extname in hdulist:
+                    cube = np.full(cutout.shape + (n_cadences,), np.nan, dtype='float32')
+                    cube[cutout.slices_cutout] = hdulist[extname].section[cutout.slices_original]
+                    data[extname] = cube.transpose(2, 0, 1)
+            headers = [fits.Header.fromstring(header)
+                       for header in hdulist['FRAMES'].data['HEADER']]
+
+        factory = TargetPixelFileFactory(n_cadences=n_cadences,
+                                         n_rows=size[0],
+                                         n_cols=size[1],
+                                         target_id=target_id)
+        factory.keywords = headers[0]
+        for idx, header in enumerate(headers):
+            # Get positional shift of the image compared to the reference WCS
+            pos_corr1, pos_corr2 = WCS(header).all_world2pix(radec, 0)[0] - (column, row)
+            with warnings.catch_warnings():
+                # Using `POS_CORR1` as a header keyword violates the FITS
+                # standard for being too long, but we use it for consistency
+                # with the TPF column name.  Hence we ignore the warning.
+                warnings.simplefilter("ignore", AstropyWarning)
+                header['POS_CORR1'] = pos_corr1
+                header['POS_CORR2'] = pos_corr2
+            factory.add_cadence(frameno=idx, flux=data['FLUX'][idx],
+                                flux_err=data['FLUX_ERR'][idx] if 'FLUX_ERR' in data else None,
+                                header=header)
+
+        return factory.get_tpf(hdu0_keywords=_get_primary_keywords(ref_header, hdu0_keywords),
+                               ext_info=_get_cutout_ext_info(cutout.wcs, size, column, row,
+                                                             factory.keywords),
+                               **kwargs)
+
+    @staticmethod
+    def _from_fits_images(images, positions, size, extension, target_ids,
+                          hdu0_keywords=None, parallel=False, output_fns=None, **kwargs):
+        """Implements `from_fits_images` and `from_fits_images_bulk`.
+
+        ``images`` is the list ``[images_flux, images_raw_cnts, images_flux_err,
+        images_flux_bkg, images_flux_bkg_err, images_cosmic_rays]``.
+        Returns a list containing one `TargetPixelFile` for each position.
+        """
+        images_flux = images[0]
+        len_images = len(images_flux)
+
+        if len_images == 0:
+            raise ValueError('One or more images must be passed.')
+        if hdu0_keywords is None:
+            hdu0_keywords = {}
 
         # Set the default extension if unspecified
         if extension is None:
@@ -1352,98 +2336,82 @@ class TargetPixelFile(object):
             if isinstance(images_flux[0], str) and images_flux[0].endswith("ffic.fits"):
                 extension = 1  # TESS FFIs have the image data in extension #1
 
-        # If no position is given, ensure the cut-out size matches the image size
-        if position is None:
-            size = _open_image(images_flux[0], extension).data.shape
-
-        # Find middle image to use as a WCS reference
+        # Find middle image to use as a WCS reference.  Only its header is
+        # read, and the reference pixel positions are computed only once.
+        mid_hdu, mid_hdulist = _open_image(images_flux[int(len_images / 2) - 1], extension)
+        mid_header = mid_hdu.header.copy()
+        image_shape = mid_hdu.shape
+        if mid_hdulist is not None:
+            mid_hdulist.close()
+        wcs_ref = WCS(mid_header)
+        radec = np.asarray([[position.ra.deg, position.dec.deg] for position in positions])
+        pixel_ref = wcs_ref.all_world2pix(radec, 0)
+
+        # The cutout regions are identical for every frame, so we determine
+        # the slices and the WCS of each cutout once, without reading any data.
+        cutouts = [Cutout2D(np.broadcast_to(np.float32(0), image_shape), position,
+                            wcs=wcs_ref, size=size, mode='partial')
+                   for position in positions]
+        regions = [(cutout.slices_original, cutout.slices_cutout, cutout.shape)
+                   for cutout in cutouts]
+
+        # Create a factory for each target
+        if output_fns is None:
+            output_fns = [None] * len(positions)
+        factories = [TargetPixelFileFactory(n_cadences=len_images,
+                                            n_rows=size[0],
+                                            n_cols=size[1],
+                                            target_id=target_id,
+                                            path=output_fn)
+                     for target_id, output_fn in zip(target_ids, output_fns)]
+
+        allkeys = _get_primary_keywords(mid_header, hdu0_keywords)
+
+        args = ((tuple(i[idx] if i is not None else None for i in images),
+                 extension, radec, pixel_ref, regions)
+                for idx in range(len_images))
+
+        # Set up a mapping function
+        if parallel:
+            import multiprocessing
+            pool = multiprocessing.Pool()
+            mymap = pool.imap
+        else:
+            mymap = map
+        # Cadences are added to the factories as soon as they have been read
         try:
-            mid_hdu = _open_image(images_flux[int(len_images / 2) - 1], extension)
-
-            wcs_ref = WCS(mid_hdu)
-            column, row = wcs_ref.all_world2pix(
-                            np.asarray([[position.ra.deg], [position.dec.deg]]).T,
-                            0)[0]
-        except Exception as e:
-            raise e
-
-        # Create a factory and set default keyword values based on the middle image
-        factory = TargetPixelFileFactory(n_cadences=len_images,
-                                               n_rows=size[0],
-                                               n_cols=size[1],
-                                               target_id=target_id)
-
-        # Get some basic keywords
-        for kw in basic_keywords:
-            if kw in mid_hdu.header:
-                if not isinstance(mid_hdu.header[kw], Undefined):
-                    carry_keywords[kw] = mid_hdu.header[kw]
-        if ('MISSION' not in carry_keywords) and ('TELESCOP' in carry_keywords):
-            carry_keywords['MISSION'] = carry_keywords['TELESCOP']
-
-        allkeys = hdu0_keywords.copy()
-        allkeys.update(carry_keywords)
-        
-        img_list = [images_raw_cnts, images_flux, images_flux_err, images_flux_bkg, images_flux_bkg_err, images_cosmic_rays]
-
-        for idx, img in tqdm(enumerate(images_flux), total=len_images):
-            # Open images if provided and get HDUs
-            hdu_list = [_open_image(i[idx], extension) if i is not None else None for i in img_list]
-                
-            # Use the header in the flux image for each frame
-            hdu_idx = hdu_list[1].header
-            
-            if idx == 0:  # Get default keyword values from the first flux image
-                factory.keywords = hdu_idx
+            for idx, (frame_cutouts, hdu_idx, pos_corr) in tqdm(enumerate(mymap(_read_cutout_frame, args)),
+                                                                total=len_images):
+                # Only the time and quality keywords of each frame are needed
+                # by `add_cadence`, so we avoid copying the entire header.
+                frame_keywords = {kw: hdu_idx[kw] for kw in ['TSTART', 'TSTOP', 'TIMECORR',
+                                                             'CADENCEN', 'QUALITY']
+                                  if kw in hdu_idx}
+                for factory, target_cutouts, (pos_corr1, pos_corr2) in zip(factories, frame_cutouts, pos_corr):
+                    if idx == 0:  # Get default keyword values from the first flux image
+                        factory.keywords = hdu_idx
+                    header = dict(frame_keywords, POS_CORR1=pos_corr1, POS_CORR2=pos_corr2)
+                    flux, raw_cnts, flux_err, flux_bkg, flux_bkg_err, cosmic_rays = target_cutouts
+                    factory.add_cadence(frameno=idx, raw_cnts=raw_cnts, flux=flux, flux_err=flux_err,
+                                        flux_bkg=flux_bkg, flux_bkg_err=flux_bkg_err, cosmic_rays=cosmic_rays,
+                                        header=header)
+        except BaseException:
+            # Stop the workers immediately rather than letting them finish
+            if parallel:
+                pool.terminate()
+            raise
+        else:
+            if parallel:
+                pool.close()
+        finally:
+            if parallel:
+                pool.join()
 
-            # Get positional shift of the image compared to the reference WCS
-            wcs_current = WCS(hdu_idx)
-
-            column_current, row_current = wcs_current.all_world2pix(
-                np.asarray([[position.ra.deg], [position.dec.deg]]).T, 0)[0]
-            column_ref, row_ref = wcs_ref.all_world2pix(
-                np.asarray([[position.ra.deg], [position.dec.deg]]).T, 0)[0]
-
-            with warnings.catch_warnings():
-                # Using `POS_CORR1` as a header keyword violates the FITS
-                # standard for being too long, but we use it for consistency
-                # with the TPF column name.  Hence we ignore the warning.
-                warnings.simplefilter("ignore", AstropyWarning)
-                hdu_idx['POS_CORR1'] = column_current - column_ref
-                hdu_idx['POS_CORR2'] = row_current - row_ref
-
-            # Cutout (if neccessary) and get data
-            cutout_list = [_cutout_image(hdu, position, wcs_ref, size) for hdu in hdu_list]
-            # Flatten output list
-            cutout_list = flat_list = [item for sublist in cutout_list for item in sublist]
-            raw_cnts, _, flux, wcs, flux_err, _, flux_bkg, _, flux_bkg_err, _, cosmic_rays, _ = cutout_list
-            
-            factory.add_cadence(frameno=idx, raw_cnts=raw_cnts, flux=flux, flux_err=flux_err,
-                                flux_bkg=flux_bkg, flux_bkg_err=flux_bkg_err, cosmic_rays=cosmic_rays,
-                                header=hdu_idx)
-
-        ext_info = {}
-        ext_info['TFORM4'] = '{}J'.format(size[0] * size[1])
-        ext_info['TDIM4'] = '({},{})'.format(size[0], size[1])
-        ext_info.update(wcs.to_header())
-
-        # TPF contains multiple data columns that require WCS
-        for m in [4, 5, 6, 7, 8, 9]:
-            if m > 4:
-                ext_info["TFORM{}".format(m)] = '{}E'.format(size[0] * size[1])
-                ext_info['TDIM{}'.format(m)] = '({},{})'.format(size[0], size[1])
-            # Compute the distance from the star to the TPF lower left corner
-            # That is approximately half the TPF size, with an adjustment factor if the star's pixel
-            #    position gets rounded up or not.
-            # The first int is there so that even sizes always round to one less than half of their value
-
-            half_tpfsize_col = int((size[0] - 1) / 2.) + (int(round(column)) - int(column)) * ((size[0] + 1) % 2)
-            half_tpfsize_row = int((size[1] - 1) / 2.) + (int(round(row)) - int(row)) * ((size[1] + 1) % 2)
-
-            ext_info['1CRV{}P'.format(m)] = int(round(column)) - half_tpfsize_col + factory.keywords['CRVAL1P'] - 1
-            ext_info['2CRV{}P'.format(m)] = int(round(row)) - half_tpfsize_row + factory.keywords['CRVAL2P'] - 1
-
-        return factory.get_tpf(hdu0_keywords=allkeys, ext_info=ext_info, **kwargs)
+        return [factory.get_tpf(hdu0_keywords=allkeys,
+                                ext_info=_get_cutout_ext_info(cutout.wcs, size, column, row,
+                                                              factory.keywords),
+                                **kwargs)
+                for factory, cutout, (column, row) in zip(factories, cutouts, pixel_ref)]
 
 
     def plot_pixels(self, ax=None, periodogram=False, aperture_mask=None,
@@ -1454,6 +2422,14 @@ class TargetPixelFile(object):
         Note that all values are autoscaled and axis labels are not provided.
         This utility is designed for by-eye inspection of signal morphology.
 
+        The pixel light curves are obtained using `to_pixel_lightcurves`.
+        By default, the periodograms of all pixels are evaluated on a single
+        frequency grid shared by all pixels; passing keyword arguments other
+        than those defining the grid (``minimum_frequency``,
+        ``maximum_frequency``, ``nyquist_factor``, ``oversample_factor``,
+        and ``ls_method``) falls back to calling `lc.to_periodogram` for
+        every pixel.
+
         Parameters
         ----------
         ax : `~matplotlib.axes.Axes`
@@ -1471,8 +2447,8 @@ class TargetPixelFile(object):
             Inspired by https://github.com/noraeisner/LATTE
         corrector_func : function
             Function that accepts and returns a `~lightkurve.lightcurve.LightCurve`.
-            This function is applied to each light curve in the collection
-            prior to stitching. The default is to normalize each light curve.
+            This function is applied to each pixel light curve prior to
+            plotting. The default is to remove outliers from each light curve.
         style : str
             Path or URL to a matplotlib style file, or name of one of
             matplotlib's built-in stylesheets (e.g. 'ggplot').
@@ -1484,38 +2460,65 @@ class TargetPixelFile(object):
             style = MPLSTYLE
         if title is None:
             title = f'Target ID: {self.targetid}'
-        if corrector_func is None:
-            corrector_func = lambda x: x.remove_outliers()
         if show_flux:
             cmap = plt.get_cmap()
             norm = plt.Normalize(vmin=np.nanmin(self.flux[0].value),
                                  vmax=np.nanmax(self.flux[0].value))
         mask = self._parse_aperture_mask(aperture_mask)
 
+        n_pixels = self.shape[1] * self.shape[2]
+        # Periodograms are computed for all pixels at once on a shared
+        # frequency grid, unless `kwargs` asks for more than the grid options
+        batch_kwargs = {'minimum_frequency', 'maximum_frequency',
+                        'nyquist_factor', 'oversample_factor', 'ls_method'}
+        batch = not periodogram or set(kwargs).issubset(batch_kwargs)
+
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", category=(RuntimeWarning, LightkurveWarning))
 
-            # get an aperture mask for each pixel
-            masks = np.zeros((self.shape[1]*self.shape[2], self.shape[1], self.shape[2]),
-                             dtype='bool')
-            for i in range(self.shape[1]*self.shape[2]):
-                masks[i][np.unravel_index(i, (self.shape[1], self.shape[2]))] = True
-
-            pixel_list = []
-            for j in range(self.shape[1]*self.shape[2]):
-                lc = self.to_lightcurve(aperture_mask=masks[j])
-                lc = corrector_func(lc)
-
-                if periodogram:
-                    try:
-                        pixel_list.append(lc.to_periodogram(**kwargs))
-                    except IndexError:
-                        pixel_list.append(None)
-                else:
-                    if len(lc.remove_nans().flux) == 0:
-                        pixel_list.append(None)
-                    else:
-                        pixel_list.append(lc)
+            # get a (time, pixel) flux matrix, in which NaNs mark the data
+            # points removed by `corrector_func`
+            time = self.time.value
+            lcs = None
+            if corrector_func is None:
+                # vectorized equivalent of `lc.remove_outliers()` for each pixel
+                flux = self.to_pixel_lightcurves(return_array=True)[0].value
+                flux = sigma_clip(flux, sigma=5., axis=0, masked=False)
+            else:
+                lcs = [corrector_func(lc) for lc in self.to_pixel_lightcurves()]
+                flux = np.full((len(self), n_pixels), np.nan)
+                for idx, lc in enumerate(lcs):
+                    pos = np.searchsorted(time, lc.time.value).clip(0, len(time) - 1)
+                    if not np.array_equal(time[pos], lc.time.value):
+                        # `corrector_func` altered the time values
+                        batch = False
+                        break
+                    flux[pos, idx] = lc.flux.value
+
+            # pixel_list contains the (x, y) data to plot for each pixel
+            pixel_list = [None] * n_pixels
+            if batch and periodogram:
+                from .periodogram import _batch_amplitude
+                frequency, power = _batch_amplitude(time, flux, **kwargs)
+                for j in range(n_pixels):
+                    if np.isfinite(power[:, j]).any():
+                        pixel_list[j] = (frequency.value, power[:, j])
+            elif batch:
+                for j in range(n_pixels):
+                    if np.isfinite(flux[:, j]).any():
+                        pixel_list[j] = (time, flux[:, j])
+            else:
+                if lcs is None:
+                    lcs = [lc.remove_outliers() for lc in self.to_pixel_lightcurves()]
+                for j, lc in enumerate(lcs):
+                    if periodogram:
+                        try:
+                            pg = lc.to_periodogram(**kwargs)
+                            pixel_list[j] = (pg.frequency.value, pg.power.value)
+                        except IndexError:
+                            pass
+                    elif len(lc.remove_nans().flux) > 0:
+                        pixel_list[j] = (lc.time.value, lc.flux.value)
 
         with plt.style.context(style):
             fig = plt.figure()
@@ -1530,8 +2533,8 @@ class TargetPixelFile(object):
 
             gs = gridspec.GridSpec(self.shape[1], self.shape[2], wspace=0.01, hspace=0.01)
 
-            for k in range(self.shape[1]*self.shape[2]):
-                if pixel_list[k]:
+            for k in range(n_pixels):
+                if pixel_list[k] is not None:
                     x, y = np.unravel_index(k, (self.shape[1], self.shape[2]))
 
                     # Highlight aperture mask in red
@@ -1551,17 +2554,13 @@ class TargetPixelFile(object):
 
                     # Plot flux or periodogram
                     if periodogram:
-                        gax.plot(pixel_list[k].frequency.value,
-                                 pixel_list[k].power.value,
+                        gax.plot(*pixel_list[k],
                                  marker='None', color=markercolor, lw=0.5)
                     else:
-                        gax.plot(pixel_list[k].time.value,
-                                 pixel_list[k].flux.value,
+                        gax.plot(*pixel_list[k],
                                  marker='.', color=markercolor, ms=0.5, lw=0)
 
                     gax.margins(y=.1, x=0)
-                    gax.set_xticklabels('')
-                    gax.set_yticklabels('')
                     gax.set_xticks([])
                     gax.set_yticks([])
 
@@ -1607,6 +2606,17 @@ class KeplerTargetPixelFile(TargetPixelFile):
         have the effect of removing cadences where
         ``(tpf.hdu[1].data['QUALITY'] & quality_bitmask) > 0``.
         See the :class:`KeplerQualityFlags` class for details on the bitmasks.
+    cadences : slice or array-like, optional
+        Only load a subset of the cadences (i.e. rows) in the file, e.g.
+        ``cadences=slice(1000, 2000)``.  The selection is applied before
+        ``quality_bitmask``.  Because FITS files are memory-mapped by default,
+        passing a slice avoids reading the remaining cadences from disk.
+    columns : list of str, optional
+        Only load a subset of the image columns, e.g. ``columns=['FLUX_ERR']``.
+        The ``FLUX`` column and the one-dimensional columns (``TIME``,
+        ``QUALITY``, etc.) are always loaded.  Columns which are not loaded
+        are left empty, and accessing them (e.g. ``tpf.flux_bkg``) will raise
+        a ``ValueError``.
     **kwargs : dict
         Optional keyword arguments passed on to `astropy.io.fits.open`.
 
@@ -1691,7 +2701,8 @@ class KeplerTargetPixelFile(TargetPixelFile):
         """'Kepler' or 'K2'. ('MISSION' header keyword)"""
         return self.get_keyword('MISSION')
 
-    def extract_aperture_photometry(self, aperture_mask='default', centroid_method='moments'):
+    def extract_aperture_photometry(self, aperture_mask='default', centroid_method='moments',
+                                    chunksize=None):
         """Returns a LightCurve obtained using aperture photometry.
 
         Parameters
@@ -1709,6 +2720,10 @@ class KeplerTargetPixelFile(TargetPixelFile):
         centroid_method : str, 'moments' or 'quadratic'
             For the details on this arguments, please refer to the documentation
             for `TargetPixelFile.estimate_centroids`.
+        chunksize : int, optional
+            If given, the pixel data will be processed in chunks of
+            ``chunksize`` cadences (see `TargetPixelFile.iter_chunks`),
+            which limits the amount of memory used.
 
         Returns
         -------
@@ -1722,7 +2737,14 @@ class KeplerTargetPixelFile(TargetPixelFile):
 
         flux, flux_err, centroid_col, centroid_row = \
             self._aperture_photometry(aperture_mask=aperture_mask,
-                                      centroid_method=centroid_method)
+                                      centroid_method=centroid_method,
+                                      chunksize=chunksize)
+        return self._create_aperture_lightcurve(flux, flux_err, centroid_col,
+                                                centroid_row, aperture_mask)
+
+    def _create_aperture_lightcurve(self, flux, flux_err, centroid_col,
+                                    centroid_row, aperture_mask):
+        """Returns a `KeplerLightCurve` given the results of aperture photometry."""
         keys = {'centroid_col': centroid_col,
                 'centroid_row': centroid_row,
                 'quality': self.quality,
@@ -1860,10 +2882,35 @@ class FactoryError(Exception):
 
 
 class TargetPixelFileFactory(object):
-    """Class to create a TargetPixelFile."""
+    """Class to create a TargetPixelFile.
+
+    By default, the data of all cadences are held in memory until `get_tpf`
+    is called.  If ``path`` is given, the factory instead pre-allocates a
+    pixel file of that name on disk, and `add_cadence` writes each cadence
+    directly into its (memory-mapped) data table.  This enables large pixel
+    files to be assembled with a small amount of memory.
+
+    Parameters
+    ----------
+    n_cadences, n_rows, n_cols : int
+        Dimensions of the pixel data.
+    target_id : int or str
+        Unique identifier of the target.
+    keywords : dict or `~astropy.io.fits.Header`
+        Default keyword values of the data table extension.
+    path : str, optional
+        Path of the pixel file to write the data to.
+    overwrite : bool
+        Whether to overwrite ``path`` if it exists.
+    """
+
+    # Default values of the image columns for cadences that were not added
+    _image_defaults = {'raw_cnts': -1, 'flux': np.nan, 'flux_err': np.nan,
+                       'flux_bkg': np.nan, 'flux_bkg_err': np.nan,
+                       'cosmic_rays': np.nan}
 
     def __init__(self, n_cadences, n_rows, n_cols, target_id="unnamed-target",
-                 keywords=None):
+                 keywords=None, path=None, overwrite=False):
         self.n_cadences = n_cadences
         self.n_rows = n_rows
         self.n_cols = n_cols
@@ -1872,6 +2919,12 @@ class TargetPixelFileFactory(object):
             self.keywords = {}
         else:
             self.keywords = keywords
+        self.path = path
+        self.mjd = np.zeros(n_cadences, dtype='float64')
+
+        if path is not None:
+            self._create_file(overwrite=overwrite)
+            return
 
         # Initialize the 3D data structures
         self.raw_cnts = np.empty((n_cadences, n_rows, n_cols), dtype='int')
@@ -1882,15 +2935,10 @@ class TargetPixelFileFactory(object):
         self.cosmic_rays = np.empty((n_cadences, n_rows, n_cols), dtype='float32')
 
         # Set 3D data defaults
-        self.raw_cnts[:, :, :] = -1
-        self.flux[:, :, :] = np.nan
-        self.flux_err[:, :, :] = np.nan
-        self.flux_bkg[:, :, :] = np.nan
-        self.flux_bkg_err[:, :, :] = np.nan
-        self.cosmic_rays[:, :, :] = np.nan
+        for col, default in self._image_defaults.items():
+            getattr(self, col)[:, :, :] = default
 
         # Initialize the 1D data structures
-        self.mjd = np.zeros(n_cadences, dtype='float64')
         self.time = np.zeros(n_cadences, dtype='float64')
         self.timecorr = np.zeros(n_cadences, dtype='float32')
         self.cadenceno = np.zeros(n_cadences, dtype='int')
@@ -1898,6 +2946,46 @@ class TargetPixelFileFactory(object):
         self.pos_corr1 = np.zeros(n_cadences, dtype='float32')
         self.pos_corr2 = np.zeros(n_cadences, dtype='float32')
 
+    def _create_file(self, overwrite=False):
+        """Writes an empty pixel file to ``self.path`` and memory-maps its data
+        table, such that `add_cadence` can write directly into the file."""
+        if os.path.exists(self.path) and not overwrite:
+            raise OSError('File {} already exists.'.format(self.path))
+        primary = self._make_primary_hdu(hdu0_keywords={})
+        table = fits.BinTableHDU.from_columns(self._target_columns(arrays=False), nrows=0)
+        dtype = table.data.dtype
+        self._make_target_extension(ext_info={}, hdu=table)
+        self._set_column_keywords(table.header)
+        table.header['NAXIS2'] = self.n_cadences
+        # Reserve space for the keywords added by `get_tpf`, such that the
+        # headers can be updated without rewriting the data
+        for header, n_blanks in [(primary.header, 100), (table.header, 200)]:
+            for _ in range(n_blanks):
+                header.add_blank()
+
+        with open(self.path, 'wb') as fobj:
+            fobj.write(primary.header.tostring().encode('ascii'))
+            fobj.write(table.header.tostring().encode('ascii'))
+            data_offset = fobj.tell()
+            # Allocate the data table without writing it; FITS data units
+            # are padded to a multiple of 2880 bytes.
+            nbytes = table.header['NAXIS1'] * self.n_cadences
+            if nbytes > 0:
+                fobj.seek(int(np.ceil(nbytes / 2880.) * 2880) - 1, os.SEEK_CUR)
+                fobj.write(b'\0')
+        with fits.open(self.path, mode='append') as hdulist:
+            hdulist.append(self._make_aperture_extension())
+
+        # FITS tables are stored in big-endian byte order
+        self._data = np.memmap(self.path, dtype=dtype.newbyteorder('>'),
+                               mode='r+', offset=data_offset, shape=(self.n_cadences,))
+        for col in ['time', 'timecorr', 'cadenceno', 'raw_cnts', 'flux', 'flux_err',
+                    'flux_bkg', 'flux_bkg_err', 'cosmic_rays', 'quality',
+                    'pos_corr1', 'pos_corr2']:
+            setattr(self, col, self._data[col.upper()])
+        # Keep track of the cadences which have been populated
+        self._added = np.zeros(self.n_cadences, dtype=bool)
+
     def add_cadence(self, frameno, raw_cnts=None, flux=None, flux_err=None,
                     flux_bkg=None, flux_bkg_err=None, cosmic_rays=None,
                     header=None):
@@ -1906,15 +2994,22 @@ class TargetPixelFileFactory(object):
             raise FactoryError('Can not add cadence {}, n_cadences set to {}'.format(frameno, self.n_cadences))
         if header is None:
             header = {}
+        if self.path is not None and not self._added[frameno]:
+            # Rows of a new file contain zeros rather than the default values
+            self._added[frameno] = True
+            for col, default in self._image_defaults.items():
+                getattr(self, col)[frameno] = default
 
         # 2D-data
-        for col in ['raw_cnts', 'flux', 'flux_err', 'flux_bkg',
-                    'flux_bkg_err', 'cosmic_rays']:
-            if locals()[col] is not None:
-                if locals()[col].shape != (self.n_rows, self.n_cols):
+        images = {'raw_cnts': raw_cnts, 'flux': flux, 'flux_err': flux_err,
+                  'flux_bkg': flux_bkg, 'flux_bkg_err': flux_bkg_err,
+                  'cosmic_rays': cosmic_rays}
+        for col, image in images.items():
+            if image is not None:
+                if image.shape != (self.n_rows, self.n_cols):
                     raise FactoryError('Can not add cadence with a different shape ({} x {})'.format(self.n_rows, self.n_cols))
 
-                vars(self)[col][frameno] = locals()[col]
+                getattr(self, col)[frameno] = image
 
         # 1D-data
         if 'TSTART' in header and 'TSTOP' in header:
@@ -1938,7 +3033,9 @@ class TargetPixelFileFactory(object):
         if ~np.all(self.time == np.sort(self.time)):
             warnings.warn('Cadences in the factory-created TPF do not appear '
                           'to be sorted in chronological order.', LightkurveWarning)
-        if np.nansum(self.flux) == 0:
+        # Sum the flux in chunks to avoid loading a memory-mapped file at once
+        if sum(np.nansum(self.flux[idx:idx + 1000])
+               for idx in range(0, self.n_cadences, 1000)) == 0:
             warnings.warn('The factory-created TPF does not appear to contain '
                           'non-zero flux values.', LightkurveWarning)
 
@@ -1948,9 +3045,20 @@ class TargetPixelFileFactory(object):
             hdu0_keywords = {}
         if ext_info is None:
             ext_info = {}
-        self._check_data()
+        if self.path is None:
+            self._check_data()
+            hdulist = self._hdulist(hdu0_keywords=hdu0_keywords, ext_info=ext_info)
+        else:
+            # Rows which were never added need their default values
+            if not self._added.all():
+                for col, default in self._image_defaults.items():
+                    getattr(self, col)[~self._added] = default
+            self._added[:] = True
+            self._data.flush()
+            self._check_data()
+            self._update_file_headers(hdu0_keywords=hdu0_keywords, ext_info=ext_info)
+            hdulist = fits.open(self.path)
         # Detect filetype
-        hdulist = self._hdulist(hdu0_keywords=hdu0_keywords, ext_info=ext_info)
         filetype = detect_filetype(hdulist)
         if filetype == 'TessTargetPixelFile':
             tpf = TessTargetPixelFile(hdulist, **kwargs)
@@ -1968,15 +3076,39 @@ class TargetPixelFileFactory(object):
                              self._make_target_extension(ext_info=ext_info),
                              self._make_aperture_extension()])
 
+    def _update_file_headers(self, hdu0_keywords, ext_info):
+        """Sets the final header keywords of the file at ``self.path``."""
+        with fits.open(self.path, mode='update') as hdulist:
+            self._make_primary_hdu(hdu0_keywords=hdu0_keywords, hdu=hdulist[0])
+            self._make_target_extension(ext_info=ext_info, hdu=hdulist[1])
+            self._set_column_keywords(hdulist[1].header)
+            self._make_aperture_extension(hdu=hdulist[2])
+
+    def _set_column_keywords(self, header):
+        """Sets the column keywords of a 'TARGETTABLES' header on disk.
+
+        The keywords copied from the header template by `_make_target_extension`
+        need not match the actual columns (e.g. their number of pixels).
+        In memory, astropy corrects these keywords when the table is written,
+        but the header of a file we write to directly must be correct.
+        """
+        table = fits.BinTableHDU.from_columns(self._target_columns(arrays=False), nrows=0)
+        for kw in table.header:
+            if kw == 'TFIELDS' or kw[:5] in ['TTYPE', 'TFORM', 'TUNIT'] or kw[:4] == 'TDIM':
+                header[kw] = table.header[kw]
+
     def _header_template(self, extension):
         """Returns a template `fits.Header` object for a given extension."""
         template_fn = os.path.join(PACKAGEDIR, "data",
                                    "tpf-ext{}-header.txt".format(extension))
         return fits.Header.fromtextfile(template_fn)
 
-    def _make_primary_hdu(self, hdu0_keywords):
-        """Returns the primary extension (#0)."""
-        hdu = fits.PrimaryHDU()
+    def _make_primary_hdu(self, hdu0_keywords, hdu=None):
+        """Returns the primary extension (#0).
+
+        If ``hdu`` is given, its header is populated instead of a new HDU."""
+        if hdu is None:
+            hdu = fits.PrimaryHDU()
         # Copy the default keywords from a template file from the MAST archive
         tmpl = self._header_template(0)
         for kw in tmpl:
@@ -2007,45 +3139,56 @@ class TargetPixelFileFactory(object):
                 hdu.header.append((kw, val))
         return hdu
 
-    def _make_target_extension(self, ext_info):
-        """Create the 'TARGETTABLES' extension (i.e. extension #1)."""
-        # Turn the data arrays into fits columns and initialize the HDU
+    def _target_columns(self, arrays=True):
+        """Returns the `fits.Column` objects of the 'TARGETTABLES' extension.
+
+        If ``arrays=False``, the columns are defined without data."""
+        def array(name):
+            return getattr(self, name) if arrays else None
+
+        # Turn the data arrays into fits columns
         coldim = '({},{})'.format(self.n_cols, self.n_rows)
         eformat = '{}E'.format(self.n_rows * self.n_cols)
         jformat = '{}J'.format(self.n_rows * self.n_cols)
         cols = []
         cols.append(fits.Column(name='TIME', format='D', unit='BJD - 2454833',
-                                array=self.time))
+                                array=array('time')))
         cols.append(fits.Column(name='TIMECORR', format='E', unit='D',
-                                array=self.timecorr))
+                                array=array('timecorr')))
         cols.append(fits.Column(name='CADENCENO', format='J',
-                                array=self.cadenceno))
+                                array=array('cadenceno')))
         cols.append(fits.Column(name='RAW_CNTS', format=jformat,
                                 unit='count', dim=coldim,
-                                array=self.raw_cnts))
+                                array=array('raw_cnts')))
         cols.append(fits.Column(name='FLUX', format=eformat,
                                 unit='e-/s', dim=coldim,
-                                array=self.flux))
+                                array=array('flux')))
         cols.append(fits.Column(name='FLUX_ERR', format=eformat,
                                 unit='e-/s', dim=coldim,
-                                array=self.flux_err))
+                                array=array('flux_err')))
         cols.append(fits.Column(name='FLUX_BKG', format=eformat,
                                 unit='e-/s', dim=coldim,
-                                array=self.flux_bkg))
+                                array=array('flux_bkg')))
         cols.append(fits.Column(name='FLUX_BKG_ERR', format=eformat,
                                 unit='e-/s', dim=coldim,
-                                array=self.flux_bkg_err))
+                                array=array('flux_bkg_err')))
         cols.append(fits.Column(name='COSMIC_RAYS', format=eformat,
                                 unit='e-/s', dim=coldim,
-                                array=self.cosmic_rays))
+                                array=array('cosmic_rays')))
         cols.append(fits.Column(name='QUALITY', format='J',
-                                array=self.quality))
+                                array=array('quality')))
         cols.append(fits.Column(name='POS_CORR1', format='E', unit='pixels',
-                                array=self.pos_corr1))
+                                array=array('pos_corr1')))
         cols.append(fits.Column(name='POS_CORR2', format='E', unit='pixels',
-                                array=self.pos_corr2))
-        coldefs = fits.ColDefs(cols)
-        hdu = fits.BinTableHDU.from_columns(coldefs)
+                                array=array('pos_corr2')))
+        return fits.ColDefs(cols)
+
+    def _make_target_extension(self, ext_info, hdu=None):
+        """Create the 'TARGETTABLES' extension (i.e. extension #1).
+
+        If ``hdu`` is given, its header is populated instead of a new HDU."""
+        if hdu is None:
+            hdu = fits.BinTableHDU.from_columns(self._target_columns())
 
         # Set the header with defaults
         template = self._header_template(1)
@@ -2080,10 +3223,13 @@ class TargetPixelFileFactory(object):
                 hdu.header[kw] = ext_info[kw]
         return hdu
 
-    def _make_aperture_extension(self):
-        """Create the aperture mask extension (i.e. extension #2)."""
-        mask = 3 * np.ones((self.n_rows, self.n_cols), dtype='int32')
-        hdu = fits.ImageHDU(mask)
+    def _make_aperture_extension(self, hdu=None):
+        """Create the aperture mask extension (i.e. extension #2).
+
+        If ``hdu`` is given, its header is populated instead of a new HDU."""
+        if hdu is None:
+            mask = 3 * np.ones((self.n_rows, self.n_cols), dtype='int32')
+            hdu = fits.ImageHDU(mask)
 
         # Set the header from the template TPF again
         template = self._header_template(2)
@@ -2130,6 +3276,17 @@ class TessTargetPixelFile(TargetPixelFile):
         have the effect of removing cadences where
         ``(tpf.hdu[1].data['QUALITY'] & quality_bitmask) > 0``.
         See the :class:`KeplerQualityFlags` class for details on the bitmasks.
+    cadences : slice or array-like, optional
+        Only load a subset of the cadences (i.e. rows) in the file, e.g.
+        ``cadences=slice(1000, 2000)``.  The selection is applied before
+        ``quality_bitmask``.  Because FITS files are memory-mapped by default,
+        passing a slice avoids reading the remaining cadences from disk.
+    columns : list of str, optional
+        Only load a subset of the image columns, e.g. ``columns=['FLUX_ERR']``.
+        The ``FLUX`` column and the one-dimensional columns (``TIME``,
+        ``QUALITY``, etc.) are always loaded.  Columns which are not loaded
+        are left empty, and accessing them (e.g. ``tpf.flux_bkg``) will raise
+        a ``ValueError``.
     kwargs : dict
         Keyword arguments passed to `astropy.io.fits.open()`.
     """
@@ -2144,7 +3301,7 @@ class TessTargetPixelFile(TargetPixelFile):
         # which were not flagged by a QUALITY flag yet; the line below prevents
         # these cadences from being used. They would break most methods!
         if (quality_bitmask != 0) and (quality_bitmask != 'none'):
-            self.quality_mask &= np.isfinite(self.hdu[1].data['TIME'])
+            self.quality_mask = self.quality_mask & np.isfinite(self.hdu[1].data['TIME'])
 
         # check to make sure the correct filetype has been provided
         filetype = detect_filetype(self.hdu)
@@ -2170,7 +3327,7 @@ class TessTargetPixelFile(TargetPixelFile):
     @property
     def background_mask(self):
         """Returns the background mask used by the TESS pipeline."""
-        return self.hdu[2].data & 4 > 0
+        return self._hdu[2].data & 4 > 0
 
     @property
     def sector(self):
@@ -2191,7 +3348,8 @@ class TessTargetPixelFile(TargetPixelFile):
     def mission(self):
         return 'TESS'
 
-    def extract_aperture_photometry(self, aperture_mask='default', centroid_method='moments'):
+    def extract_aperture_photometry(self, aperture_mask='default', centroid_method='moments',
+                                    chunksize=None):
         """Returns a LightCurve obtained using aperture photometry.
 
         Parameters
@@ -2209,6 +3367,10 @@ class TessTargetPixelFile(TargetPixelFile):
         centroid_method : str, 'moments' or 'quadratic'
             For the details on this arguments, please refer to the documentation
             for `TargetPixelFile.estimate_centroids`.
+        chunksize : int, optional
+            If given, the pixel data will be processed in chunks of
+            ``chunksize`` cadences (see `TargetPixelFile.iter_chunks`),
+            which limits the amount of memory used.
 
         Returns
         -------
@@ -2221,7 +3383,14 @@ class TessTargetPixelFile(TargetPixelFile):
 
         flux, flux_err, centroid_col, centroid_row = \
             self._aperture_photometry(aperture_mask=aperture_mask,
-                                      centroid_method=centroid_method)
+                                      centroid_method=centroid_method,
+                                      chunksize=chunksize)
+        return self._create_aperture_lightcurve(flux, flux_err, centroid_col,
+                                                centroid_row, aperture_mask)
+
+    def _create_aperture_lightcurve(self, flux, flux_err, centroid_col,
+                                    centroid_row, aperture_mask):
+        """Returns a `TessLightCurve` given the results of aperture photometry."""
         keys = {'centroid_col': centroid_col,
                 'centroid_row': centroid_row,
                 'quality': self.quality,
@@ -2259,3 +3428,104 @@ class TessTargetPixelFile(TargetPixelFile):
                               flux=np.nansum(self.flux_bkg[:, aperture_mask], axis=1),
                               flux_err=flux_bkg_err,
                               **keys)
+
+
+def create_ffi_cube(images_flux, output_fn, images_flux_err=None, extension=1,
+                    batch_size=32, overwrite=False):
+    """Packs a sequence of full frame images into a single FFI cube file.
+
+    The cube file enables `TargetPixelFile.from_cube` to create cutouts
+    quickly and offline, without having to open every image.  The pixel
+    data are stored with time as the fastest-varying axis, hence the data
+    of a cutout occupy only a few contiguous blocks of the file.
+
+    The file contains the following extensions:
+
+        * 0: header of the middle image, which provides the reference WCS;
+        * 'FLUX': data cube of shape (n_rows, n_cols, n_frames);
+        * 'FLUX_ERR': data cube of the same shape (if `images_flux_err` is given);
+        * 'FRAMES': table containing the TSTART, TSTOP, and full header
+          of each flux image.
+
+    Parameters
+    ----------
+    images_flux : str, list of str, or list of fits.ImageHDU objects
+        Sorted list of FITS filename paths or ImageHDU objects to get
+        the flux data from, or the path of a directory containing the
+        images of a single sector (e.g. TESS FFIs).
+    output_fn : str
+        Path of the cube file to create.
+    images_flux_err : list of str, or list of fits.ImageHDU objects
+        Sorted list of FITS filename paths or ImageHDU objects to get
+        the flux error data from.
+    extension : int or str
+        Extension number or name of the image data in the files.
+        Default: 1.
+    batch_size : int
+        Number of images to hold in memory while writing the cube.
+    overwrite : bool
+        Whether to overwrite `output_fn` if it exists.
+    """
+    if isinstance(images_flux, str):
+        images_flux = sorted(glob.glob(os.path.join(images_flux, '*.fits*')))
+    n_frames = len(images_flux)
+    if n_frames == 0:
+        raise ValueError('One or more images must be passed.')
+    image_lists = {'FLUX': images_flux}
+    if images_flux_err is not None:
+        if len(images_flux_err) != n_frames:
+            raise ValueError('`images_flux_err` must have the same length as `images_flux`.')
+        image_lists['FLUX_ERR'] = images_flux_err
+
+    # Use the middle image as the WCS reference, consistent with `from_fits_images`
+    mid_hdu, mid_hdulist = _open_image(images_flux[int(n_frames / 2) - 1], extension)
+    fits.PrimaryHDU(header=mid_hdu.header.copy(strip=True)).writeto(output_fn,
+                                                                   overwrite=overwrite)
+    cube_shape = mid_hdu.shape + (n_frames,)
+    if mid_hdulist is not None:
+        mid_hdulist.close()
+
+    # Append empty data cubes without allocating them in memory
+    data_offsets = {}
+    with open(output_fn, 'r+b') as fobj:
+        for extname in image_lists:
+            header = fits.ImageHDU(data=np.empty((1, 1, 1), dtype='float32'),
+                                   name=extname).header
+            header['NAXIS1'], header['NAXIS2'], header['NAXIS3'] = cube_shape[::-1]
+            fobj.seek(0, os.SEEK_END)
+            fobj.write(header.tostring().encode('ascii'))
+            data_offsets[extname] = fobj.tell()
+            # FITS data units are padded to a multiple of 2880 bytes
+            nbytes = 4 * np.prod(cube_shape)
+            fobj.seek(int(np.ceil(nbytes / 2880.) * 2880) - 1, os.SEEK_CUR)
+            fobj.write(b'\0')
+
+    # Write the images into the cubes in batches
+    headers, tstart, tstop = [], [], []
+    for extname, images in image_lists.items():
+        cube = np.memmap(output_fn, dtype='>f4', mode='r+',
+                         offset=data_offsets[extname], shape=cube_shape)
+        for start in tqdm(range(0, n_frames, batch_size), desc=extname):
+            frames = []
+            for img in images[start:start + batch_size]:
+                hdu, hdulist = _open_image(img, extension)
+                if extname == 'FLUX':
+                    headers.append(hdu.header.tostring(padding=False))
+                    tstart.append(hdu.header.get('TSTART', np.nan))
+                    tstop.append(hdu.header.get('TSTOP', np.nan))
+                frames.append(np.asarray(hdu.data, dtype='float32'))
+                if hdulist is not None:
+                    hdulist.close()
+            cube[:, :, start:start + len(frames)] = np.stack(frames, axis=-1)
+        cube.flush()
+        del cube
+
+    # Finally, add the table describing the frames
+    table = fits.BinTableHDU.from_columns([
+                fits.Column(name='TSTART', format='D', array=tstart),
+                fits.Column(name='TSTOP', format='D', array=tstop),
+                fits.Column(name='HEADER', format='{}A'.format(max(len(h) for h in headers)),
+                            array=headers)],
+                name='FRAMES')
+    with fits.open(output_fn, mode='append') as hdulist:
+        hdulist.append(table)
@@ -2,7 +2,8 @@ import pytest
 from astropy.utils.data import get_pkg_data_filename
 import matplotlib.pyplot as plt
 import numpy as np
-from numpy.testing import assert_array_equal
+from astropy import units as u
+from numpy.testing import assert_array_equal, assert_allclose
 
 from ..lightcurve import LightCurve
 from ..targetpixelfile import KeplerTargetPixelFile
@@ -43,6 +44,48 @@ def test_collection_stitch():
     lc_stitched2 = lcc.stitch(corrector_func=lambda x: x*2)
     assert_array_equal(lc_stitched.flux*2, lc_stitched2.flux)
 
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_collection_flatten(n_jobs):
+    """Does `LightCurveCollection.flatten` match `LightCurve.flatten`?"""
+    rng = np.random.RandomState(42)
+    lcs = []
+    for size, dtype in [(500, 'f4'), (301, 'f8'), (1000, 'f4')]:
+        time = np.arange(size) * 0.02
+        flux = (1 + 0.01 * np.sin(time) + rng.normal(0, 1e-3, size)).astype(dtype)
+        flux[::37] = np.nan
+        lcs.append(LightCurve(time=time, flux=flux, flux_err=np.full(size, 1e-3)))
+    lcc = LightCurveCollection(lcs)
+    masks = [lc.time.value < 2 for lc in lcs]
+    flat, trend = lcc.flatten(n_jobs=n_jobs, window_length=51, mask=masks,
+                              return_trend=True)
+    assert isinstance(flat, LightCurveCollection)
+    assert len(flat) == len(trend) == len(lcc)
+    for idx, lc in enumerate(lcs):
+        expected_flat, expected_trend = lc.flatten(window_length=51, mask=masks[idx],
+                                                   return_trend=True)
+        assert_array_equal(flat[idx].flux, expected_flat.flux)
+        assert_array_equal(flat[idx].flux_err, expected_flat.flux_err)
+        assert_array_equal(trend[idx].flux, expected_trend.flux)
+    assert_array_equal(lcc.flatten(n_jobs=n_jobs)[1].flux, lcs[1].flatten().flux)
+    with pytest.raises(ValueError):
+        lcc.flatten(mask=masks[:1])
+
+
+def test_collection_estimate_cdpp():
+    """Does `LightCurveCollection.estimate_cdpp` match `LightCurve.estimate_cdpp`?"""
+    rng = np.random.RandomState(42)
+    lcs = [LightCurve(time=np.arange(size), flux=rng.normal(1, 1e-4, size))
+           for size in (500, 1000)]
+    lcc = LightCurveCollection(lcs)
+    cdpp = lcc.estimate_cdpp(transit_duration=[1, 6, 12])
+    assert cdpp.shape == (2, 3)
+    assert cdpp.unit == u.cds.ppm
+    for idx, lc in enumerate(lcs):
+        assert_allclose(cdpp[idx], lc.estimate_cdpp(transit_duration=[1, 6, 12]))
+        assert_allclose(cdpp[idx, 1], lc.estimate_cdpp(transit_duration=6))
+    assert lcc.estimate_cdpp().shape == (2,)
+
+
 def test_collection_getitem():
     """Tests Collection.__getitem__"""
     lc = LightCurve(time=np.arange(1, 5), flux=np.arange(1, 5),
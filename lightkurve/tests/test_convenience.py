@@ -13,3 +13,5 @@ def test_cdpp():
     flux = np.random.normal(loc=1, scale=100e-6, size=10000)
     lc = LightCurve(time=np.arange(10000), flux=flux)
     assert_almost_equal(estimate_cdpp(flux), lc.estimate_cdpp())
+    assert_almost_equal(estimate_cdpp(flux, transit_duration=[6, 12]),
+                        lc.estimate_cdpp(transit_duration=[6, 12]))
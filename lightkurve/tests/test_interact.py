@@ -123,6 +123,8 @@ def test_interact_functions():
     get_lightcurve_y_limits(lc_source)
     make_lightcurve_figure_elements(lc, lc_source)
     make_tpf_figure_elements(tpf, tpf_source)
+    # The pedestal of the log stretch uses the cached minimum flux
+    assert 'minimum' in tpf.summary._cache
     show_interact_widget(tpf)
 
 
@@ -16,7 +16,7 @@ import tempfile
 import warnings
 
 from ..io import read
-from ..lightcurve import LightCurve, KeplerLightCurve, TessLightCurve
+from ..lightcurve import LightCurve, KeplerLightCurve, TessLightCurve, ArrayLightCurve
 from ..lightcurvefile import KeplerLightCurveFile, TessLightCurveFile
 from ..targetpixelfile import KeplerTargetPixelFile, TessTargetPixelFile
 from ..utils import LightkurveWarning, LightkurveDeprecationWarning
@@ -396,6 +396,13 @@ def test_cdpp():
     # Transit_duration must be an integer (cadences)
     with pytest.raises(ValueError):
         lc.estimate_cdpp(transit_duration=6.5)
+    # Several transit durations can be computed at once
+    cdpp = lc.estimate_cdpp(transit_duration=[1, 13, 26])
+    assert cdpp.shape == (3,)
+    for duration, value in zip([1, 13, 26], cdpp):
+        assert_allclose(value, lc.estimate_cdpp(transit_duration=duration))
+    with pytest.raises(ValueError):
+        lc.estimate_cdpp(transit_duration=[1, 6.5])
 
 
 @pytest.mark.remote_data
@@ -496,6 +503,75 @@ def test_bins_kwarg():
     #   - Bins = 310.0
 
 
+def test_bin_matches_aggregate_downsample():
+    """The binning engine must agree with AstroPy's `aggregate_downsample`."""
+    # The bin size is chosen such that no data point lies on a bin edge, where
+    # `aggregate_downsample` depends on rounding errors (cf. `test_bin_regular_cadence`)
+    from astropy.timeseries import aggregate_downsample
+    time = np.arange(2000) * 2 / 1440.
+    flux = np.random.normal(1, 1e-3, len(time))
+    flux[::37] = np.nan
+    flux_err = np.full(len(time), 1e-3)
+    flux_err[::11] = np.nan
+    lc = LightCurve(time=time, flux=flux, flux_err=flux_err,
+                    quality=np.arange(len(time)) % 4)
+    for aggregate_func in [None, np.nanmedian, np.nanmax]:
+        binned_lc = lc.bin(time_bin_size=29.93*u.min, aggregate_func=aggregate_func)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            expected = aggregate_downsample(lc, time_bin_size=29.93*u.min,
+                                            aggregate_func=aggregate_func)
+        assert_allclose(binned_lc.flux.value, expected['flux'].value)
+        assert_allclose(binned_lc.quality.value, expected['quality'].value)
+        assert_allclose(binned_lc.time.value,
+                        (expected.time_bin_start + expected.time_bin_size / 2).value)
+    # The errors combine as the root-mean-square
+    rmse = lambda x: np.sqrt(np.nansum(x**2)) / len(x)
+    expected = aggregate_downsample(lc, time_bin_size=29.93*u.min, aggregate_func=rmse)
+    assert_allclose(binned_lc.flux_err.value, expected['flux_err'].value)
+
+
+def test_bin_cadence_bin_size():
+    """Can we bin by a number of cadences rather than a time interval?"""
+    time = np.arange(10, dtype=float)
+    time[5:] += 0.5  # The bins must not depend on the sampling
+    lc = LightCurve(time=time, flux=np.arange(10), flux_err=np.ones(10))
+    binned_lc = lc.bin(cadence_bin_size=4)
+    assert len(binned_lc) == 3
+    assert_allclose(binned_lc.flux.value, [1.5, 5.5, 8.5])
+    assert_allclose(binned_lc.flux_err.value, [0.5, 0.5, 2**0.5 / 2])
+    # The time is the center of the exposures of the cadences in each bin
+    assert_allclose(binned_lc.time.value, [1.5, 5.75, 9.])
+    assert_allclose(binned_lc.time_bin_size.value, [4, 4.5, 2])
+    # Without uncertainties, the error is the standard deviation of the bin
+    lc = LightCurve(time=time, flux=np.arange(10))
+    assert_allclose(lc.bin(cadence_bin_size=2).flux_err.value, 0.5)
+    with pytest.raises(ValueError):
+        lc.bin(cadence_bin_size=0)
+    with pytest.raises(ValueError):
+        lc.bin(time_bin_size=1, cadence_bin_size=2)
+
+
+def test_bin_regular_cadence():
+    """Do data points on the bin edges consistently fall into the next bin?"""
+    # 2-min cadence data in 30-min bins, i.e. every 15th point lies on an edge
+    time = Time(1325.3 + np.arange(3001) * 2 / 1440., format="btjd")
+    lc = LightCurve(time=time, flux=np.ones(len(time)))
+    binned_lc = lc.bin(time_bin_size=30 * u.min)
+    counts = lc.bin(time_bin_size=30 * u.min, aggregate_func=len).flux.value
+    assert len(binned_lc) == 200
+    # All bins are full, except the last one which holds the end point
+    assert np.all(counts[:-1] == 15)
+    assert counts[-1] == 16
+    # Likewise for bins which are a multiple of an inexact cadence
+    lc = LightCurve(time=np.arange(300) * 0.02, flux=np.ones(300))
+    counts = lc.bin(time_bin_size=0.1, aggregate_func=len).flux.value
+    assert np.all(counts[:-1] == 5)
+    alc = ArrayLightCurve.from_lightcurve(lc)
+    counts = alc.bin(time_bin_size=0.1, aggregate_func=len).flux
+    assert np.all(counts[:-1] == 5)
+
+
 # TEMPORARILY SKIP, cf. https://github.com/KeplerGO/lightkurve/issues/663
 @pytest.mark.xfail
 def test_bin_quality():
@@ -787,6 +863,48 @@ def test_flatten_robustness():
     assert_allclose(lc.flux, flat_lc.flux * trend_lc.flux)
 
 
+def test_flatten_trend_is_savgol():
+    """The trend of a clean light curve is exactly the Savitzky-Golay filter,
+    and the user-supplied mask is not modified."""
+    from scipy.signal import savgol_filter
+    x = np.arange(500, dtype=float)
+    y = (1 + np.sin(x / 50) / 100).astype('f4')
+    lc = LightCurve(time=x, flux=y * u.electron / u.s)
+    mask = np.zeros(len(x), dtype=bool)
+    flat_lc, trend_lc = lc.flatten(window_length=51, sigma=100, mask=mask,
+                                   return_trend=True)
+    expected = savgol_filter(y, window_length=51, polyorder=2).astype(float)
+    assert_array_equal(trend_lc.flux.value, expected)
+    assert trend_lc.flux.unit == lc.flux.unit
+    assert_array_equal(flat_lc.flux.value, y / expected)
+    assert not mask.any()
+
+
+@pytest.mark.parametrize("method", ["median", "biweight"])
+def test_flatten_robust_methods(method):
+    """The robust filters remove the trend but not the transits, and their
+    windows are given in days."""
+    time = np.arange(0, 10, 0.01)
+    trend = 1 + 0.01 * np.sin(time)
+    in_transit = (time % 2) < 0.05
+    flux = trend - 0.01 * in_transit
+    lc = LightCurve(time=time, flux=flux, flux_err=np.full(len(time), 1e-3))
+    # `break_tolerance` is raised such that the clipped transits do not split
+    # the light curve into segments
+    flat_lc, trend_lc = lc.flatten(method=method, window_length=0.5,
+                                   break_tolerance=10, return_trend=True)
+    # Away from the edges, where the windows are one-sided, the trend is recovered
+    interior = (time > 0.5) & (time < 9.5)
+    assert_allclose(trend_lc.flux.value[interior], trend[interior], rtol=1e-3)
+    assert np.all(flat_lc.flux.value[in_transit] < 0.995)
+    # A Quantity window length is converted to days
+    flat_lc2 = lc.flatten(method=method, window_length=12 * u.hour,
+                          break_tolerance=10)
+    assert_array_equal(flat_lc2.flux.value, flat_lc.flux.value)
+    with pytest.raises(ValueError):
+        lc.flatten(method="gaussian")
+
+
 def test_flatten_returns_normalized():
     """Ensure returned lightcurves from flatten() can be normalized"""
     # Test for https://github.com/KeplerGO/lightkurve/issues/838
@@ -851,6 +969,47 @@ def test_fill_gaps():
                     flux=np.array([1, 1, 1, np.nan, np.nan, 1, 1], dtype='<f8'))
     lc.fill_gaps()
 
+    # Deterministic methods interpolate the flux, and extra columns are carried
+    lc = LightCurve(time=[1, 2, 3, 4, 7, 8], flux=[1, 2, 3, 4, 7, 8],
+                    flux_err=[1, 1, 1, 1, 2, 2], centroid_col=[1., 2., 3., 4., 7., 8.],
+                    quality=[0, 0, 1, 0, 0, 0])
+    nlc = lc.fill_gaps(method='linear')
+    assert_array_equal(nlc.time.value, np.arange(1, 9))
+    assert_array_equal(nlc.flux.value, np.arange(1, 9))
+    assert_allclose(nlc.flux_err.value, [1, 1, 1, 1, 4/3, 5/3, 2, 2])
+    assert_array_equal(nlc.quality, [0, 0, 1, 0, 65536, 65536, 0, 0])
+    assert_array_equal(np.isnan(nlc.centroid_col), [0, 0, 0, 0, 1, 1, 0, 0])
+    nlc = lc.fill_gaps(method='nearest')
+    assert_array_equal(nlc.flux.value, [1, 2, 3, 4, 4, 7, 7, 8])
+    with pytest.raises(ValueError):
+        lc.fill_gaps(method='unknown')
+
+    # The cadence numbers define the grid if they are available
+    lc = KeplerLightCurve(time=[1, 2, 3, 4.1, 6, 8], flux=np.ones(6),
+                          cadenceno=[10, 11, 12, 13, 15, 17])
+    nlc = lc.fill_gaps()
+    assert_array_equal(nlc.cadenceno, np.arange(10, 18))
+    assert_allclose(nlc.time.value, [1, 2, 3, 4.1, 5.05, 6, 7, 8])
+
+
+def test_fill_gaps_cdpp_fallback(monkeypatch):
+    """Does `fill_gaps` fall back to the standard deviation only if the
+    CDPP cannot be estimated?"""
+    lc = LightCurve(time=[1, 2, 3, 4, 6, 7, 8], flux=[1, 2, 1, 2, 1, 2, 1])
+
+    def failing_cdpp(self, **kwargs):
+        raise ValueError("too short")
+    monkeypatch.setattr(LightCurve, 'estimate_cdpp', failing_cdpp)
+    nlc = lc.fill_gaps()
+    assert len(nlc) == 8
+    assert np.all(np.isfinite(nlc.flux))
+
+    def broken_cdpp(self, **kwargs):
+        raise TypeError("bug")
+    monkeypatch.setattr(LightCurve, 'estimate_cdpp', broken_cdpp)
+    with pytest.raises(TypeError):
+        lc.fill_gaps()
+
 
 def test_targetid():
     """Is a generic targetid available on each type of LighCurve object?"""
@@ -981,6 +1140,36 @@ def test_river():
     with pytest.warns(LightkurveWarning, match='`bin_points` is too high to plot'):
         folded_lc.plot_river(method='median', bin_points=6)
         plt.close()
+    # The deprecated `t0` argument is renamed into `epoch_time`
+    ax = lc.plot_river(10, epoch_time=1)
+    expected = ax.collections[0].get_array()
+    plt.close()
+    with pytest.warns(LightkurveDeprecationWarning, match='t0'):
+        ax = lc.plot_river(10, t0=1)
+    assert_array_equal(ax.collections[0].get_array(), expected)
+    plt.close()
+
+
+def test_to_river_array():
+    """Does `to_river_array()` return the values shown by `plot_river()`?"""
+    time = np.arange(0, 100, 0.5)
+    lc = LightCurve(time=time, flux=1 + time, flux_err=np.ones(len(time)))
+    phase_edges, cycles, river = lc.to_river_array(10, 0.25)
+    assert river.shape == (len(cycles), len(phase_edges) - 1)
+    assert_array_equal(cycles, np.arange(10))
+    # With about one point per bin, the values are those of the data points
+    values = river[np.isfinite(river)]
+    assert np.all(np.min(np.abs(values[:, np.newaxis] - (1 + time)), axis=1) < 1e-9)
+    assert len(values) > 0.9 * len(time)
+    # The values are averaged in larger bins
+    lc.flux = np.ones(len(time))
+    _, _, river2 = lc.to_river_array(10, 0.25, bin_points=2)
+    assert river2.shape[1] == river.shape[1] // 2
+    assert_allclose(river2[np.isfinite(river2)], 1)
+    # The folded light curve knows its period and epoch
+    for result, expected in zip(lc.fold(10, 0.25).to_river_array(method='median', bin_points=2),
+                                lc.to_river_array(10, 0.25, method='median', bin_points=2)):
+        assert_array_equal(result, expected)
 
 
 # TEMPORARILY SKIP, cf. https://github.com/KeplerGO/lightkurve/issues/663
@@ -1046,6 +1235,56 @@ def test_fold_v2():
     plt.close()
 
 
+def test_fold_matches_timeseries():
+    """Does `fold()` yield the same phases as AstroPy's `TimeSeries.fold()`?"""
+    from astropy.timeseries import TimeSeries
+    time = np.sort(np.random.uniform(0, 10, 200))
+    lc = LightCurve(time=time, flux=np.random.normal(1, 0.01, 200))
+    ts = TimeSeries(time=lc.time, data={'flux': lc.flux})
+    epoch_time = Time(2.3, format=lc.time.format, scale=lc.time.scale)
+    for kwargs in [dict(),
+                   dict(epoch_time=epoch_time),
+                   dict(epoch_time=epoch_time, epoch_phase=0.2 * u.day),
+                   dict(wrap_phase=0.3 * u.day),
+                   dict(epoch_phase=0.1 * u.day, wrap_phase=1.2 * u.day),
+                   dict(normalize_phase=True),
+                   dict(epoch_time=epoch_time, epoch_phase=0.25, normalize_phase=True),
+                   dict(wrap_phase=0.8 * u.one, normalize_phase=True),
+                   dict(epoch_phase=-0.4, wrap_phase=0.1 * u.one, normalize_phase=True)]:
+        fld = lc.fold(period=1.3 * u.day, **kwargs)
+        expected = ts.fold(period=1.3 * u.day, **kwargs)
+        order = np.argsort(fld.time_original.value)
+        expected_phase = expected.time if kwargs.get('normalize_phase') \
+            else expected.time.to(u.day)
+        fld_phase = fld.time if kwargs.get('normalize_phase') else fld.time.to(u.day)
+        assert_allclose(fld_phase.value[order], expected_phase.value, atol=1e-9)
+        assert_allclose(fld.flux.value[order], expected['flux'].value)
+
+
+def test_fold_many():
+    """Does `fold_many()` return the same phases as `fold()`?"""
+    time = np.sort(np.random.uniform(0, 10, 500))
+    lc = LightCurve(time=time, flux=np.random.normal(1, 0.01, 500))
+    periods = [0.7, 1.3, 2.9] * u.day
+    phase = lc.fold_many(periods, epoch_times=[0.1, 0.5, 3.])
+    assert phase.shape == (3, 500)
+    assert phase.dtype == np.float64
+    for idx, period in enumerate([0.7, 1.3, 2.9]):
+        fld = lc.fold(period=period, epoch_time=[0.1, 0.5, 3.][idx], normalize_phase=True)
+        order = np.argsort(fld.time_original.value)
+        assert_allclose(phase[idx], fld.time.value[order], atol=1e-10)
+    # A single epoch defaults to the first time and applies to all periods
+    assert_allclose(lc.fold_many(2.9)[0], lc.fold_many([2.9], epoch_times=time[0])[0])
+    with pytest.raises(ValueError):
+        lc.fold_many([1, 2, 3], epoch_times=[0, 1])
+    # Binned in phase, a constant light curve remains constant
+    lc.flux = np.ones(500)
+    bin_phase, binned_flux = lc.fold_many(periods, n_bins=10)
+    assert_allclose(bin_phase, np.linspace(-0.45, 0.45, 10))
+    assert binned_flux.shape == (3, 10)
+    assert_allclose(binned_flux, 1)
+
+
 @pytest.mark.remote_data
 def test_combine_kepler_tess():
     """Can we append or stitch a TESS light curve to a Kepler light curve?"""
@@ -1142,3 +1381,80 @@ def test_row_repr():
     lc = LightCurve({'time': [1,2,3], 'flux':[1.,1.,1.]})
     lc[0].__repr__()
     lc[0]._repr_html_()
+
+
+def test_array_lightcurve():
+    """Does `ArrayLightCurve` give the same results as `LightCurve`?"""
+    rng = np.random.RandomState(42)
+    time = 1000 + np.arange(2000) * 0.02
+    flux = 500 + 5 * np.sin(time) + rng.normal(0, 1, len(time))
+    flux[::97] = np.nan
+    flux[50] = 1000
+    lc = LightCurve(time=Time(time, format='btjd'), flux=flux * u.electron / u.s,
+                    flux_err=np.ones(len(time)) * u.electron / u.s,
+                    meta={'targetid': 5})
+    alc = ArrayLightCurve.from_lightcurve(lc)
+    assert len(alc) == len(lc)
+    assert alc.time_format == 'btjd'
+    assert alc.flux_unit == u.electron / u.s
+
+    # Round trip
+    lc2 = alc.to_lightcurve()
+    assert isinstance(lc2, LightCurve)
+    assert_array_equal(lc2.time.value, lc.time.value)
+    assert lc2.time.format == 'btjd'
+    assert_array_equal(lc2.flux, lc.flux)
+    assert lc2.targetid == 5
+    assert isinstance(alc.to_lightcurve(lc_class=TessLightCurve), TessLightCurve)
+
+    # The main methods
+    expected = lc.remove_nans().remove_outliers(sigma=4).normalize('ppm')
+    result = alc.remove_nans().remove_outliers(sigma=4).normalize('ppm')
+    assert_array_equal(result.time, expected.time.value)
+    assert_allclose(result.flux, expected.flux.value)
+    assert result.flux_unit == u.cds.ppm
+    assert result.meta['normalized']
+    assert 'normalized' not in alc.meta
+    expected, expected_trend = lc.flatten(window_length=51, return_trend=True)
+    result, trend = alc.flatten(window_length=51, return_trend=True)
+    assert_allclose(result.flux, expected.flux.value)
+    assert_allclose(trend.flux, expected_trend.flux.value)
+    expected = lc.bin(time_bin_size=0.3141)
+    result = alc.bin(time_bin_size=0.3141)
+    assert_allclose(result.time, expected.time.value)
+    assert_allclose(result.flux, expected.flux.value)
+    assert_allclose(result.flux_err, expected.flux_err.value)
+    assert_allclose(alc.estimate_cdpp(transit_duration=[6, 12]),
+                    lc.estimate_cdpp(transit_duration=[6, 12]))
+
+    # Folding yields the phases of `LightCurve.fold`
+    for kwargs in [dict(), dict(epoch_time=1003.3, epoch_phase=0.1, wrap_phase=0.8),
+                   dict(epoch_time=Time(1003.3, format='btjd'), normalize_phase=True)]:
+        expected = lc.fold(period=1.7123, **kwargs)
+        result = alc.fold(period=1.7123, **kwargs)
+        if kwargs.get('normalize_phase'):
+            assert_allclose(result.time, expected.time.value, atol=1e-10)
+        else:
+            assert_allclose(result.time, expected.time.to_value(u.day), atol=1e-10)
+        assert_allclose(result.flux, expected.flux.value)
+        assert result.time_format is None
+    assert_allclose(alc.fold(period=1.7, normalize_phase=True).bin(0.1, -0.5).time,
+                    np.arange(-0.45, 0.5, 0.1))
+    with pytest.raises(ValueError):
+        alc.fold(period=1.7).to_lightcurve()
+    with pytest.raises(ValueError):
+        alc.fold(period=1.7, wrap_phase=2)
+
+    # Integers select a single cadence
+    assert len(alc[5]) == 1
+    assert_array_equal(alc[-1].time, alc.time[-1:])
+    with pytest.raises(IndexError):
+        alc[len(alc)]
+
+    # Slices share the data of the original, copies are independent
+    sliced = alc[10:20]
+    assert len(sliced) == 10
+    assert np.shares_memory(sliced.flux, alc.flux)
+    copied = alc.copy()
+    copied.flux[0] = 0
+    assert alc.flux[0] != 0
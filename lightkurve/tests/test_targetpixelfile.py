@@ -6,7 +6,7 @@ import warnings
 
 import matplotlib.pyplot as plt
 import numpy as np
-from numpy.testing import assert_array_equal
+from numpy.testing import assert_array_equal, assert_allclose
 import pytest
 
 from astropy.utils.data import get_pkg_data_filename
@@ -20,6 +20,7 @@ from astropy.utils.exceptions import AstropyWarning
 
 from ..targetpixelfile import KeplerTargetPixelFile, TargetPixelFileFactory
 from ..targetpixelfile import TessTargetPixelFile, TargetPixelFile
+from ..targetpixelfile import create_ffi_cube
 from ..lightcurve import TessLightCurve
 from ..utils import LightkurveWarning, LightkurveDeprecationWarning
 from ..io import read
@@ -300,6 +301,36 @@ def test_tpf_to_fits():
             os.remove(tmp.name)
 
 
+def test_tpf_factory_on_disk():
+    """Can TargetPixelFileFactory write the data directly to a file?"""
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        path = os.path.join(tmpdirname, 'tpf.fits')
+        factories = [TargetPixelFileFactory(n_cadences=10, n_rows=6, n_cols=8),
+                     TargetPixelFileFactory(n_cadences=10, n_rows=6, n_cols=8, path=path)]
+        for factory in factories:
+            for frameno in range(9):
+                factory.add_cadence(frameno=frameno, flux=frameno * np.ones((6, 8)),
+                                    raw_cnts=np.ones((6, 8)) if frameno == 2 else None,
+                                    header={'TSTART': 10 * frameno, 'TSTOP': 10 * frameno + 5,
+                                            'QUALITY': frameno})
+        tpf, tpf_disk = [factory.get_tpf(hdu0_keywords={'TELESCOP': 'TESS'})
+                         for factory in factories]
+        assert isinstance(tpf_disk, TessTargetPixelFile)
+        for col in tpf.hdu[1].columns.names:
+            assert_array_equal(tpf_disk.hdu[1].data[col], tpf.hdu[1].data[col])
+        # Cadences which were not added contain the default values
+        assert np.isnan(tpf_disk.hdu[1].data['FLUX'][9]).all()
+        assert (tpf_disk.hdu[1].data['RAW_CNTS'][[0, 9]] == -1).all()
+        # The file on disk is a valid pixel file
+        tpf_read = read(path)
+        assert tpf_read.get_keyword('TELESCOP') == 'TESS'
+        assert tpf_read.hdu[1].header['TFORM5'] == '48E'
+        assert_array_equal(tpf_read.flux, tpf.flux)
+        # We do not overwrite existing files by default
+        with pytest.raises(OSError):
+            TargetPixelFileFactory(n_cadences=10, n_rows=6, n_cols=8, path=path)
+
+
 def test_tpf_factory():
     """Can we create TPFs using TargetPixelFileFactory?"""
     from lightkurve.targetpixelfile import FactoryError
@@ -429,6 +460,16 @@ def test_tpf_from_images():
         tpf_hdus = TargetPixelFile.from_fits_images(hdus,
                             size=(3, 3),
                             position=SkyCoord(ra, dec, unit=(u.deg, u.deg)))
+        assert_array_equal(tpf_hdus.hdu[1].data['FLUX'],
+                           tpf_tmpfiles.hdu[1].data['FLUX'])
+
+        # Reading the files in parallel should yield the same result
+        tpf_parallel = TargetPixelFile.from_fits_images(tmpfile_names,
+                            size=(3, 3), parallel=True,
+                            position=SkyCoord(ra, dec, unit=(u.deg, u.deg)))
+        for col in ['FLUX', 'POS_CORR1', 'POS_CORR2']:
+            assert_array_equal(tpf_parallel.hdu[1].data[col],
+                               tpf_tmpfiles.hdu[1].data[col])
 
         # Clean up the temporary files we created
         for filename in tmpfile_names:
@@ -472,6 +513,72 @@ def test_tpf_wcs_from_images():
         assert tpf.wcs.to_header()['CDELT1'] == w.wcs.cdelt[0]
 
 
+def test_tpf_from_images_bulk():
+    """Does tpf.from_fits_images_bulk() agree with tpf.from_fits_images()?"""
+    w = wcs.WCS(naxis=2)
+    w.wcs.crpix = [0., 0.]
+    w.wcs.cdelt = np.array([0.001111, 0.001111])
+    w.wcs.crval = [23.2334, 45.2333]
+    w.wcs.ctype = ["RA---TAN", "DEC--TAN"]
+    header = w.to_header()
+    header['CRVAL1P'] = 10
+    header['CRVAL2P'] = 20
+    images = _create_image_array(header=header, shape=(10, 10))
+    for idx, img in enumerate(images):
+        img.data = np.random.RandomState(idx).rand(10, 10)
+
+    # The first position is near the edge of the images
+    positions = SkyCoord([23.2336, 23.2435], [45.235, 45.241], unit='deg')
+    tpfs = TargetPixelFile.from_fits_images_bulk(images, positions, size=(3, 4),
+                                                 target_ids=['a', 'b'])
+    assert len(tpfs) == 2
+    for tpf, position, target_id in zip(tpfs, positions, ['a', 'b']):
+        expected = TargetPixelFile.from_fits_images(images, position, size=(3, 4),
+                                                    target_id=target_id)
+        assert tpf.get_keyword('OBJECT') == target_id
+        assert tpf.hdu[1].header['1CRV5P'] == expected.hdu[1].header['1CRV5P']
+        for col in ['FLUX', 'TIME', 'POS_CORR1', 'POS_CORR2']:
+            assert_array_equal(tpf.hdu[1].data[col], expected.hdu[1].data[col])
+
+    with pytest.raises(ValueError):
+        TargetPixelFile.from_fits_images_bulk(images, positions, target_ids=['a'])
+
+
+def test_tpf_from_cube():
+    """Does tpf.from_cube() agree with tpf.from_fits_images()?"""
+    w = wcs.WCS(naxis=2)
+    w.wcs.crpix = [0., 0.]
+    w.wcs.cdelt = np.array([0.001111, 0.001111])
+    w.wcs.crval = [23.2334, 45.2333]
+    w.wcs.ctype = ["RA---TAN", "DEC--TAN"]
+    header = w.to_header()
+    header['CRVAL1P'] = 10
+    header['CRVAL2P'] = 20
+    images = _create_image_array(header=header, shape=(10, 12))
+    for idx, img in enumerate(images):
+        # The cube stores single-precision values
+        img.data = np.random.RandomState(idx).rand(10, 12).astype('float32')
+
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        cube_fn = os.path.join(tmpdirname, 'cube.fits')
+        create_ffi_cube(images, cube_fn, images_flux_err=images, batch_size=2)
+        with fits.open(cube_fn) as hdulist:
+            # Time is the fastest axis
+            assert hdulist['FLUX'].shape == (10, 12, 5)
+            assert_array_equal(hdulist['FLUX'].data[:, :, 3], images[3].data)
+            assert_array_equal(hdulist['FRAMES'].data['TSTART'], np.arange(5))
+
+        # The first position is near the edge of the images
+        for position in SkyCoord([23.2336, 23.2435], [45.235, 45.241], unit='deg'):
+            tpf = TargetPixelFile.from_cube(cube_fn, position, size=(3, 4))
+            expected = TargetPixelFile.from_fits_images(images, position, size=(3, 4),
+                                                        images_flux_err=images)
+            assert tpf.hdu[1].header['1CRV5P'] == expected.hdu[1].header['1CRV5P']
+            assert tpf.hdu[1].header['1CRPX5'] == expected.hdu[1].header['1CRPX5']
+            for col in ['FLUX', 'FLUX_ERR', 'TIME', 'POS_CORR1', 'POS_CORR2']:
+                assert_array_equal(tpf.hdu[1].data[col], expected.hdu[1].data[col])
+
+
 def test_properties2(capfd):
     '''Test if the describe function produces an output.
     The output is 1870 characters at the moment, but we might add more properties.'''
@@ -674,9 +781,84 @@ def test_plot_pixels():
     tpf.plot_pixels(aperture_mask=tpf.create_threshold_mask())
     tpf.plot_pixels(show_flux=True)
     tpf.plot_pixels(corrector_func=lambda x:x)
+    tpf.plot_pixels(periodogram=True, corrector_func=lambda x: x.normalize())
+    tpf.plot_pixels(periodogram=True, corrector_func=lambda x: x.fold(period=1.))
     plt.close('all')
 
 
+def test_summary():
+    """Are the summary images computed once and shared by the mask methods?"""
+    tpf = TessTargetPixelFile(filename_tess)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        median_image = np.nanmedian(tpf.flux, axis=0)
+        assert_array_equal(tpf.summary.median_image, median_image)
+        assert_array_equal(tpf.summary.mean_image, np.nanmean(tpf.flux, axis=0))
+        assert_array_equal(tpf.summary.mad_image,
+                           np.nanmedian(np.abs(tpf.flux - median_image), axis=0))
+        assert_array_equal(tpf.summary.percentile_image([5, 95]),
+                           np.nanpercentile(tpf.flux, [5, 95], axis=0))
+        assert_array_equal(tpf.summary.percentile(99), np.nanpercentile(tpf.flux, 99))
+        assert tpf.summary.minimum == np.nanmin(tpf.flux)
+    assert tpf.summary.percentile_image(5).shape == tpf.shape[1:]
+    # The statistics are computed only once
+    assert tpf.summary is tpf.summary
+    assert tpf.summary.median_image is tpf.summary.median_image
+    with pytest.raises(ValueError):
+        tpf.summary.median_image[0, 0] = 0
+    # The threshold masks use the cached median image
+    summary = tpf.summary
+    tpf.create_threshold_mask()
+    tpf._parse_aperture_mask('background')
+    assert summary._cache.keys() == {'median_image', 'mean_image', 'mad_image',
+                                     ('percentile_image', 1, 5, 95),
+                                     ('percentile_image', 0, 5),
+                                     ('percentile', 0, 99), 'minimum'}
+    # The summary is recomputed when the quality mask changes
+    tpf.quality_mask = tpf.quality_mask & (np.arange(len(tpf.quality_mask)) > 2)
+    assert tpf.summary is not summary
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        assert_array_equal(tpf.summary.median_image, np.nanmedian(tpf.flux, axis=0))
+    # ... and when the flux is modified
+    tpf = TessTargetPixelFile(filename_tess)
+    tpf.summary.median_image
+    tpf2 = tpf + 10
+    assert_allclose(tpf2.summary.median_image.value, tpf.summary.median_image.value + 10,
+                    rtol=1e-6)
+
+
+def test_to_pixel_lightcurves():
+    """Are the pixel light curves identical to single-pixel apertures?"""
+    from ..periodogram import _batch_amplitude
+    tpf = TessTargetPixelFile(filename_tess)
+    lcs = tpf.to_pixel_lightcurves()
+    flux, flux_err = tpf.to_pixel_lightcurves(return_array=True)
+    n_pixels = tpf.shape[1] * tpf.shape[2]
+    assert len(lcs) == n_pixels
+    assert flux.shape == flux_err.shape == (len(tpf), n_pixels)
+    for idx in [0, 7, n_pixels - 1]:
+        mask = np.zeros(tpf.shape[1:], dtype=bool)
+        mask[np.unravel_index(idx, tpf.shape[1:])] = True
+        lc = tpf.to_lightcurve(aperture_mask=mask)
+        assert_array_equal(lcs[idx].flux, lc.flux)
+        assert_array_equal(flux[:, idx], lc.flux)
+        assert_allclose(lcs[idx].flux_err.value, lc.flux_err.value, rtol=1e-6)
+        assert_allclose(lcs[idx].centroid_col.value, lc.centroid_col.value)
+        assert_allclose(lcs[idx].centroid_row.value, lc.centroid_row.value)
+        assert_array_equal(lcs[idx].meta['aperture_mask'], mask)
+    # The batched periodograms match those of the individual light curves
+    flux = flux.value.copy()
+    flux[5:9, 0] = np.nan
+    frequency, power = _batch_amplitude(tpf.time.value, flux, chunksize=1000)
+    assert power.shape == (len(frequency), n_pixels)
+    for idx in [0, 7, n_pixels - 1]:
+        lc = lcs[idx].copy()
+        lc.flux = flux[:, idx] * lc.flux.unit
+        pg = lc.remove_nans().to_periodogram(frequency=frequency, ls_method='slow')
+        assert_allclose(pg.power.value, power[:, idx], rtol=1e-6)
+
+
 @pytest.mark.remote_data
 def test_missing_pipeline_mask():
     """Regression test for #791.
@@ -727,3 +909,283 @@ def test_estimate_background():
     bg = tpf.estimate_background(aperture_mask='all')
     assert_array_equal(bg.flux.value, 100)
     assert bg.flux.unit == tpf.flux.unit / u.pixel
+    for method in ['percentile', 'sigma_clip', 'biweight']:
+        bg = tpf.estimate_background(aperture_mask='all', method=method)
+        assert_array_equal(bg.flux.value, 100)
+        assert bg.flux.unit == tpf.flux.unit / u.pixel
+    with pytest.raises(ValueError):
+        tpf.estimate_background(method='mean')
+
+
+def test_estimate_background_methods():
+    """Do the alternative background statistics agree with numpy/astropy?"""
+    from astropy.stats import sigma_clipped_stats, biweight_location
+    tpf = TessTargetPixelFile(filename_tess)
+    flux = tpf.flux[:, tpf._parse_aperture_mask('background')].value
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        expected = {'median': np.nanmedian(flux, axis=1),
+                    'percentile': np.nanpercentile(flux, 10, axis=1),
+                    'sigma_clip': sigma_clipped_stats(flux, sigma=2, axis=1)[0],
+                    'biweight': biweight_location(flux, axis=1, ignore_nan=True)}
+    for method, values in expected.items():
+        bg = tpf.estimate_background(method=method, percentile=10, sigma=2)
+        assert_allclose(bg.flux.value, values, rtol=1e-6)
+        # Chunked and concurrent evaluation yields the same result
+        bg_chunked = tpf.estimate_background(method=method, percentile=10, sigma=2,
+                                             chunksize=3, n_workers=2)
+        assert_allclose(bg_chunked.flux.value, bg.flux.value, rtol=1e-12)
+        bg_workers = tpf.estimate_background(method=method, percentile=10, sigma=2,
+                                             n_workers=3)
+        assert_allclose(bg_workers.flux.value, bg.flux.value, rtol=1e-12)
+
+
+def test_concurrent_chunks_scaled_columns():
+    """Are chunks of a file with scaled (TSCAL/TZERO) columns processed
+    correctly by several threads?"""
+    tpf = TessTargetPixelFile(filename_tess)
+    hdulist = TessTargetPixelFile(filename_tess).hdu
+    cols = []
+    for col in hdulist[1].columns:
+        if col.name == 'FLUX':
+            # Store the flux as scaled integers
+            raw = np.round(np.nan_to_num(col.array) * 10).astype(np.int32)
+            col = fits.Column(name='FLUX', format='{}J'.format(col.format.repeat),
+                              dim=col.dim, unit=col.unit, array=raw)
+        cols.append(col)
+    hdulist[1] = fits.BinTableHDU.from_columns(cols, header=hdulist[1].header)
+    hdulist[1].header['TSCAL5'] = 0.1
+    hdulist[1].header['TZERO5'] = 0.
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        path = os.path.join(tmpdirname, 'scaled.fits')
+        hdulist.writeto(path)
+        scaled = read(path)
+        assert scaled.hdu[1].columns['FLUX'].bscale == 0.1
+        assert_allclose(scaled.flux.value, np.nan_to_num(tpf.flux.value), atol=0.05)
+        for method in ['median', 'sigma_clip']:
+            bg = scaled.estimate_background(method=method)
+            bg_workers = scaled.estimate_background(method=method, chunksize=3,
+                                                    n_workers=4)
+            assert_allclose(bg_workers.flux.value, bg.flux.value, rtol=1e-12)
+
+
+def test_data_cache():
+    """Are the quality-masked data arrays cached and invalidated correctly?"""
+    tpf = read(filename_tpf_one_center)
+    assert tpf.cache_nbytes == 0
+    flux = tpf.flux
+    # Repeated access should return the very same object
+    assert tpf.flux is flux
+    # The cached `Quantity` shares its memory with the cached column
+    assert tpf.cache_nbytes == flux.nbytes
+    assert tpf.time is tpf.time
+    # Cached arrays are read-only
+    with pytest.raises(ValueError):
+        flux[0, 0, 0] = 1.
+    # The quality mask cannot be modified in place, which would leave the
+    # cache stale, but changing the quality mask invalidates the cache
+    with pytest.raises(ValueError):
+        tpf.quality_mask[0] = False
+    tpf.quality_mask = np.zeros_like(tpf.quality_mask)
+    assert tpf.cache_nbytes == 0
+    assert len(tpf.flux) == 0
+    # So does changing the bitmask or the hdu
+    tpf.quality_bitmask = 'hardest'
+    assert tpf.cache_nbytes == 0
+    tpf.flux
+    tpf.hdu = tpf.hdu
+    assert tpf.cache_nbytes == 0
+    # Modifying the data in place requires the cache to be cleared manually
+    tpf = read(filename_tpf_one_center)
+    tpf.flux
+    tpf.hdu[1].data['FLUX'][tpf.quality_mask] += 1
+    tpf.clear_cache()
+    assert_array_equal(tpf.flux.value, tpf.hdu[1].data['FLUX'][tpf.quality_mask])
+
+
+def test_load_subset():
+    """Can we load a subset of the cadences and columns of a TPF?"""
+    tpf = read(filename_tess, quality_bitmask='none')
+    # Cadence subset
+    tpf_sub = read(filename_tess, quality_bitmask='none', cadences=slice(1, 3))
+    assert len(tpf_sub) == 2
+    assert_array_equal(tpf_sub.flux, tpf.flux[1:3])
+    assert_array_equal(tpf_sub.cadenceno, tpf.cadenceno[1:3])
+    # Column subset
+    tpf_sub = read(filename_tess, quality_bitmask='none', columns=['FLUX_ERR'])
+    assert_array_equal(tpf_sub.flux, tpf.flux)
+    assert_array_equal(tpf_sub.flux_err, tpf.flux_err)
+    assert tpf_sub.hdu[1].data.itemsize < tpf.hdu[1].data.itemsize
+    assert tpf_sub.column == tpf.column
+    with pytest.raises(ValueError, match="was not loaded"):
+        tpf_sub.flux_bkg
+    # Both
+    tpf_sub = TessTargetPixelFile(filename_tess, quality_bitmask='none',
+                                  cadences=[0, 3], columns=['flux_err'])
+    assert_array_equal(tpf_sub.flux, tpf.flux[[0, 3]])
+    assert_array_equal(tpf_sub.time.value, tpf.time.value[[0, 3]])
+    lc = tpf_sub.to_lightcurve(aperture_mask='all')
+    assert len(lc) == 2
+    # The subset can be written to disk
+    with tempfile.NamedTemporaryFile(suffix='.fits') as tmp:
+        tpf_sub.to_fits(tmp.name, overwrite=True)
+        assert_array_equal(read(tmp.name, quality_bitmask='none').flux, tpf_sub.flux)
+
+
+def test_tpf_slicing_view():
+    """Does slicing a TPF return a view rather than a copy?"""
+    # Row #4 of this file has QUALITY=8192, which introduces a gap
+    tpf = read(filename_tpf_one_center, quality_bitmask=8192)
+    frames = tpf[4:8]
+    assert np.shares_memory(frames.hdu[1].data, tpf.hdu[1].data)
+    assert len(frames.hdu[1].data) == 4
+    assert_array_equal(frames.time.value, tpf.time.value[4:8])
+    assert_array_equal(frames.flux, tpf.flux[4:8])
+    assert_array_equal(frames[1:3].flux, tpf.flux[5:7])
+    # Data is materialized when writing the view to disk
+    with tempfile.NamedTemporaryFile(suffix='.fits') as tmp:
+        frames.to_fits(tmp.name, overwrite=True)
+        assert_array_equal(read(tmp.name, quality_bitmask=8192).flux, frames.flux)
+    # A slice across the gap is a copy which excludes the bad-quality row
+    frames = tpf[2:6]
+    assert not np.shares_memory(frames.hdu[1].data, tpf.hdu[1].data)
+    assert len(frames.hdu[1].data) == 4
+    assert_array_equal(frames.flux, tpf.flux[2:6])
+    with tempfile.NamedTemporaryFile(suffix='.fits') as tmp:
+        frames.to_fits(tmp.name, overwrite=True)
+        with fits.open(tmp.name) as hdulist:
+            assert len(hdulist[1].data) == 4
+        assert_array_equal(read(tmp.name, quality_bitmask='none').flux, tpf.flux[2:6])
+    # Other keys yield a copy
+    frames = tpf[::2]
+    assert not np.shares_memory(frames.hdu[1].data, tpf.hdu[1].data)
+    assert_array_equal(frames.flux, tpf.flux[::2])
+    # A quality mask modified by hand is respected
+    quality_mask = tpf.quality_mask.copy()
+    quality_mask[7] = False
+    tpf.quality_mask = quality_mask
+    assert_array_equal(tpf[5:10].flux, tpf.flux[5:10])
+    assert len(tpf[5:10].hdu[1].data) == 5
+
+
+def test_aperture_photometry_batch():
+    """Does batched photometry agree with `extract_aperture_photometry`?"""
+    for tpf in [read(filename_tpf_one_center), read(filename_tess)]:
+        # Set all the pixels of the third good-quality cadence to NaN
+        tpf.hdu[1].data['FLUX'][np.where(tpf.quality_mask)[0][2]] = np.nan
+        # Set one pixel of the fourth cadence to infinity
+        tpf.hdu[1].data['FLUX'][np.where(tpf.quality_mask)[0][3], 0, 0] = np.inf
+        masks = np.random.RandomState(42).rand(4, *tpf.shape[1:]) > 0.5
+        masks[0] = True
+        masks[1, 0, 0] = False
+        lcs = tpf.extract_aperture_photometry_batch(masks)
+        assert len(lcs) == len(masks)
+        for mask, lc in zip(masks, lcs):
+            expected = tpf.extract_aperture_photometry(aperture_mask=mask)
+            assert type(lc) == type(expected)
+            assert_array_equal(lc.meta['aperture_mask'], mask)
+            for col in ['flux', 'flux_err', 'centroid_col', 'centroid_row']:
+                assert lc[col].unit == expected[col].unit
+                np.testing.assert_allclose(lc[col].value, expected[col].value,
+                                           rtol=1e-5)
+        flux, flux_err, col, row = tpf.extract_aperture_photometry_batch(masks, return_array=True)
+        assert flux.shape == (len(tpf), len(masks))
+        assert np.isnan(flux[2]).all()
+        # The infinite pixel only affects the apertures which contain it
+        assert np.isinf(flux[3, 0])
+        assert np.isfinite(flux[3, 1])
+    with pytest.raises(ValueError):
+        tpf.extract_aperture_photometry_batch(np.ones((2, 3, 4), dtype=bool))
+
+
+def test_tpf_math_copy_on_write():
+    """Do the arithmetic operators avoid copying the whole data table?"""
+    tpf = read(filename_tpf_one_center)
+    flux, flux_err = tpf.flux.copy(), tpf.flux_err.copy()
+    new = (tpf - 1) * 2
+    # The new object shares the data table and only holds modified columns
+    assert new._hdu is tpf._hdu
+    assert set(new._pending_columns) == {'FLUX', 'FLUX_ERR'}
+    assert_array_equal(new.flux.value, (flux.value - 1) * 2)
+    assert_array_equal(new.flux_err.value, flux_err.value * 2)
+    assert_array_equal(new.to_lightcurve(aperture_mask='all').flux.value,
+                       np.nansum(new.flux.value, axis=(1, 2)))
+    # The original object was not modified
+    assert_array_equal(tpf.flux, flux)
+    assert_array_equal(tpf.hdu[1].data['FLUX'][tpf.quality_mask], flux.value)
+    # `hdu` returns a new data table which includes the modified columns,
+    # without changing the state of the object
+    assert_array_equal(new.hdu[1].data['FLUX'][new.quality_mask], new.flux.value)
+    assert_array_equal(new.hdu[1].data['TIME'], tpf.hdu[1].data['TIME'])
+    assert new.hdu is not tpf.hdu
+    assert new._hdu is tpf._hdu
+    assert set(new._pending_columns) == {'FLUX', 'FLUX_ERR'}
+    assert new.get_header(1) is tpf.get_header(1)
+    # Slices and writes include the modified columns
+    assert_array_equal(new[2:5].flux, new.flux[2:5])
+    assert_array_equal(new[::2].flux, new.flux[::2])
+    with tempfile.NamedTemporaryFile(suffix='.fits') as tmp:
+        new.to_fits(tmp.name, overwrite=True)
+        assert_array_equal(read(tmp.name).flux, new.flux)
+    # In-place arithmetic modifies the object without copying the table
+    other = read(filename_tpf_one_center)
+    hdu = other.hdu
+    other += 1
+    other *= 2
+    assert other.hdu is hdu
+    assert_array_equal(other.flux.value, (flux.value + 1) * 2)
+    # In-place arithmetic does not modify objects which share the data
+    new = other + 1
+    other -= 2
+    assert_array_equal(new.flux.value, (flux.value + 1) * 2 + 1)
+    assert_array_equal(other.flux.value, (flux.value + 1) * 2 - 2)
+    new /= 2
+    assert_array_equal(other.flux.value, (flux.value + 1) * 2 - 2)
+    frames = other[2:5]
+    frames -= 1
+    assert_array_equal(other.flux.value, (flux.value + 1) * 2 - 2)
+    assert_array_equal(frames.flux.value, other.flux.value[2:5] - 1)
+
+
+def test_get_coordinates_cadences():
+    """Does `get_coordinates` agree for single cadences and all cadences?"""
+    tpf = read(filename_tess)
+    ra, dec = tpf.get_coordinates()
+    assert ra.shape == dec.shape == tpf.shape
+    for cadence in [0, 2, -1]:
+        ra_cad, dec_cad = tpf.get_coordinates(cadence=cadence)
+        assert ra_cad.shape == tpf.shape[1:]
+        assert_array_equal(ra_cad, ra[cadence])
+        assert_array_equal(dec_cad, dec[cadence])
+    ra_cad, dec_cad = tpf.get_coordinates(cadence=slice(1, 3))
+    assert_array_equal(ra_cad, ra[1:3])
+    assert_array_equal(dec_cad, dec[1:3])
+    # The WCS object is cached
+    assert tpf.wcs is tpf.wcs
+
+
+def test_iter_chunks():
+    """Do the chunked versions of the photometry methods agree with the defaults?"""
+    tpf = read(filename_tess)
+    chunks = list(tpf.iter_chunks(3))
+    assert [len(chunk) for chunk in chunks] == [3, len(tpf) - 3]
+    assert_array_equal(chunks[1].flux, tpf.flux[3:])
+    with pytest.raises(ValueError):
+        next(tpf.iter_chunks(0))
+
+    for chunksize in [1, 2, 100]:
+        for method in ['moments', 'quadratic']:
+            lc = tpf.to_lightcurve(centroid_method=method)
+            lc_chunked = tpf.to_lightcurve(centroid_method=method, chunksize=chunksize)
+            # Single-precision sums may differ in the last bit
+            for col in ['flux', 'flux_err', 'centroid_col', 'centroid_row']:
+                assert lc_chunked[col].unit == lc[col].unit
+                assert np.allclose(lc_chunked[col].value, lc[col].value, rtol=1e-6)
+        bkg = tpf.estimate_background()
+        bkg_chunked = tpf.estimate_background(chunksize=chunksize)
+        assert_array_equal(bkg_chunked.flux, bkg.flux)
+        col, row = tpf.estimate_centroids(aperture_mask='all', method='quadratic')
+        col_chunked, row_chunked = tpf.estimate_centroids(aperture_mask='all', method='quadratic',
+                                                          chunksize=chunksize)
+        assert_array_equal(col_chunked, col)
+        assert_array_equal(row_chunked, row)
@@ -7,7 +7,7 @@ from numpy.testing import assert_almost_equal, assert_array_equal
 from ..utils import KeplerQualityFlags, TessQualityFlags
 from ..utils import module_output_to_channel, channel_to_module_output
 from ..utils import LightkurveWarning
-from ..utils import running_mean, validate_method
+from ..utils import running_mean, running_median, running_biweight, validate_method
 from ..utils import bkjd_to_astropy_time, btjd_to_astropy_time
 from ..utils import centroid_quadratic
 from ..utils import show_citation_instructions
@@ -39,6 +39,47 @@ def test_running_mean():
     assert_almost_equal(running_mean([1, 2, 3], window_size=2), [1.5, 2.5])
     assert_almost_equal(running_mean([2, 2, 2], window_size=3), [2])
     assert_almost_equal(running_mean([3, 4, 5], window_size=20), [4])
+    # Several window sizes are computed from the same cumulative sum
+    means = running_mean([1, 2, 3, 4], window_size=[1, 3, 20])
+    assert len(means) == 3
+    assert_almost_equal(means[0], [1, 2, 3, 4])
+    assert_almost_equal(means[1], [2, 3])
+    assert_almost_equal(means[2], [2.5])
+
+
+def test_running_median():
+    assert_array_equal(running_median([0, 1, 2], [3, 1, 2], window_length=0.5), [3, 1, 2])
+    assert_array_equal(running_median([0, 1, 2, 3], [1, 5, 3, 2], window_length=2),
+                       [3, 3, 3, 2.5])
+    # The windows are defined in time, i.e. they do not extend across gaps
+    time = np.sort(np.random.uniform(0, 10, 300))
+    data = np.random.normal(size=len(time))
+    result = running_median(time, data, window_length=1.5)
+    for idx in [0, 100, 299]:
+        in_window = np.abs(time - time[idx]) <= 0.75
+        assert_almost_equal(result[idx], np.median(data[in_window]))
+    # NaN values are ignored
+    data[::3] = np.nan
+    result = running_median(time, data, window_length=1.5)
+    for idx in [0, 100, 299]:
+        in_window = np.abs(time - time[idx]) <= 0.75
+        assert_almost_equal(result[idx], np.nanmedian(data[in_window]))
+    assert_array_equal(running_median([0, 1, 2, 3], [np.nan, 1, np.nan, 2],
+                                      window_length=1), [np.nan, 1, np.nan, 2])
+
+
+def test_running_biweight():
+    from astropy.stats import biweight_location
+    assert_array_equal(running_biweight([0, 1, 2], [1, 1, 1], window_length=5), [1, 1, 1])
+    # The biweight location ignores outliers which shift the mean
+    time = np.arange(101, dtype=float)
+    data = np.random.normal(size=len(time))
+    data[50] = 1e3
+    result = running_biweight(time, data, window_length=1000)
+    assert np.all(np.abs(result) < 0.5)
+    # Without iterations, the biweight location equals that of AstroPy
+    result = running_biweight(time, data, window_length=1000, c=6., maxiters=1)
+    assert_almost_equal(result[0], biweight_location(data, c=6.))
 
 
 def test_quality_flag_decoding_kepler():
@@ -166,5 +207,107 @@ def test_centroid_quadratic_robustness():
     assert np.isfinite(col) & np.isfinite(row)
 
 
+def test_centroid_quadratic_cube():
+    """Does `centroid_quadratic` accept a cube of images?"""
+    data = np.random.RandomState(42).rand(50, 5, 6)
+    data[3, 2, 2] = np.nan
+    data[4] = np.nan
+    mask = np.ones((5, 6), dtype=bool)
+    mask[0, 0] = False
+    col, row = centroid_quadratic(data, mask=mask)
+    assert col.shape == row.shape == (50,)
+    for idx in [0, 1, 2, 3, 5, 49]:
+        assert (col[idx], row[idx]) == centroid_quadratic(data[idx], mask=mask)
+    # An all-NaN frame yields NaN
+    assert np.isnan(col[4]) & np.isnan(row[4])
+    # Images smaller than 3x3 are not supported
+    with pytest.raises(ValueError):
+        centroid_quadratic(np.ones((2, 5)))
+
+
 def test_show_citation_instructions():
     show_citation_instructions()
+
+
+@pytest.fixture
+def skybot_server(monkeypatch):
+    """Runs a local stand-in for the SkyBot service, which returns one object
+    for epochs larger than 2459000 and fails the first request with HTTP 503."""
+    import threading
+    from http.server import HTTPServer, BaseHTTPRequestHandler
+    from .. import utils
+
+    requests_received = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            requests_received.append(self.path)
+            if len(requests_received) == 1:
+                self.send_error(503)
+                return
+            epoch = float(self.path.split('EPOCH=')[1])
+            body = "# Flag: 1\n# Ticket: 1\n" \
+                   "# Num | Name | RA(h) | DE(deg) | Class | Mv | Err(arcsec) | d(arcsec)\n"
+            if epoch > 2459000:
+                body += "1 | Ceres | 1.0 | 2.0 | MB>Dwarf | 9.5 | 0.1 | 10.0\n"
+            else:
+                body = "# Flag: 0\n# Ticket: 1\nNo solar system object was found\n"
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain')
+            self.end_headers()
+            self.wfile.write(body.encode())
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(utils, '_SKYBOT_URL',
+                        'http://127.0.0.1:{}/skybot'.format(server.server_port))
+    yield requests_received
+    server.shutdown()
+    server.server_close()
+
+
+def test_query_solar_system_objects(skybot_server, tmpdir):
+    """Are SkyBot queries sent concurrently, retried, cached, and combined?"""
+    from astropy.config.paths import set_temp_cache
+    from ..utils import _query_solar_system_objects
+    times = [2458990., 2459001., 2459002., 2459003.]
+    with set_temp_cache(str(tmpdir)):
+        res = _query_solar_system_objects(ra=10., dec=20., times=times,
+                                          cache=True, max_workers=3)
+        assert list(res.columns) == ['Num', 'Name', 'Class', 'Mv', 'epoch']
+        assert_array_equal(res.index, [0, 1, 2])
+        assert_array_equal(res.epoch, times[1:])
+        assert res.Name.str.strip().tolist() == ['Ceres'] * 3
+        # One request per epoch, plus one retry of the failed request
+        assert len(skybot_server) == len(times) + 1
+        # The responses are now served from the cache
+        res2 = _query_solar_system_objects(ra=10., dec=20., times=times, cache=True)
+        assert res2.equals(res)
+        assert len(skybot_server) == len(times) + 1
+        # A different search radius is a different query
+        _query_solar_system_objects(ra=10., dec=20., times=times[:1],
+                                    radius=0.2, cache=True)
+        assert len(skybot_server) == len(times) + 2
+    # No objects found
+    assert _query_solar_system_objects(ra=10., dec=20., times=times[:1],
+                                       cache=False) is None
+
+
+def test_query_solar_system_objects_error(monkeypatch):
+    """Does a failed SkyBot request raise an IOError which chains the cause?"""
+    import socket
+    import requests
+    from .. import utils
+    # Find a local port on which no server is listening
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+    monkeypatch.setattr(utils, '_SKYBOT_URL', 'http://127.0.0.1:{}/skybot'.format(port))
+    with pytest.raises(IOError) as excinfo:
+        utils._query_solar_system_objects(ra=10., dec=20., times=[2459001.],
+                                          cache=False, max_retries=0)
+    assert isinstance(excinfo.value.__cause__, requests.exceptions.RequestException)
@@ -1,7 +1,10 @@
 """This module provides various helper functions."""
+import heapq
+import io
 import logging
 import sys
 import os
+import tempfile
 import warnings
 from functools import wraps
 
@@ -12,7 +15,7 @@ import pandas as pd
 from tqdm import tqdm
 
 import astropy
-from astropy.utils.data import download_file
+from astropy.utils.data import download_file, is_url_in_cache, import_file_to_cache
 from astropy.units.quantity import Quantity
 import astropy.units as u
 from astropy.visualization import (PercentileInterval, ImageNormalize,
@@ -327,13 +330,191 @@ def running_mean(data, window_size):
     ----------
     data : array of numbers
         The running mean will be computed on this data.
-    window_size : int
-        Window length used to compute the running mean.
+    window_size : int or list of int
+        Window length used to compute the running mean.  If a list is given,
+        the running means for all window lengths are computed from the same
+        cumulative sum, and a list of arrays is returned.
     """
-    if window_size > len(data):
-        window_size = len(data)
     cumsum = np.cumsum(np.insert(data, 0, 0))
-    return (cumsum[window_size:] - cumsum[:-window_size]) / float(window_size)
+    means = []
+    for size in np.atleast_1d(window_size).tolist():
+        size = min(size, len(data))
+        means.append((cumsum[size:] - cumsum[:-size]) / float(size))
+    if np.ndim(window_size) == 0:
+        return means[0]
+    return means
+
+
+def _window_bounds(time, window_length):
+    """Returns the index ranges of the time windows centered on each point.
+
+    The window of point ``i`` contains the points ``lo[i]:hi[i]``, i.e. all
+    points within ``window_length / 2`` of ``time[i]``.  ``time`` must be sorted.
+    """
+    time = np.asarray(time, dtype=float)
+    lo = np.searchsorted(time, time - window_length / 2., side='left')
+    hi = np.searchsorted(time, time + window_length / 2., side='right')
+    return lo, hi
+
+
+def running_median(time, data, window_length):
+    """Returns the median of `data` in a sliding time window.
+
+    The window is centered on each data point and contains all the points
+    within ``window_length / 2`` in time, such that gaps and irregular
+    sampling are accounted for.  NaN values are ignored; the result is NaN
+    where the window contains no finite values.
+
+    The window is kept as a max-heap holding its lower half and a min-heap
+    holding its upper half.  Points which leave the window are only removed
+    from a heap once they reach its top, and a heap is rebuilt whenever more
+    than half of its entries have left the window, such that this requires
+    O(N log w) operations for N data points and w points per window.
+
+    Parameters
+    ----------
+    time : array of numbers
+        Sorted time stamps of the data.
+    data : array of numbers
+        The running median will be computed on this data.
+    window_length : float
+        Duration of the window, in the same units as `time`.
+    """
+    lo, hi = _window_bounds(time, window_length)
+    values = np.asarray(data, dtype=float)
+    finite = np.isfinite(values).tolist()
+    values = values.tolist()
+    result = np.empty(len(values))
+    # Heap entries are (-value, index) for the lower half and (value, index)
+    # for the upper half; `in_low` records where every point was put, and
+    # `n_low`, `n_high` count the points of each half which are in the window.
+    low, high = [], []
+    in_low = [False] * len(values)
+    n_low, n_high = 0, 0
+    start, end = 0, 0
+
+    def prune(heap, n_live):
+        """Pops the entries which left the window from the top of ``heap``,
+        or rebuilds it if most of its entries left the window."""
+        if len(heap) > 2 * n_live + 16:
+            heap[:] = [entry for entry in heap if entry[1] >= start]
+            heapq.heapify(heap)
+        while heap and heap[0][1] < start:
+            heapq.heappop(heap)
+
+    for i, (lo_i, hi_i) in enumerate(zip(lo.tolist(), hi.tolist())):
+        while end < hi_i:
+            if finite[end]:
+                # Every value in `low` is smaller than or equal to every
+                # value in `high`, including values which left the window.
+                if low and values[end] <= -low[0][0]:
+                    heapq.heappush(low, (-values[end], end))
+                    in_low[end] = True
+                    n_low += 1
+                else:
+                    heapq.heappush(high, (values[end], end))
+                    n_high += 1
+            end += 1
+        while start < lo_i:
+            if finite[start]:
+                if in_low[start]:
+                    n_low -= 1
+                else:
+                    n_high -= 1
+            start += 1
+        prune(low, n_low)
+        prune(high, n_high)
+        # Rebalance, such that the lower half holds as many points as the
+        # upper half, or one more
+        while n_low > n_high + 1:
+            value, j = heapq.heappop(low)
+            heapq.heappush(high, (-value, j))
+            in_low[j] = False
+            n_low, n_high = n_low - 1, n_high + 1
+            prune(low, n_low)
+        while n_low < n_high:
+            value, j = heapq.heappop(high)
+            heapq.heappush(low, (-value, j))
+            in_low[j] = True
+            n_low, n_high = n_low + 1, n_high - 1
+            prune(high, n_high)
+        if n_low == 0:
+            result[i] = np.nan
+        elif n_low > n_high:
+            result[i] = -low[0][0]
+        else:
+            result[i] = 0.5 * (high[0][0] - low[0][0])
+    return result
+
+
+def running_biweight(time, data, window_length, c=5., maxiters=10, chunksize=2**16):
+    """Returns the biweight location of `data` in a sliding time window.
+
+    The windows are defined as in `running_median`.  The biweight location
+    is a robust estimate of the central value which, unlike the median,
+    makes use of all the data points that are not outliers.  It is found
+    iteratively, starting from the median of the window and using the median
+    absolute deviation (MAD) of the window as the scale.
+
+    Parameters
+    ----------
+    time : array of numbers
+        Sorted time stamps of the data.
+    data : array of numbers
+        The running biweight location will be computed on this data.
+        It should not contain NaN values.
+    window_length : float
+        Duration of the window, in the same units as `time`.
+    c : float
+        Tuning constant of the biweight; points further than ``c`` times
+        the MAD from the location are ignored.
+    maxiters : int
+        Maximum number of iterations used to refine the location.
+    chunksize : int
+        Approximate number of values processed at once; the windows of
+        many data points are processed together as a 2D array to make use
+        of vectorization.
+    """
+    lo, hi = _window_bounds(time, window_length)
+    data = np.asarray(data, dtype=float)
+    result = np.empty(len(data))
+    width = int((hi - lo).max()) if len(data) > 0 else 0
+    step = max(1, chunksize // max(width, 1))
+    offsets = np.arange(width)
+    for first in range(0, len(data), step):
+        lo_chunk, hi_chunk = lo[first:first + step], hi[first:first + step]
+        idx = lo_chunk[:, np.newaxis] + offsets
+        valid = idx < hi_chunk[:, np.newaxis]
+        # Pad the windows with `inf` such that they sort to the end of each row
+        windows = np.where(valid, data[np.minimum(idx, len(data) - 1)], np.inf)
+        windows.sort(axis=1)
+        count = hi_chunk - lo_chunk
+        rows = np.arange(len(count))
+        location = 0.5 * (windows[rows, (count - 1) // 2] + windows[rows, count // 2])
+        deviation = np.where(valid, np.abs(windows - location[:, np.newaxis]), np.inf)
+        deviation.sort(axis=1)
+        mad = 0.5 * (deviation[rows, (count - 1) // 2] + deviation[rows, count // 2])
+        # Refine the location of the windows which have not converged yet;
+        # if mad == 0, i.e. the window is (mostly) constant, keep the median
+        windows[~valid] = 0.
+        active = mad > 0
+        for _ in range(maxiters):
+            if not active.any():
+                break
+            d = windows[active] - location[active, np.newaxis]
+            # Biweight: (1 - u**2)**2 for |u| < 1 and 0 otherwise,
+            # computed in place to limit the number of temporary arrays
+            weight = d / (c * mad[active, np.newaxis])
+            weight **= 2
+            np.subtract(1., weight, out=weight)
+            np.maximum(weight, 0., out=weight)
+            weight **= 2
+            weight *= valid[active]
+            shift = np.einsum('ij,ij->i', d, weight) / weight.sum(axis=1)
+            location[active] += shift
+            active[active] = np.abs(shift) > 1e-6 * mad[active]
+        result[first:first + step] = location
+    return result
 
 
 def bkjd_to_astropy_time(bkjd) -> Time:
@@ -525,6 +706,24 @@ def validate_method(method, supported_methods):
                      "must be one of {}".format(method, supported_methods))
 
 
+# The design matrix (A) used by `centroid_quadratic` to fit the coefficients
+# of a bivariate quadratic to a 3x3 patch of pixels, as defined by Eqn 20 in
+# Vakili & Hogg (arxiv:1610.05873).  The design matrix contains a column of
+# ones followed by pixel coordinates: x, y, x**2, xy, y**2.
+_QUADRATIC_DESIGN_MATRIX = np.array([[1, -1, -1, 1,  1, 1],
+                                     [1,  0, -1, 0,  0, 1],
+                                     [1,  1, -1, 1, -1, 1],
+                                     [1, -1,  0, 1,  0, 0],
+                                     [1,  0,  0, 0,  0, 0],
+                                     [1,  1,  0, 1,  0, 0],
+                                     [1, -1,  1, 1, -1, 1],
+                                     [1,  0,  1, 0,  0, 1],
+                                     [1,  1,  1, 1,  1, 1]])
+# We also pre-compute $(A^t A)^-1 A^t$, cf. Eqn 21 in Vakili & Hogg.
+_QUADRATIC_APRIME = (np.linalg.inv(_QUADRATIC_DESIGN_MATRIX.T @ _QUADRATIC_DESIGN_MATRIX)
+                     @ _QUADRATIC_DESIGN_MATRIX.T)
+
+
 def centroid_quadratic(data, mask=None):
     """Computes the quadratic estimate of the centroid in a 2d-array.
 
@@ -543,78 +742,93 @@ def centroid_quadratic(data, mask=None):
 
     Parameters
     ----------
-    data : 2D array
+    data : 2D or 3D array
         The 2D input array representing the pixel values of the image.
+        Alternatively, a 3D array with shape (n_frames, n_rows, n_cols)
+        can be passed to compute the centroid of every frame at once.
     mask : array_like (bool), optional
-        A boolean mask, with the same shape as `data`, where a **True** value
-        indicates the corresponding element of data is masked.
+        A boolean mask, with the same shape as a single image in `data`,
+        where a **False** value indicates the corresponding element of data
+        is masked.
 
     Returns
     -------
     column, row : tuple
         The coordinates of the centroid in column and row.  If the fit failed,
-        then (NaN, NaN) will be returned.
+        then (NaN, NaN) will be returned.  If `data` is a 3D array, then
+        arrays containing the coordinates for each frame are returned.
     """
     if isinstance(data, u.Quantity):
         data = data.value
+    data = np.asarray(data)
+    if data.ndim == 2:
+        col, row = centroid_quadratic(data[np.newaxis], mask=mask)
+        return col[0], row[0]
+    n_frames, n_rows, n_cols = data.shape
+    if n_rows < 3 or n_cols < 3:
+        raise ValueError("quadratic centroids require images of at least "
+                         "3x3 pixels, but the data has shape {}x{}"
+                         "".format(n_rows, n_cols))
+
     # Step 1: identify the patch of 3x3 pixels (z_)
-    # that is centered on the brightest pixel (xx, yy)
+    # that is centered on the brightest pixel (xx, yy) in each frame
     if mask is not None:
         data = data * mask
-    arg_data_max = np.nanargmax(data)
-    yy, xx = np.unravel_index(arg_data_max, data.shape)
+    data = data.reshape(n_frames, n_rows * n_cols)
+    is_allnan = np.all(np.isnan(data), axis=1)
+    # `np.nanargmax` raises a ValueError for all-NaN frames; we will set
+    # the result for those frames to NaN below.
+    arg_data_max = np.nanargmax(np.where(is_allnan[:, np.newaxis], 0, data), axis=1)
+    yy, xx = np.unravel_index(arg_data_max, (n_rows, n_cols))
     # Make sure the 3x3 patch does not leave the TPF bounds
-    if yy < 1:
-        yy = 1
-    if xx < 1:
-        xx = 1
-    if yy > (data.shape[0] - 2):
-        yy = data.shape[0] - 2
-    if xx > (data.shape[1] - 2):
-        xx = data.shape[1] - 2
-
-    z_ = data[yy-1:yy+2, xx-1:xx+2]
-
-    # Next, we will fit the coefficients of the bivariate quadratic with the
-    # help of a design matrix (A) as defined by Eqn 20 in Vakili & Hogg
-    # (arxiv:1610.05873). The design matrix contains a
-    # column of ones followed by pixel coordinates: x, y, x**2, xy, y**2.
-    A = np.array([[1, -1, -1, 1,  1, 1],
-                  [1,  0, -1, 0,  0, 1],
-                  [1,  1, -1, 1, -1, 1],
-                  [1, -1,  0, 1,  0, 0],
-                  [1,  0,  0, 0,  0, 0],
-                  [1,  1,  0, 1,  0, 0],
-                  [1, -1,  1, 1, -1, 1],
-                  [1,  0,  1, 0,  0, 1],
-                  [1,  1,  1, 1,  1, 1]])
-    # We also pre-compute $(A^t A)^-1 A^t$, cf. Eqn 21 in Vakili & Hogg.
-    At = A.transpose()
-    # In Python 3 this can become `Aprime = np.linalg.inv(At @ A) @ At`
-    Aprime = np.matmul(np.linalg.inv(np.matmul(At, A)), At)
+    yy = np.clip(yy, 1, n_rows - 2)
+    xx = np.clip(xx, 1, n_cols - 2)
+
+    # The row-major pixel offsets of the patch match the rows of `A`
+    dy, dx = np.mgrid[-1:2, -1:2]
+    patch_idx = ((yy[:, np.newaxis] + dy.ravel()) * n_cols
+                 + (xx[:, np.newaxis] + dx.ravel()))
+    z_ = data[np.arange(n_frames)[:, np.newaxis], patch_idx]
 
     # Step 2: fit the polynomial $P = a + bx + cy + dx^2 + exy + fy^2$
-    # following Equation 21 in Vakili & Hogg.
-    # In Python 3 this can become `Aprime @ z_.flatten()`
-    a, b, c, d, e, f = np.matmul(Aprime, z_.flatten())
+    # following Equation 21 in Vakili & Hogg.  We use a stacked
+    # matrix-vector product, which yields results identical to fitting
+    # each frame individually.
+    a, b, c, d, e, f = np.matmul(_QUADRATIC_APRIME, z_[..., np.newaxis])[..., 0].T
 
     # Step 3: analytically find the function maximum,
     # following https://en.wikipedia.org/wiki/Quadratic_function
     det = 4 * d * f - e ** 2
-    if abs(det) < 1e-6:
-        return np.nan, np.nan  # No solution
-    xm = - (2 * f * b - c * e) / det
-    ym = - (2 * d * c - b * e) / det
-    return xx + xm, yy + ym
+    with warnings.catch_warnings():
+        # RuntimeWarnings may occur below if det contains zeros
+        warnings.simplefilter("ignore", RuntimeWarning)
+        xm = - (2 * f * b - c * e) / det
+        ym = - (2 * d * c - b * e) / det
+    no_solution = (np.abs(det) < 1e-6) | is_allnan
+    col = np.where(no_solution, np.nan, xx + xm)
+    row = np.where(no_solution, np.nan, yy + ym)
+    return col, row
+
+
+# Endpoint of the SkyBot cone search service; tests point this to a local server
+_SKYBOT_URL = 'http://vo.imcce.fr/webservices/skybot/skybotconesearch_query.php'
 
 
 def _query_solar_system_objects(ra, dec, times, radius=0.1, location='kepler',
-                                cache=True):
+                                cache=True, max_workers=4, max_retries=3):
     """Returns a list of asteroids/comets given a position and time.
 
     This function relies on The Virtual Observatory Sky Body Tracker (SkyBot)
     service which can be found at http://vo.imcce.fr/webservices/skybot/
 
+    One query is sent per epoch.  The queries are sent concurrently by a
+    bounded pool of ``max_workers`` threads which share one HTTP session,
+    such that connections are re-used.  Failed requests are retried up to
+    ``max_retries`` times.  If ``cache=True``, every response is stored in
+    the AstroPy download cache, keyed by the query URL (i.e. by the position,
+    epoch, radius, and location), such that repeated searches do not
+    contact the service again.
+
     Parameters
     ----------
     ra : float
@@ -629,6 +843,10 @@ def _query_solar_system_objects(ra, dec, times, radius=0.1, location='kepler',
         Spacecraft location. Options include `'kepler'` and `'tess'`.
     cache : bool
         Whether to cache the search result. Default is True.
+    max_workers : int
+        Maximum number of queries which are sent concurrently. Default is 4.
+    max_retries : int
+        Number of times a failed query is retried. Default is 3.
 
     Returns
     -------
@@ -636,39 +854,70 @@ def _query_solar_system_objects(ra, dec, times, radius=0.1, location='kepler',
         DataFrame containing the list of known solar system objects at the
         requested time and location.
     """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    from concurrent.futures import ThreadPoolExecutor
+
     if (location.lower() == 'kepler') or (location.lower() == 'k2'):
         location = 'C55'
     elif location.lower() == 'tess':
         location = 'C57'
 
-    url = 'http://vo.imcce.fr/webservices/skybot/skybotconesearch_query.php?'
+    url = _SKYBOT_URL + '?'
     url += '-mime=text&'
     url += '-ra={}&'.format(ra)
     url += '-dec={}&'.format(dec)
     url += '-bd={}&'.format(radius)
     url += '-loc={}&'.format(location)
 
-    df = None
-    times = np.atleast_1d(times)
-    for time in tqdm(times, desc='Querying for SSOs'):
+    session = requests.Session()
+    retries = Retry(total=max_retries, backoff_factor=0.5,
+                    status_forcelist=[429, 500, 502, 503, 504])
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_workers,
+                          max_retries=retries)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+
+    def query(time):
+        """Returns ``(url, response text, is_cached)`` for one epoch."""
         url_queried = url + 'EPOCH={}'.format(time)
-        response = download_file(url_queried, cache=cache)
-        if open(response).read(10) == '# Flag: -1':  # error code detected?
-            raise IOError("SkyBot Solar System query failed.\n"
-                          "URL used:\n" + url_queried + "\n"
-                          "Response received:\n" + open(response).read())
-        res = pd.read_csv(response, delimiter='|', skiprows=2)
-        if len(res) > 0:
-            res['epoch'] = time
-            res.rename({'# Num ':'Num', ' Name ':'Name', ' Class ':'Class', ' Mv ':'Mv'}, inplace=True, axis='columns')
-            res = res[['Num', 'Name', 'Class', 'Mv', 'epoch']].reset_index(drop=True)
-            if df is None:
-                df = res
-            else:
-                df = df.append(res)
-    if df is not None:
-        df.reset_index(drop=True)
-    return df
+        if cache and is_url_in_cache(url_queried):
+            with open(download_file(url_queried, cache=True)) as fh:
+                return url_queried, fh.read(), True
+        response = session.get(url_queried, timeout=60)
+        response.raise_for_status()
+        return url_queried, response.text, False
+
+    times = np.atleast_1d(times)
+    frames = []
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            responses = tqdm(executor.map(query, times), total=len(times),
+                             desc='Querying for SSOs')
+            for time, (url_queried, text, is_cached) in zip(times, responses):
+                if text.startswith('# Flag: -1'):  # error code detected?
+                    raise IOError("SkyBot Solar System query failed.\n"
+                                  "URL used:\n" + url_queried + "\n"
+                                  "Response received:\n" + text)
+                if cache and not is_cached:
+                    # The AstroPy cache is only written from the main thread
+                    with tempfile.NamedTemporaryFile('w', delete=False) as fh:
+                        fh.write(text)
+                    import_file_to_cache(url_queried, fh.name, remove_original=True)
+                res = pd.read_csv(io.StringIO(text), delimiter='|', skiprows=2)
+                if len(res) > 0:
+                    res['epoch'] = time
+                    res.rename({'# Num ':'Num', ' Name ':'Name', ' Class ':'Class', ' Mv ':'Mv'}, inplace=True, axis='columns')
+                    frames.append(res[['Num', 'Name', 'Class', 'Mv', 'epoch']])
+    except requests.exceptions.RequestException as exc:
+        raise IOError("SkyBot Solar System query failed: {}".format(exc)) from exc
+    finally:
+        session.close()
+
+    if len(frames) == 0:
+        return None
+    return pd.concat(frames, ignore_index=True)
 
 
 def show_citation_instructions():